@@ -0,0 +1,4 @@
+# Версия формата данных, которые возвращает export.get_issue_data. Увеличивается
+# при каждом изменении результата разбора, чтобы устаревшие записи кэша
+# (odtparser.cache) не использовались.
+PARSER_VERSION = "4"
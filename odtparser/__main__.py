@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Command line interface: python -m odtparser <command> [options]
+
+Commands:
+  export   export issues to JSON or JSON Lines files (odtparser.export)
+  inspect  print summary of issues: journal, dates, articles
+  batch    resumable export with checkpoint manifest (odtparser.batch)
+
+Modules of the commands are imported only when the command runs, so the
+start is fast. Options of a command are shown with
+python -m odtparser <command> --help.
+"""
+
+import argparse
+import json
+import sys
+
+
+def get_issue_summary(path_to_file) -> dict:
+    """
+    Returns summary of the issue: journal name, publication dates and
+    articles with their language, name, authors and pages
+    """
+
+    import odtparser.stream as stream
+
+    issue_fields = stream.get_issue_fields(path_to_file)
+
+    articles = []
+    for citation_info in issue_fields["article_citation_info_list"]:
+        article_lang = citation_info["article_lang"]
+        info = citation_info[article_lang]
+        articles.append({
+            "article_lang": article_lang,
+            "article_name": info[f"article_name_{article_lang}"],
+            "authors": info[f"authors_{article_lang}"],
+            "pages_range": info["pages_range"],
+        })
+
+    return {
+        "file": str(path_to_file),
+        "journal_name": issue_fields["journal_name"],
+        "issue_pub_dates": issue_fields["issue_pub_dates"],
+        "through_issue_number": issue_fields["through_issue_number"],
+        "number_of_articles": issue_fields["number_of_articles"],
+        "articles": articles,
+    }
+
+
+def format_issue_summary(summary: dict) -> str:
+    journal_name = summary["journal_name"]
+    pub_dates = summary["issue_pub_dates"].get("ru", {})
+
+    lines = [
+        summary["file"],
+        "  {0} / {1}".format(journal_name.get("journal_name_ru", ""),
+                             journal_name.get("journal_name_en", "")),
+        "  Том {0}, выпуск {1}, {2} {3}, сквозной номер {4}".format(
+            pub_dates.get("volume_ru", ""), pub_dates.get("issue_ru", ""),
+            pub_dates.get("month_ru", ""), pub_dates.get("year_ru", ""),
+            summary["through_issue_number"]),
+        "  Статей: {0}".format(summary["number_of_articles"]),
+    ]
+
+    for i, article in enumerate(summary["articles"], 1):
+        lines.append("  {0:3}. [{1}] {2} - {3} (С. {4})".format(
+            i, article["article_lang"], article["authors"],
+            article["article_name"], article["pages_range"]))
+
+    return "\n".join(lines)
+
+
+def inspect_main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m odtparser inspect",
+        description="Prints summary of issues from odt files")
+    arg_parser.add_argument("files", nargs="+", help="odt files of issues")
+    arg_parser.add_argument("--json", action="store_true",
+                            help="print summaries as JSON")
+    args = arg_parser.parse_args(argv)
+
+    status = 0
+    summaries = []
+
+    for path_to_file in args.files:
+        try:
+            summary = get_issue_summary(path_to_file)
+        except Exception as error:
+            print(f"Ошибка в файле {path_to_file}: {error!r}",
+                  file=sys.stderr)
+            status = 1
+            continue
+
+        if args.json:
+            summaries.append(summary)
+        else:
+            print(format_issue_summary(summary))
+
+    if args.json:
+        print(json.dumps(summaries, ensure_ascii=False, indent=2))
+
+    return status
+
+
+def export_main(argv=None):
+    import odtparser.export as export
+
+    return export.main(argv, prog="python -m odtparser export")
+
+
+def batch_main(argv=None):
+    import odtparser.batch as batch
+
+    return batch.main(argv, prog="python -m odtparser batch")
+
+
+COMMANDS = {
+    "export": export_main,
+    "inspect": inspect_main,
+    "batch": batch_main,
+}
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m odtparser",
+        description="Parser of journal issue layouts (odt files)")
+    arg_parser.add_argument("command", choices=sorted(COMMANDS))
+    arg_parser.add_argument("args", nargs=argparse.REMAINDER,
+                            help="options of the command")
+    args = arg_parser.parse_args(argv)
+
+    return COMMANDS[args.command](args.args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
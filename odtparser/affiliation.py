@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tokenizer of affiliation blocks. Each author of the block is written as
+"workplace e-mail ORCID [SPIN]". The tokenizer finds e-mails by "@" and reads
+the ORCID and SPIN anchors after them in one left-to-right scan, so time is
+linear in the length of the block. The result is the same as of re.findall
+with the former AUTHOR_DATA_REGEX, which backtracked quadratically on long
+blocks without a valid e-mail (see tests/test_affiliation.py).
+"""
+
+import re
+import string
+
+ASCII_ALNUM = string.ascii_letters + string.digits
+CYRILLIC_LETTERS = ("".join(map(chr, range(ord("а"), ord("я") + 1)))
+                    + "".join(map(chr, range(ord("А"), ord("Я") + 1)))
+                    + "ёЁ")
+# Символы места работы (кроме пробельных), локальной части и домена e-mail
+WORKPLACE_CHARS = frozenset(ASCII_ALNUM + CYRILLIC_LETTERS + "&,().«»-;'")
+EMAIL_LOCAL_CHARS = frozenset(ASCII_ALNUM + ".!#$%&'*+/=?^_`{|}~-")
+EMAIL_DOMAIN_CHARS = frozenset(ASCII_ALNUM + ".-")
+ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Якоря после e-mail. ORCID обязателен: за ним должен идти пробел
+ORCID_REGEX = re.compile(r"(https://orcid.org[/\dX\-]+"
+                         r"|ORCID:\snot\savailable|ORCID:\sотсутствует)\s")
+SPIN_REGEX = re.compile(r"SPIN-код:\s\d\d\d\d-\d\d\d\d"
+                        r"|SPIN-код:\sотсутствует")
+
+
+def is_word_char(char: str) -> bool:
+    # Как \w регулярных выражений
+    return char.isalnum() or char == "_"
+
+
+def is_workplace_char(char: str) -> bool:
+    return char in WORKPLACE_CHARS or char.isspace()
+
+
+def _email_end(text: str, at: int) -> int:
+    """
+    Returns end of the e-mail domain after "@" at position at, if the domain
+    ends with a top level domain and is followed by a space, or -1
+    """
+
+    end = at + 1
+    while end < len(text) and text[end] in EMAIL_DOMAIN_CHARS:
+        end += 1
+
+    dot = text.rfind(".", at + 1, end)
+
+    if (dot < at + 2 or end - dot - 1 < 2 or end == len(text)
+            or not text[end].isspace()):
+        return -1
+
+    if not all(text[i] in ASCII_LETTERS for i in range(dot + 1, end)):
+        return -1
+
+    return end
+
+
+def _email_start(text: str, start: int, at: int) -> tuple:
+    """
+    Returns tuple (workplace start, e-mail start) for the e-mail with "@" at
+    position at or None. Workplace begins not before start and is not
+    empty.
+    """
+
+    local_start = at
+    while (local_start > start + 1
+           and text[local_start - 1] in EMAIL_LOCAL_CHARS):
+        local_start -= 1
+
+    # Последний символ перед локальной частью, который не может входить в
+    # место работы
+    last_stop = local_start - 1
+    while last_stop >= start and is_workplace_char(text[last_stop]):
+        last_stop -= 1
+
+    for email_start in range(local_start, at):
+        if email_start > local_start and not is_workplace_char(
+                text[email_start - 1]):
+            last_stop = email_start - 1
+
+        if (is_word_char(text[email_start - 1])
+                == is_word_char(text[email_start])):
+            continue
+
+        workplace_start = max(start, last_stop + 1)
+
+        if workplace_start < email_start:
+            return (workplace_start, email_start)
+
+    return None
+
+
+def find_author_data(text: str) -> list:
+    """
+    Returns list of tuples (workplace, email, orcid, spin) of authors in
+    affiliation text. Missing SPIN is an empty string.
+    """
+
+    authors = []
+    start = 0
+    at = text.find("@")
+
+    while at != -1:
+        email_end = _email_end(text, at)
+        orcid_match = None
+        bounds = None
+
+        if email_end != -1:
+            anchor = email_end
+            while anchor < len(text) and text[anchor].isspace():
+                anchor += 1
+
+            orcid_match = ORCID_REGEX.match(text, anchor)
+
+        if orcid_match is not None:
+            bounds = _email_start(text, start, at)
+
+        if bounds is None:
+            at = text.find("@", at + 1)
+            continue
+
+        workplace_start, email_start = bounds
+        end = orcid_match.end()
+        spin = ""
+
+        spin_match = SPIN_REGEX.match(text, end)
+        if spin_match is not None:
+            spin = spin_match.group()
+            end = spin_match.end()
+
+        authors.append((text[workplace_start:email_start],
+                        text[email_start:email_end], orcid_match.group(1),
+                        spin))
+
+        start = end
+        at = text.find("@", start)
+
+    return authors
@@ -1,6 +1,241 @@
 #!/usr/bin/env python3
 #  -*- coding: utf-8 -*-
 
+"""
+Compact records of parsed issues: Issue, Article, Author, Affiliation and
+Reference. Fields are stored in __slots__, so a record takes several times
+less memory than a dictionary with the same data. to_dict() returns the
+dictionaries of export.get_issue_data.
+"""
 
-class Article(object):
-    pass
+import functools
+import re
+import sys
+
+ITALIC_TAG_REGEX = re.compile(r"(</?i>)")
+
+# Число ссылок, текст которых хранится после разбора: больше, чем ссылок
+# в одном выпуске, так что text, italic и to_dict разбирают HTML один раз
+REFERENCE_PARTS_CACHE_SIZE = 4096
+
+
+class Record:
+    """
+    Base of records. keys are the dictionary keys of the fields in order of
+    __slots__. Values of interned fields repeat in many records (names of
+    journals, rubrics, months), so they are stored once with sys.intern.
+    """
+
+    __slots__ = ()
+    keys = ()
+    interned = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            value = fields.pop(name, None)
+
+            if name in self.interned and isinstance(value, str):
+                value = sys.intern(value)
+
+            setattr(self, name, value)
+
+        if fields:
+            raise TypeError("Unknown fields of {0}: {1}".format(
+                type(self).__name__, ", ".join(fields)))
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, name)
+                for name, key in zip(self.__slots__, self.keys)}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(**{name: data.get(key)
+                      for name, key in zip(cls.__slots__, cls.keys)})
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    # Поля записей изменяемы, поэтому записи не хешируются
+    __hash__ = None
+
+    def __repr__(self):
+        return "{0}({1})".format(type(self).__name__, ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__))
+
+
+class Issue(Record):
+
+    __slots__ = ("journal_name_ru", "journal_name_en", "through_issue_number",
+                 "volume_ru", "volume_en", "issue_number_ru",
+                 "issue_number_en", "issue_month_ru", "issue_month_en",
+                 "year_ru", "year_en")
+    keys = __slots__
+    interned = __slots__
+
+
+class Affiliation(Record):
+    """
+    Author data from the affiliation table of an article in one language
+    """
+
+    __slots__ = ("workplace", "email", "orcid", "spin")
+    keys = __slots__
+    interned = ("workplace",)
+
+
+@functools.lru_cache(maxsize=REFERENCE_PARTS_CACHE_SIZE)
+def get_reference_parts(html: str) -> tuple:
+    """
+    Returns tuple (text, italic spans) of reference paragraph in HTML format.
+    Italic spans are tuples (start, end) of text positions.
+    """
+
+    text = []
+    italic = []
+    length = 0
+    start = None
+
+    for part in ITALIC_TAG_REGEX.split(html[len("<p>"):-len("</p>")]):
+        if part == "<i>":
+            start = length
+        elif part == "</i>":
+            if start is not None and length > start:
+                italic.append((start, length))
+            start = None
+        else:
+            text.append(part)
+            length += len(part)
+
+    return ("".join(text), tuple(italic))
+
+
+class Reference(Record):
+    """
+    Item of a references list: paragraph in HTML format (see
+    odtparser.references). Only HTML is stored; text and italic spans are
+    parsed from it on access, recently parsed references are cached (see
+    get_reference_parts).
+    """
+
+    __slots__ = ("html",)
+    keys = __slots__
+
+    @property
+    def text(self) -> str:
+        return get_reference_parts(self.html)[0]
+
+    @property
+    def italic(self) -> tuple:
+        return get_reference_parts(self.html)[1]
+
+    def to_dict(self) -> dict:
+        text, italic = get_reference_parts(self.html)
+        return {"html": self.html, "text": text, "italic": italic}
+
+
+class Author(Record):
+
+    __slots__ = ("short_name_ru", "short_name_en", "full_name_ru",
+                 "full_name_en", "workplace_ru", "workplace_en", "email_ru",
+                 "email_en", "orcid_ru", "orcid_en", "spin")
+    keys = tuple("author_" + name for name in __slots__)
+    interned = ("workplace_ru", "workplace_en")
+
+
+def get_references_html(references) -> str:
+    """
+    Returns references list in HTML format, a paragraph per line
+    """
+
+    return "".join(reference.html + "\n" for reference in references)
+
+
+def get_references(references_html: str) -> tuple:
+    """
+    Returns Reference records of references list in HTML format
+    """
+
+    return tuple(Reference(html=html)
+                 for html in references_html.split("\n") if html)
+
+
+class Article(Record):
+
+    __slots__ = ("lang", "name_ru", "name_en", "rubric_ru", "rubric_en",
+                 "abstract_ru", "abstract_en", "date_received_ru",
+                 "date_received_en", "date_revised_ru", "date_revised_en",
+                 "date_accepted_ru", "date_accepted_en", "date_available_ru",
+                 "date_available_en", "reg_number", "udk", "jel_ru",
+                 "jel_en", "keywords_ru", "keywords_en", "pages_range_ru",
+                 "pages_range_en", "authors", "full_text", "references_ru",
+                 "references_en")
+    keys = ("article_lang", "article_name_ru", "article_name_en",
+            "article_rubric_ru", "article_rubric_en", "article_astract_ru",
+            "article_astract_en", "article_date_received_ru",
+            "article_date_received_en", "article_date_revised_ru",
+            "article_date_revised_en", "article_date_accepted_ru",
+            "article_date_accepted_en", "article_date_available_ru",
+            "article_date_available_en", "article_reg_number",
+            "article_udk", "article_jel_ru", "article_jel_en",
+            "article_keywords_ru", "article_keywords_en",
+            "article_pages_range_ru", "article_pages_range_en",
+            "article_authors", "article_full_text",
+            "article_references_ru_list", "article_references_en_list")
+    interned = ("lang", "rubric_ru", "rubric_en")
+
+    # Ключи, которых нет в словаре англоязычной статьи
+    EN_OMITTED_KEYS = ("article_reg_number", "article_udk",
+                       "article_pages_range_ru", "article_pages_range_en")
+
+    def to_dict(self) -> dict:
+        article = super().to_dict()
+
+        article["article_authors"] = [author.to_dict()
+                                      for author in self.authors]
+        article["article_references_ru_list"] = get_references_html(
+            self.references_ru)
+        article["article_references_en_list"] = get_references_html(
+            self.references_en)
+
+        if self.lang == "en":
+            for key in self.EN_OMITTED_KEYS:
+                del article[key]
+
+        return article
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        article = super().from_dict(data)
+
+        article.authors = tuple(Author.from_dict(author)
+                                for author in data["article_authors"])
+        article.references_ru = get_references(
+            data["article_references_ru_list"])
+        article.references_en = get_references(
+            data["article_references_en_list"])
+
+        return article
+
+
+def records_from_issue_data(issue_data: dict) -> tuple:
+    """
+    Returns tuple (Issue, list of Article) of issue data in the format of
+    export.get_issue_data
+    """
+
+    return (Issue.from_dict(issue_data["issue_info"]),
+            [Article.from_dict(article)
+             for article in issue_data["articles_info"]])
+
+
+def issue_data_from_records(issue: Issue, articles) -> dict:
+    """
+    Returns issue data in the format of export.get_issue_data
+    """
+
+    return {"issue_info": issue.to_dict(),
+            "articles_info": [article.to_dict() for article in articles]}
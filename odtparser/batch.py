@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Resumable batch export. Progress is saved to a manifest after every file,
+so a rerun after a crash or a layout fix processes only failed and changed
+files. Output JSON file is named after the input file. Example:
+python -m odtparser.batch -m fc_manifest.json -j 4 ./odtparser/test_odt/FC-*.odt
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import traceback
+
+import odtparser.cache as odt_cache
+import odtparser.export as export
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def get_file_hash(path_to_file, chunk_size=1 << 20) -> str:
+    """
+    Returns sha256 hash of file content
+    """
+
+    file_hash = hashlib.sha256()
+
+    with open(path_to_file, "rb") as odt_file:
+        for chunk in iter(lambda: odt_file.read(chunk_size), b""):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
+
+
+def write_json_atomic(data, path, indent=4):
+    """
+    Writes data to temporary file and renames it, so path contains either
+    old or new data, never a partially written file
+    """
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as write_file:
+            json.dump(data, write_file, indent=indent, ensure_ascii=False)
+    except BaseException:
+        # Временного файла нет, если его не удалось открыть
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, path)
+
+
+def get_output_name(path_to_file) -> str:
+    return os.path.splitext(os.path.basename(path_to_file))[0]
+
+
+def get_output_path(path_to_file, output_dir="") -> str:
+    """
+    Returns path of JSON file of the input file in output_dir
+    """
+
+    return os.path.abspath(os.path.join(
+        output_dir, f"{get_output_name(path_to_file)}.json"))
+
+
+def get_batch_result(path_to_file, output_dir="", cache=None):
+    """
+    Worker function. Exports issue with export.export_issue and returns
+    tuple (output path, error).
+    """
+
+    try:
+        export.export_issue(path_to_file, output_dir, cache=cache,
+                            output_name=get_output_name(path_to_file))
+    except Exception:
+        return (None, traceback.format_exc())
+
+    return (get_output_path(path_to_file, output_dir), None)
+
+
+class Manifest:
+    """
+    Manifest of batch run. Input files are keyed by content hash, every
+    entry contains path, status ("done" or "failed"), output file and error.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as manifest_file:
+                self.entries = json.load(manifest_file)["files"]
+
+    def get(self, file_hash):
+        return self.entries.get(file_hash)
+
+    def is_done(self, file_hash) -> bool:
+        """
+        True if file with this content was exported and output still exists
+        """
+
+        entry = self.entries.get(file_hash)
+
+        return (entry is not None and entry["status"] == STATUS_DONE
+                and os.path.isfile(entry["output"]))
+
+    def record(self, file_hash, path, status, output=None, error=None):
+        """
+        Records result of file processing and saves manifest. Entries of
+        the previous content of the same file are removed.
+        """
+
+        path = os.path.abspath(path)
+
+        for old_hash in [old_hash for old_hash, entry in self.entries.items()
+                         if entry["path"] == path and old_hash != file_hash]:
+            del self.entries[old_hash]
+
+        self.entries[file_hash] = {
+            "path": path,
+            "status": status,
+            "output": output,
+            "error": error,
+        }
+
+        self.save()
+
+    def save(self):
+        write_json_atomic({"files": self.entries}, self.path, indent=2)
+
+
+def run_batch(list_of_files, manifest_path, output_dir="", workers=1,
+              force=False, cache=None) -> dict:
+    """
+    Exports issues from list_of_files to JSON files in output_dir skipping
+    files, which are already done according to the manifest (unless force
+    is set). Input files with the same name would overwrite the output of
+    the first one, so they fail. Parsed issues are taken from cache
+    (odtparser.cache.IssueCache) if given. Returns dictionary with lists of
+    paths: done, failed, skipped.
+    """
+
+    manifest = Manifest(manifest_path)
+    summary = {STATUS_DONE: [], STATUS_FAILED: [], "skipped": []}
+
+    file_hashes = {}
+    for odt_file in list_of_files:
+        try:
+            file_hashes[odt_file] = get_file_hash(odt_file)
+        except OSError:
+            # Без содержимого файла нет ключа для манифеста
+            print(f"Ошибка в файле {odt_file}:\n{traceback.format_exc()}",
+                  file=sys.stderr)
+            summary[STATUS_FAILED].append(odt_file)
+
+    files_to_process = []
+    # Входные файлы по выходным
+    output_files = {}
+    for odt_file, file_hash in file_hashes.items():
+        output = get_output_path(odt_file, output_dir)
+
+        if output in output_files:
+            error = (f"Выходной файл {output} совпадает с выходным файлом"
+                     f" {output_files[output]}")
+            print(f"Ошибка в файле {odt_file}:\n{error}", file=sys.stderr)
+            manifest.record(file_hash, odt_file, STATUS_FAILED, error=error)
+            summary[STATUS_FAILED].append(odt_file)
+            continue
+
+        output_files[output] = odt_file
+
+        if not force and manifest.is_done(file_hash):
+            summary["skipped"].append(odt_file)
+        else:
+            files_to_process.append(odt_file)
+
+    for odt_file, output, error in export.iter_file_results(
+            get_batch_result, files_to_process, workers, output_dir, cache):
+        if error is None:
+            manifest.record(file_hashes[odt_file], odt_file, STATUS_DONE,
+                            output=output)
+            summary[STATUS_DONE].append(odt_file)
+        else:
+            print(f"Ошибка в файле {odt_file}:\n{error}", file=sys.stderr)
+            manifest.record(file_hashes[odt_file], odt_file, STATUS_FAILED,
+                            error=error)
+            summary[STATUS_FAILED].append(odt_file)
+
+    return summary
+
+
+def main(argv=None, prog=None):
+    arg_parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Resumable export of issues data to JSON files")
+    arg_parser.add_argument("files", nargs="+", help="odt files of issues")
+    arg_parser.add_argument("-m", "--manifest", default="manifest.json",
+                            help="manifest file (default: manifest.json)")
+    arg_parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="number of worker processes, 0 - number of CPUs (default: 1)")
+    arg_parser.add_argument("-o", "--output-dir", default="",
+                            help="directory for JSON files")
+    arg_parser.add_argument("-f", "--force", action="store_true",
+                            help="process files, which are already done")
+    arg_parser.add_argument("--cache-dir",
+                            help="directory of parsed issues cache")
+    arg_parser.add_argument(
+        "--cache-size", type=int, default=odt_cache.DEFAULT_MAX_SIZE,
+        help="max size of the cache in bytes")
+    args = arg_parser.parse_args(argv)
+
+    cache = None
+    if args.cache_dir:
+        cache = odt_cache.IssueCache(args.cache_dir, args.cache_size)
+
+    summary = run_batch(args.files, args.manifest,
+                        output_dir=args.output_dir,
+                        workers=args.workers or None, force=args.force,
+                        cache=cache)
+
+    print(f"Обработано: {len(summary[STATUS_DONE])}, "
+          f"пропущено: {len(summary['skipped'])}, "
+          f"с ошибками: {len(summary[STATUS_FAILED])}")
+
+    return 1 if summary[STATUS_FAILED] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
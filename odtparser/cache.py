@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Content-addressed on-disk cache of parsed issues. Key is a hash of
+content.xml, styles.xml, parser version and the journals registry, so
+changed layouts, journal data files and new parser versions never get
+stale data. Values are zlib-compressed pickles.
+Least recently used entries are removed when the cache exceeds its size.
+Example:
+python -m odtparser.cache stats
+python -m odtparser.cache purge
+"""
+
+import argparse
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import pickle
+import sys
+import zlib
+
+from odtparser import PARSER_VERSION
+from odtparser.journals import REGISTRY
+from odtparser.odtfile import OdtFile, CONTENT_XML, STYLES_XML
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache",
+                                 "odtparser")
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024  # bytes
+
+ENTRY_SUFFIX = ".cache"
+STATS_FILE = "stats.json"
+STATS_LOCK_FILE = "stats.lock"
+KEY_CHUNK_SIZE = 64 * 1024  # bytes
+
+
+def get_issue_key(path_to_file, parser_version=PARSER_VERSION,
+                  registry=None) -> str:
+    """
+    Returns cache key of ODT file: sha256 of content.xml, styles.xml,
+    parser version and fingerprint of the journals registry (REGISTRY by
+    default)
+    """
+
+    registry = registry or REGISTRY
+    key = hashlib.sha256()
+
+    # Длина отделяет части друг от друга
+    with OdtFile(path_to_file) as file:
+        for name in (CONTENT_XML, STYLES_XML):
+            size = file.odt_file_as_zip.getinfo(name).file_size
+            key.update(str(size).encode("ascii") + b":")
+
+            # Части архива хешируются по блокам, не читаясь целиком
+            with file.open_member(name) as member:
+                for chunk in iter(lambda: member.read(KEY_CHUNK_SIZE), b""):
+                    key.update(chunk)
+
+    for data in (parser_version.encode("utf-8"),
+                 registry.fingerprint().encode("ascii")):
+        key.update(str(len(data)).encode("ascii") + b":")
+        key.update(data)
+
+    return key.hexdigest()
+
+
+class IssueCache:
+    """
+    Cache of get_issue_data results in cache_dir limited by max_size bytes.
+    Hits and misses are counted in memory and added to the stats of the
+    cache directory by flush() or close().
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.counters = {"hits": 0, "misses": 0}
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+        return False
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key + ENTRY_SUFFIX)
+
+    def _entries(self):
+        """
+        Returns list of tuples (last use time, size, path) of cache entries
+        """
+
+        entries = []
+
+        with os.scandir(self.cache_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except FileNotFoundError:
+                    # Удалена другим процессом
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+
+        return entries
+
+    def get(self, key):
+        """
+        Returns cached value or None
+        """
+
+        path = self._entry_path(key)
+
+        try:
+            with open(path, "rb") as entry_file:
+                value = pickle.loads(zlib.decompress(entry_file.read()))
+        except (OSError, ValueError, zlib.error, pickle.UnpicklingError,
+                EOFError):
+            self.counters["misses"] += 1
+            return None
+
+        # Время изменения файла служит временем последнего использования
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.counters["hits"] += 1
+
+        return value
+
+    def put(self, key, value):
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as entry_file:
+                entry_file.write(zlib.compress(
+                    pickle.dumps(value, protocol=4)))
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns cached value or computes it with compute() and caches it
+        """
+
+        value = self.get(key)
+
+        if value is None:
+            value = compute()
+            self.put(key, value)
+
+        return value
+
+    def evict(self):
+        """
+        Removes least recently used entries until cache fits max_size
+        """
+
+        entries = sorted(self._entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def purge(self) -> int:
+        """
+        Removes all entries and stats. Returns number of removed entries.
+        """
+
+        entries = self._entries()
+
+        for _, _, path in entries:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+        try:
+            os.remove(os.path.join(self.cache_dir, STATS_FILE))
+        except FileNotFoundError:
+            pass
+
+        return len(entries)
+
+    def _read_counters(self) -> dict:
+        try:
+            with open(os.path.join(self.cache_dir, STATS_FILE),
+                      encoding="utf-8") as stats_file:
+                return json.load(stats_file)
+        except (OSError, ValueError):
+            return {"hits": 0, "misses": 0}
+
+    def add_counters(self, counters: dict):
+        for counter, value in counters.items():
+            self.counters[counter] += value
+
+    def take_counters(self) -> dict:
+        """
+        Returns counters counted since the last call or flush and resets
+        them
+        """
+
+        counters = self.counters
+        self.counters = dict.fromkeys(counters, 0)
+
+        return counters
+
+    def flush(self):
+        """
+        Adds counters to the stats of the cache directory and resets them
+        """
+
+        counters = self.take_counters()
+        if not any(counters.values()):
+            return
+
+        path = os.path.join(self.cache_dir, STATS_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        # Процессы пакетной обработки обновляют счетчики по очереди, иначе
+        # приращения теряются
+        with open(os.path.join(self.cache_dir, STATS_LOCK_FILE),
+                  "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            stored_counters = self._read_counters()
+            for counter, value in counters.items():
+                stored_counters[counter] = (stored_counters.get(counter, 0)
+                                            + value)
+
+            with open(tmp_path, "w", encoding="utf-8") as stats_file:
+                json.dump(stored_counters, stats_file)
+            os.replace(tmp_path, path)
+
+    def close(self):
+        self.flush()
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        counters = self._read_counters()
+
+        return {
+            "cache_dir": self.cache_dir,
+            "parser_version": PARSER_VERSION,
+            "entries": len(entries),
+            "size": sum(entry_size for _, entry_size, _ in entries),
+            "max_size": self.max_size,
+            "hits": counters.get("hits", 0) + self.counters["hits"],
+            "misses": counters.get("misses", 0) + self.counters["misses"],
+        }
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Cache of parsed issues")
+    arg_parser.add_argument("command", choices=["stats", "purge"])
+    arg_parser.add_argument("-d", "--cache-dir", default=DEFAULT_CACHE_DIR,
+                            help=f"cache directory (default: "
+                                 f"{DEFAULT_CACHE_DIR})")
+    args = arg_parser.parse_args(argv)
+
+    cache = IssueCache(args.cache_dir)
+
+    if args.command == "stats":
+        print(json.dumps(cache.stats(), indent=4, ensure_ascii=False))
+    else:
+        print(f"Удалено записей: {cache.purge()}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,34 +2,44 @@
 # -*- coding: utf-8 -*-
 
 """
-Exports data from one file in param. Example: python -m odtparser.export ./odtparser/test_odt/ia.odt 
+Exports data from files in params. Example: python -m odtparser.export ./odtparser/test_odt/ia.odt 
+Files are parsed in parallel with -j option: python -m odtparser.export -j 8 ./odtparser/test_odt/*.odt
 """
 
-from odtparser.journals_info import MONTHS_EN_LIST, RUBRICS_DICT, JOURNAL_ABBRVS
-import odtparser.odtparser as odt
+from odtparser.journals import JOURNALS_FILE_ENV, REGISTRY
+from odtparser.article import Article, Author, Issue
+import odtparser.cache as odt_cache
+import odtparser.instrument as instrument
+import odtparser.jsonl as jsonl
+import odtparser.stream as stream
+import argparse
+import contextlib
+import hashlib
+import itertools
 import os
 import sys
 import re
 import json
 import pickle
+import traceback
+
+# Префикс имён выходных файлов export_issues до переименования по журналу
+PENDING_OUTPUT_PREFIX = ".pending-"
+
+EN_DATE_REGEX = re.compile(r"(\d+)\s+([a-zA-Z]+)\s+(\d+)")
 
 def get_ru_rubric_from_en_rubric(en_rubric):
-    ru_rubric = ""
-    for k, v in RUBRICS_DICT.items():
-        if v == en_rubric:
-            ru_rubric = k
-    return ru_rubric
+    return REGISTRY.rubric_ru(en_rubric)
 
 def get_ru_date_from_en_date(en_date):
 
     ru_fulldate = ""
-    en_date_regex = re.compile(r"(\d+)\s+([a-zA-Z]+)\s+(\d+)")
 
-    date_list = en_date_regex.fullmatch(en_date)
+    date_list = EN_DATE_REGEX.fullmatch(en_date)
 
     if date_list != None:
         ru_date = date_list.group(1).rjust(2, "0")
-        ru_month = int(MONTHS_EN_LIST.index(str.lower(date_list.group(2)))) + 1
+        ru_month = REGISTRY.month_number(date_list.group(2))
         ru_month_str = str(ru_month).rjust(2, "0")
         ru_year = date_list.group(3)
         ru_fulldate = f"{ru_date}.{ru_month_str}.{ru_year}"
@@ -61,257 +71,712 @@ def get_full_path_to_file(path_to_file):
     return full_path_to_file
 
 
-def get_issue_data(path_to_file):
+def get_author(short_name_ru, short_name_en, full_name_ru, full_name_en,
+               affiliation_ru, affiliation_en, spin) -> Author:
+    """
+    Returns Author record from names and affiliations (odtparser.article.
+    Affiliation) of the author in both languages
+    """
 
-    issue_data = {"issue_info": {}, "articles_info": []}
+    orcid_ru = affiliation_ru.orcid
+    orcid_en = affiliation_en.orcid
 
-    full_path_to_file = get_full_path_to_file(path_to_file)
+    if re.search("отсутствует", orcid_ru):
+        orcid_ru = None
+
+    if re.search("available", orcid_en):
+        orcid_en = None
+
+    return Author(
+        short_name_ru=str.strip(short_name_ru),
+        short_name_en=str.strip(short_name_en),
+        full_name_ru=str.strip(full_name_ru),
+        full_name_en=str.strip(full_name_en),
+        workplace_ru=str.strip(affiliation_ru.workplace),
+        workplace_en=str.strip(affiliation_en.workplace),
+        email_ru=str.strip(affiliation_ru.email),
+        email_en=str.strip(affiliation_en.email),
+        orcid_ru=orcid_ru,
+        orcid_en=orcid_en,
+        spin=spin)
+
+
+def get_article_data(article_fields) -> Article:
+    """
+    Returns Article record with info of the article from its fields (see
+    odtparser.odtparser.ARTICLE_FIELDS)
+    """
+
+    article_rubric = article_fields["article_rubrics"]
+    article_citation_info = article_fields["citation_info"]
+    article_abstract = article_fields["article_abstracts"]
+    article_full_text = article_fields["article_full_texts"]
+    article_full_author_names = article_fields["full_author_names"]
+    article_affiliation_info = article_fields["affiliation_info"]
+    article_info = article_fields["article_info"]
+    article_references = article_fields["article_references"]
+
+    if article_citation_info['article_lang'] == "ru":
+
+        # Авторский блок
+
+        authors_list = []
+
+        authors_short_names_ru_list = str.split(
+            article_citation_info["ru"]["authors_ru"], ",")
+        authors_short_names_en_list = str.split(
+            article_citation_info["en"]["authors_en"], ",")
+
+        authors_full_names_ru_list = article_full_author_names["ru"]
+        authors_full_names_en_list = article_full_author_names["en"]
+        authors_affiliation_ru_list = article_affiliation_info["ru"]
+        authors_affiliation_en_list = article_affiliation_info["en"]
+
+        for j in range(len(authors_short_names_ru_list)):
 
-    odt_file = odt.OdtParser(full_path_to_file)
+            author_spin = authors_affiliation_ru_list[j].spin
 
-    journal_name = odt_file.get_journal_name()
-    issue_pub_dates = odt_file.get_issue_pub_dates_dict()
-    through_issue_number = odt_file.get_through_issue_number()
-    number_of_articles = odt_file.get_number_of_articles_in_issue()
-    article_rubrics_list = odt_file.get_article_rubrics_list()
-    article_citiation_info_list = odt_file.get_citation_paragraphs_list()
-    article_abstracts_list = odt_file.get_article_abstracts_list()
-    article_full_texts_list = odt_file.get_article_full_texts_list()
-    article_full_author_names_list = odt_file.get_full_author_names_list()
-    article_affiliation_info_list = odt_file.get_affiliation_info_list()
-    article_info_list = odt_file.get_article_info_list()
-    article_references_list = odt_file.get_article_references_list()
+            if re.search("отсутствует", author_spin):
+                author_spin = None
+            else:
+                author_spin = re.sub(
+                    r"SPIN-код:\s+([\-\d]+)", r"\1", author_spin)
+
+            authors_list.append(get_author(
+                authors_short_names_ru_list[j],
+                authors_short_names_en_list[j],
+                authors_full_names_ru_list[j],
+                authors_full_names_en_list[j],
+                authors_affiliation_ru_list[j],
+                authors_affiliation_en_list[j],
+                author_spin))
+
+        # Авторский блок - КОНЕЦ
+
+        article_reg_number = None
+
+        if article_info["ru"]["reg_number"] != "":
+            article_reg_number = re.sub(
+            r"^(.*?)\d", r"", article_info["ru"]["reg_number"])
+
+        return Article(
+            lang="ru",
+            name_ru=article_citation_info["ru"]["article_name_ru"],
+            name_en=article_citation_info["en"]["article_name_en"],
+            rubric_ru=article_rubric["ru"],
+            rubric_en=article_rubric["en"],
+            abstract_ru=article_abstract["ru"],
+            abstract_en=article_abstract["en"],
+            date_received_ru=article_info["ru"]["received_date_ru"],
+            date_received_en=article_info["en"]["received_date_en"],
+            date_revised_ru=article_info["ru"]["revised_date_ru"],
+            date_revised_en=article_info["en"]["revised_date_en"],
+            date_accepted_ru=article_info["ru"]["accepted_date_ru"],
+            date_accepted_en=article_info["en"]["accepted_date_en"],
+            date_available_ru=article_info["ru"]["available_date_ru"],
+            date_available_en=article_info["en"]["available_date_en"],
+            reg_number=article_reg_number,
+            udk=article_info["ru"]["UDK"],
+            jel_ru=article_info["ru"]["JEL"],
+            jel_en=article_info["en"]["JEL"],
+            keywords_ru=article_info["ru"]["keywords_ru"],
+            keywords_en=article_info["en"]["keywords_en"],
+            pages_range_ru=article_citation_info["ru"]["pages_range"],
+            pages_range_en=article_citation_info["en"]["pages_range"],
+            authors=tuple(authors_list),
+            full_text=article_full_text["ru"],
+            references_ru=article_references["ru"],
+            references_en=article_references["en"])
+
+    authors_list = []
+
+    authors_short_names_en_list = str.split(
+        article_citation_info["en"]["authors_en"], ",")
+    authors_full_names_en_list = article_full_author_names["en"]
+    authors_affiliation_en_list = article_affiliation_info["en"]
+
+    for j, author_short_name_en in enumerate(authors_short_names_en_list):
+        authors_list.append(get_author(
+            author_short_name_en,
+            author_short_name_en,
+            authors_full_names_en_list[j],
+            authors_full_names_en_list[j],
+            authors_affiliation_en_list[j],
+            authors_affiliation_en_list[j],
+            None))
+
+    article_date_received_ru =  get_ru_date_from_en_date(article_info["en"]["received_date_en"])
+    article_date_revised_ru =  get_ru_date_from_en_date(article_info["en"]["revised_date_en"])
+    article_date_accepted_ru =  get_ru_date_from_en_date(article_info["en"]["accepted_date_en"])
+    article_date_available_ru =  get_ru_date_from_en_date(article_info["en"]["available_date_en"])
+
+    # Регистрационного номера и УДК у англоязычной статьи нет, диапазон
+    # страниц хранится, но не экспортируется (см. Article.to_dict)
+    return Article(
+        lang="en",
+        name_ru=article_citation_info["en"]["article_name_en"],
+        name_en=article_citation_info["en"]["article_name_en"],
+        rubric_ru=get_ru_rubric_from_en_rubric(article_rubric["en"]),
+        rubric_en=article_rubric["en"],
+        abstract_ru=article_abstract["en"],
+        abstract_en=article_abstract["en"],
+        date_received_ru=article_date_received_ru,
+        date_received_en=article_info["en"]["received_date_en"],
+        date_revised_ru=article_date_revised_ru,
+        date_revised_en=article_info["en"]["revised_date_en"],
+        date_accepted_ru=article_date_accepted_ru,
+        date_accepted_en=article_info["en"]["accepted_date_en"],
+        date_available_ru=article_date_available_ru,
+        date_available_en=article_info["en"]["available_date_en"],
+        jel_ru=article_info["en"]["JEL"],
+        jel_en=article_info["en"]["JEL"],
+        keywords_ru=article_info["en"]["keywords_en"],
+        keywords_en=article_info["en"]["keywords_en"],
+        pages_range_ru=article_citation_info["en"]["pages_range"],
+        pages_range_en=article_citation_info["en"]["pages_range"],
+        authors=tuple(authors_list),
+        full_text=article_full_text["en"],
+        references_ru=article_references["en"],
+        references_en=article_references["en"])
+
+
+def iter_issue_records(path_to_file):
+    """
+    Generator of issue records. Yields ("issue", Issue) first, then
+    ("article", Article) for every article (see odtparser.article).
+    Articles are read from the document one by one (see
+    stream.iter_issue_articles), so memory does not grow with the number
+    of articles.
+    """
+
+    full_path_to_file = get_full_path_to_file(path_to_file)
 
-    # TEST
-    # print(article_info_list)
-    # TEST
+    # All fields are gathered in one pass over content.xml
+    articles = stream.iter_issue_articles(full_path_to_file)
 
+    with instrument.stage("get_issue_fields"):
+        issue_fields = next(articles)
+
+    journal_name = issue_fields["journal_name"]
+    issue_pub_dates = issue_fields["issue_pub_dates"]
+    through_issue_number = issue_fields["through_issue_number"]
 
     # --- Gathering the information about journal issue ---
 
-    issue_dict = {
-        "journal_name_ru": journal_name["journal_name_ru"],
-        "journal_name_en": journal_name["journal_name_en"],
-        "through_issue_number": through_issue_number,
-        "volume_ru": issue_pub_dates["ru"]["volume_ru"],
-        "volume_en": issue_pub_dates["en"]["volume_en"],
-        "issue_number_ru": issue_pub_dates["ru"]["issue_ru"],
-        "issue_number_en": issue_pub_dates["en"]["issue_en"],
-        "issue_month_ru": issue_pub_dates["ru"]["month_ru"],
-        "issue_month_en": issue_pub_dates["en"]["month_en"],
-        "year_ru": issue_pub_dates["ru"]["year_ru"],
-        "year_en": issue_pub_dates["en"]["year_en"]
-    }
+    issue = Issue(
+        journal_name_ru=journal_name["journal_name_ru"],
+        journal_name_en=journal_name["journal_name_en"],
+        through_issue_number=through_issue_number,
+        volume_ru=issue_pub_dates["ru"]["volume_ru"],
+        volume_en=issue_pub_dates["en"]["volume_en"],
+        issue_number_ru=issue_pub_dates["ru"]["issue_ru"],
+        issue_number_en=issue_pub_dates["en"]["issue_en"],
+        issue_month_ru=issue_pub_dates["ru"]["month_ru"],
+        issue_month_en=issue_pub_dates["en"]["month_en"],
+        year_ru=issue_pub_dates["ru"]["year_ru"],
+        year_en=issue_pub_dates["en"]["year_en"])
+
+    yield ("issue", issue)
 
     # --- Gathering the information about articles ---
-    for i in range(number_of_articles):
-
-        article = {}
-
-        if article_citiation_info_list[i]['article_lang'] == "ru":
-
-            # Авторский блок
-
-            authors_list = []
-
-            authors_short_names_ru_list = str.split(
-                article_citiation_info_list[i]["ru"]["authors_ru"], ",")
-            authors_short_names_en_list = str.split(
-                article_citiation_info_list[i]["en"]["authors_en"], ",")
-
-            authors_full_names_ru_list = article_full_author_names_list[i]["ru"]
-            authors_full_names_en_list = article_full_author_names_list[i]["en"]
-            authors_affiliation_ru_list = article_affiliation_info_list[i]["ru"]
-            authors_affiliation_en_list = article_affiliation_info_list[i]["en"]
-
-            for j in range(len(authors_short_names_ru_list)):
-
-                author_orcid_ru = authors_affiliation_ru_list[j]["orcid"]
-                author_orcid_en = authors_affiliation_en_list[j]["orcid"]
-                author_spin = authors_affiliation_ru_list[j]["spin"]
-
-                if re.search("отсутствует", author_orcid_ru):
-                    author_orcid_ru = None
-
-                if re.search("available", author_orcid_en):
-                    author_orcid_en = None
-
-                if re.search("отсутствует", author_spin):
-                    author_spin = None
-                else:
-                    author_spin = re.sub(
-                        r"SPIN-код:\s+([\-\d]+)", r"\1", author_spin)
-
-                authors_dict = {
-                    "author_short_name_ru": str.strip(authors_short_names_ru_list[j]),
-                    "author_short_name_en": str.strip(authors_short_names_en_list[j]),
-                    "author_full_name_ru": str.strip(authors_full_names_ru_list[j]),
-                    "author_full_name_en": str.strip(authors_full_names_en_list[j]),
-                    "author_workplace_ru": str.strip(authors_affiliation_ru_list[j]["workplace"]),
-                    "author_workplace_en": str.strip(authors_affiliation_en_list[j]["workplace"]),
-                    "author_email_ru": str.strip(authors_affiliation_ru_list[j]["email"]),
-                    "author_email_en": str.strip(authors_affiliation_en_list[j]["email"]),
-                    "author_orcid_ru": author_orcid_ru,
-                    "author_orcid_en": author_orcid_en,
-                    "author_spin": author_spin
-                }
-
-                authors_list.append(authors_dict)
-
-
-            # Авторский блок - КОНЕЦ
-
-            article_reg_number = None
-
-            if article_info_list[i]["ru"]["reg_number"] != "":
-                article_reg_number = re.sub(
-                r"^(.*?)\d", r"", article_info_list[i]["ru"]["reg_number"])
-
-            article = {
-                "article_lang": "ru",
-                "article_name_ru": article_citiation_info_list[i]["ru"]["article_name_ru"],
-                "article_name_en": article_citiation_info_list[i]["en"]["article_name_en"],
-                "article_rubric_ru": article_rubrics_list[i]["ru"],
-                "article_rubric_en": article_rubrics_list[i]["en"],
-                "article_astract_ru": article_abstracts_list[i]["ru"],
-                "article_astract_en": article_abstracts_list[i]["en"],
-                "article_date_received_ru": article_info_list[i]["ru"]["received_date_ru"],
-                "article_date_received_en": article_info_list[i]["en"]["received_date_en"],
-                "article_date_revised_ru": article_info_list[i]["ru"]["revised_date_ru"],
-                "article_date_revised_en": article_info_list[i]["en"]["revised_date_en"],
-                "article_date_accepted_ru": article_info_list[i]["ru"]["accepted_date_ru"],
-                "article_date_accepted_en": article_info_list[i]["en"]["accepted_date_en"],
-                "article_date_available_ru": article_info_list[i]["ru"]["available_date_ru"],
-                "article_date_available_en": article_info_list[i]["en"]["available_date_en"],
-                "article_reg_number": article_reg_number,
-                "article_udk": article_info_list[i]["ru"]["UDK"],
-                "article_jel_ru": article_info_list[i]["ru"]["JEL"],
-                "article_jel_en": article_info_list[i]["en"]["JEL"],
-                "article_keywords_ru": article_info_list[i]["ru"]["keywords_ru"],
-                "article_keywords_en": article_info_list[i]["en"]["keywords_en"],
-                "article_pages_range_ru": article_citiation_info_list[i]["ru"]["pages_range"],
-                "article_pages_range_en": article_citiation_info_list[i]["en"]["pages_range"],
-
-                "article_authors": authors_list,
-
-                "article_full_text": article_full_texts_list[i]["ru"],
-                "article_references_ru_list": article_references_list[i]["ru"],
-                "article_references_en_list": article_references_list[i]["en"]
-            }
-
-        elif article_citiation_info_list[i]['article_lang'] == "en":
-
-            authors_list = []
-
-            authors_short_names_ru_list = str.split(
-                article_citiation_info_list[i]["en"]["authors_en"], ",")
-            authors_short_names_en_list = str.split(
-                article_citiation_info_list[i]["en"]["authors_en"], ",")
-            authors_full_names_ru_list = article_full_author_names_list[i]["en"]
-            authors_full_names_en_list = article_full_author_names_list[i]["en"]
-            authors_affiliation_ru_list = article_affiliation_info_list[i]["en"]
-            authors_affiliation_en_list = article_affiliation_info_list[i]["en"]
-
-            for j, author_short_name_en in enumerate(authors_short_names_en_list):
-
-                author_orcid_ru = authors_affiliation_en_list[j]["orcid"]
-                author_orcid_en = authors_affiliation_en_list[j]["orcid"]
-                author_spin = None
+    while True:
+        with instrument.stage("stream"):
+            article_fields = next(articles, None)
+
+        if article_fields is None:
+            break
+
+        yield ("article", get_article_data(article_fields))
+
 
-                if re.search("отсутствует", author_orcid_ru):
-                    author_orcid_ru = None
-
-                if re.search("available", author_orcid_en):
-                    author_orcid_en = None
-
-                author_dict = {
-                    "author_short_name_ru": str.strip(author_short_name_en),
-                    "author_short_name_en": str.strip(authors_short_names_en_list[j]),
-                    "author_full_name_ru": str.strip(authors_full_names_en_list[j]),
-                    "author_full_name_en": str.strip(authors_full_names_en_list[j]),
-                    "author_workplace_ru": str.strip(authors_affiliation_en_list[j]["workplace"]),
-                    "author_workplace_en": str.strip(authors_affiliation_en_list[j]["workplace"]),
-                    "author_email_ru": str.strip(authors_affiliation_en_list[j]["email"]),
-                    "author_email_en": str.strip(authors_affiliation_en_list[j]["email"]),
-                    "author_orcid_ru": author_orcid_ru,
-                    "author_orcid_en": author_orcid_en,
-                    "author_spin": author_spin
-                }
-
-                authors_list.append(author_dict)
-
-            article_reg_number = None
-
-            if article_info_list[i]["en"]["reg_number"] != "":
-                article_reg_number = re.sub(
-                r"^(.*?)\d", r"", article_info_list[i]["en"]["reg_number"])
-
-            article_date_received_ru =  get_ru_date_from_en_date(article_info_list[i]["en"]["received_date_en"])
-            article_date_revised_ru =  get_ru_date_from_en_date(article_info_list[i]["en"]["revised_date_en"])
-            article_date_accepted_ru =  get_ru_date_from_en_date(article_info_list[i]["en"]["accepted_date_en"])
-            article_date_available_ru =  get_ru_date_from_en_date(article_info_list[i]["en"]["available_date_en"])
-
-            article = {
-                "article_lang": "en",
-                "article_name_ru": article_citiation_info_list[i]["en"]["article_name_en"],
-                "article_name_en": article_citiation_info_list[i]["en"]["article_name_en"],
-                "article_rubric_ru": get_ru_rubric_from_en_rubric(article_rubrics_list[i]["en"]),
-                "article_rubric_en": article_rubrics_list[i]["en"],
-                "article_astract_ru": article_abstracts_list[i]["en"],
-                "article_astract_en": article_abstracts_list[i]["en"],
-                "article_date_received_ru": article_date_received_ru,
-                "article_date_received_en": article_info_list[i]["en"]["received_date_en"],
-                "article_date_revised_ru": article_date_revised_ru,
-                "article_date_revised_en": article_info_list[i]["en"]["revised_date_en"],
-                "article_date_accepted_ru": article_date_accepted_ru,
-                "article_date_accepted_en": article_info_list[i]["en"]["accepted_date_en"],
-                "article_date_available_ru": article_date_available_ru,
-                "article_date_available_en": article_info_list[i]["en"]["available_date_en"],
-                # "article_reg_number": article_reg_number,
-                # "article_udk": None,
-                "article_jel_ru": article_info_list[i]["en"]["JEL"],
-                "article_jel_en": article_info_list[i]["en"]["JEL"],
-                "article_keywords_ru": article_info_list[i]["en"]["keywords_en"],
-                "article_keywords_en": article_info_list[i]["en"]["keywords_en"],
-
-                "article_authors": authors_list,
-
-                "article_full_text": article_full_texts_list[i]["en"],
-                "article_references_ru_list": article_references_list[i]["en"],
-                "article_references_en_list": article_references_list[i]["en"]
-            }
-
-
-        issue_data["issue_info"] = issue_dict
+def get_issue_data(path_to_file, cache=None):
+    """
+    Returns dictionary with issue info and list of articles info. If cache
+    (odtparser.cache.IssueCache) is given, result is taken from it or cached.
+    """
+
+    if cache is not None:
+        full_path_to_file = get_full_path_to_file(path_to_file)
+        return cache.get_or_compute(
+            odt_cache.get_issue_key(full_path_to_file),
+            lambda: get_issue_data(full_path_to_file))
+
+    issue_data = {"issue_info": {}, "articles_info": []}
+
+    records = iter_record_dicts(iter_issue_records(path_to_file))
+    _, issue_data["issue_info"] = next(records)
+
+    for _, article in records:
         issue_data["articles_info"].append(article)
 
     return issue_data
 
-def write_issue_info_to_json(issue_data, journal_acronym):
-    with open(f"{journal_acronym}.json", "a+", encoding="utf-8") as write_file:
-        json.dump(issue_data, write_file, indent=4, ensure_ascii=False)
 
+def get_issue_records(path_to_file) -> tuple:
+    """
+    Returns tuple (Issue, list of Article) of the issue. Records take
+    several times less memory than dictionaries of get_issue_data, so they
+    suit holding many issues at once.
+    """
 
-json_data = []
+    records = iter_issue_records(path_to_file)
+    _, issue = next(records)
 
-if len(sys.argv) > 1:
-    list_of_files = sys.argv[1:]
+    return (issue, [article for _, article in records])
 
-    for odt_file in list_of_files:
-        print(f"Получаем данные из файла {odt_file}")
-        issue_data = get_issue_data(odt_file)
 
-        journal_name = issue_data["issue_info"]["journal_name_ru"]
+def iter_record_dicts(records):
+    """
+    Yields records of iter_issue_records with data converted to
+    dictionaries of get_issue_data
+    """
+
+    for kind, record in records:
+        yield (kind, record.to_dict())
+
+def get_journal_acronym(issue_data):
+    """
+    Returns issue file name without extension. Example: fc-2019-3
+    """
+
+    journal_name = issue_data["issue_info"]["journal_name_ru"]
+
+    journal_abbr = REGISTRY.journal(journal_name).abbrv
+    issue_year = issue_data["issue_info"]["year_ru"]
+    issue_number = issue_data["issue_info"]["issue_number_ru"]
+
+    return f"{journal_abbr}-{issue_year}-{issue_number}"
+
+
+def iter_issue_json(records):
+    """
+    Yields parts of issue data JSON from records of iter_record_dicts.
+    Articles are serialized one by one, output is the same as of
+    json.dump(issue_data, indent=4, ensure_ascii=False).
+    """
+
+    records = iter(records)
+    _, issue_info = next(records)
+
+    yield ('{\n    "issue_info": '
+           + json.dumps(issue_info, indent=4,
+                        ensure_ascii=False).replace("\n", "\n    ")
+           + ',\n    "articles_info": [')
+
+    number_of_articles = 0
+
+    for _, article in records:
+        yield ",\n        " if number_of_articles else "\n        "
+        yield json.dumps(article, indent=4,
+                         ensure_ascii=False).replace("\n", "\n        ")
+        number_of_articles += 1
+
+    yield "\n    ]\n}" if number_of_articles else "]\n}"
+
+
+def write_issue_records_to_json(records, path):
+    """
+    Writes records of iter_record_dicts to JSON file. The file is written
+    to a temporary file and renamed on completion.
+    """
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as write_file:
+            for part in iter_issue_json(records):
+                write_file.write(part)
+    except BaseException:
+        # Временного файла нет, если его не удалось открыть
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, path)
+
+
+def write_issue_info_to_json(issue_data, journal_acronym, output_dir=""):
+    path = os.path.join(output_dir, f"{journal_acronym}.json")
+    write_issue_records_to_json(iter_issue_data_records(issue_data), path)
+
+
+def iter_issue_data_records(issue_data):
+    """
+    Yields records of issue data in the format of iter_record_dicts
+    """
+
+    yield ("issue", issue_data["issue_info"])
+
+    for article in issue_data["articles_info"]:
+        yield ("article", article)
+
+
+def write_issue_info_to_jsonl(issue_data, journal_acronym, output_dir="",
+                              compress=False):
+    """
+    Writes issue data to JSON Lines file (see odtparser.jsonl), gzip
+    compressed if compress is set
+    """
 
-        journal_abbr = JOURNAL_ABBRVS[journal_name]
-        issue_year = issue_data["issue_info"]["year_ru"]
-        issue_number = issue_data["issue_info"]["issue_number_ru"]
+    path = os.path.join(output_dir, f"{journal_acronym}{jsonl.JSONL_SUFFIX}")
+    if compress:
+        path += jsonl.GZIP_SUFFIX
 
-        journal_acronym = f"{journal_abbr}-{issue_year}-{issue_number}"
-        write_issue_info_to_json(issue_data, journal_acronym)
+    jsonl.write_issue_records(iter_issue_data_records(issue_data), path)
 
 
-else:
-    print("Searching all odt files in directory...")
+def get_instrumented_issue_data(path_to_file, cache=None, report_dir="",
+                                cprofile=False):
+    """
+    Returns issue data and writes instrumentation report of the file
+    (<name>.report.json, see odtparser.instrument) to report_dir. If
+    cprofile is set, cProfile stats are dumped to <name>.prof.
+    """
+
+    name = os.path.splitext(os.path.basename(path_to_file))[0]
+    profile = None
+    recorder = None
+    error = True
+
+    if cprofile:
+        import cProfile
+        profile = cProfile.Profile()
+
+    try:
+        with instrument.instrumented(file=str(path_to_file)) as recorder:
+            if profile is not None:
+                profile.enable()
+
+            try:
+                issue_data = get_issue_data(path_to_file, cache)
+            finally:
+                if profile is not None:
+                    profile.disable()
+
+        error = False
+
+        return issue_data
+    finally:
+        # Отчет записывается и для файла, который не удалось разобрать
+        if recorder is not None:
+            recorder.info["error"] = error
+            report_path = os.path.join(report_dir, f"{name}.report.json")
+            with open(report_path, "w", encoding="utf-8") as report_file:
+                json.dump(recorder.report(), report_file, indent=2)
+
+        if profile is not None:
+            profile.dump_stats(os.path.join(report_dir, f"{name}.prof"))
+
+
+def get_issue_result(path_to_file, cache=None, report_dir=None,
+                     cprofile=False):
+    """
+    Worker function. Returns tuple (issue data, error). One malformed layout
+    must not stop the other files, so parser errors are returned as error
+    text. If report_dir is given, the file is parsed with instrumentation.
+    """
+
+    try:
+        if report_dir is not None:
+            return (get_instrumented_issue_data(path_to_file, cache,
+                                                report_dir, cprofile), None)
+
+        return (get_issue_data(path_to_file, cache), None)
+    except Exception:
+        return (None, traceback.format_exc())
+
+
+def export_issue(path_to_file, output_dir="", output_format="json",
+                 compress=False, cache=None, report_dir=None,
+                 cprofile=False, output_name=None) -> str:
+    """
+    Exports issue to JSON or JSON Lines file in output_dir (see
+    export_issues) and returns journal acronym. The file is named
+    output_name or the journal acronym. Articles are written as soon as
+    they are read from the document, unless the issue is taken from cache
+    or parsed with instrumentation.
+    """
+
+    if report_dir is not None:
+        records = iter_issue_data_records(get_instrumented_issue_data(
+            path_to_file, cache, report_dir, cprofile))
+    elif cache is not None:
+        records = iter_issue_data_records(get_issue_data(path_to_file,
+                                                         cache))
+    else:
+        records = iter_record_dicts(iter_issue_records(path_to_file))
+
+    issue_record = next(records)
+    journal_acronym = get_journal_acronym({"issue_info": issue_record[1]})
+    records = itertools.chain([issue_record], records)
+
+    if output_name is None:
+        output_name = journal_acronym
+
+    path = get_output_file_path(output_name, output_dir, output_format,
+                                compress)
+    if output_format == "jsonl":
+        jsonl.write_issue_records(records, path)
+    else:
+        write_issue_records_to_json(records, path)
+
+    return journal_acronym
+
+
+def get_output_file_path(output_name, output_dir="", output_format="json",
+                         compress=False) -> str:
+    if output_format == "jsonl":
+        path = os.path.join(output_dir, f"{output_name}{jsonl.JSONL_SUFFIX}")
+        if compress:
+            path += jsonl.GZIP_SUFFIX
+
+        return path
+
+    return os.path.join(output_dir, f"{output_name}.json")
+
+
+def get_pending_output_name(path_to_file) -> str:
+    """
+    Returns name of the output file of path_to_file in export_issues until
+    it is renamed after the journal acronym
+    """
+
+    path_hash = hashlib.sha1(os.fsencode(os.path.abspath(path_to_file)))
+
+    return f"{PENDING_OUTPUT_PREFIX}{path_hash.hexdigest()}"
+
+
+def get_export_result(path_to_file, output_dir="", output_format="json",
+                      compress=False, cache=None, report_dir=None,
+                      cprofile=False):
+    """
+    Worker function. Returns tuple (journal acronym, error) of export_issue.
+    The file is named get_pending_output_name(path_to_file).
+    """
+
+    try:
+        return (export_issue(path_to_file, output_dir, output_format,
+                             compress, cache, report_dir, cprofile,
+                             get_pending_output_name(path_to_file)), None)
+    except Exception:
+        return (None, traceback.format_exc())
+
+
+def call_worker(worker, path_to_file, *args) -> tuple:
+    """
+    Returns tuple (result of worker(path to file, *args), list of counters
+    of IssueCache arguments). Caches are copied into pool processes, so
+    their counters are returned to the caller with the result.
+    """
+
+    caches = [arg for arg in args if isinstance(arg, odt_cache.IssueCache)]
+
+    # Копия кэша приходит со счётчиками вызывающего процесса
+    for cache in caches:
+        cache.take_counters()
+
+    result = worker(path_to_file, *args)
+
+    return result, [cache.take_counters() for cache in caches]
+
+
+def iter_file_results(worker, list_of_files, workers=None, *args):
+    """
+    Calls worker(path to file, *args) for list_of_files using pool of
+    worker processes (os.cpu_count() by default) and yields tuples (path to
+    file, *result of worker) in order of list_of_files. Result is yielded
+    as soon as the file and all files before it are processed, so output
+    is the same for any number of workers. worker returns tuple (value,
+    error). Counters of IssueCache arguments are flushed once, after the
+    last file.
+    """
+
+    caches = [arg for arg in args if isinstance(arg, odt_cache.IssueCache)]
+
+    try:
+        yield from _iter_file_results(worker, list_of_files, workers,
+                                      caches, args)
+    finally:
+        for cache in caches:
+            cache.flush()
+
+
+def _iter_file_results(worker, list_of_files, workers, caches, args):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        for odt_file in list_of_files:
+            print(f"Получаем данные из файла {odt_file}")
+            yield (odt_file, *worker(odt_file, *args))
+
+        return
+
+    # Пул процессов загружает multiprocessing, поэтому импортируется только
+    # для параллельного разбора
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for i, odt_file in enumerate(list_of_files):
+            print(f"Получаем данные из файла {odt_file}")
+            futures[executor.submit(call_worker, worker, odt_file,
+                                    *args)] = i
+
+        # Results of files, which are processed before previous files
+        pending = {}
+        next_index = 0
+
+        for future in as_completed(futures):
+            try:
+                result, counters = future.result()
+            except BrokenProcessPool:
+                result = (None, traceback.format_exc())
+            else:
+                for cache, cache_counters in zip(caches, counters):
+                    cache.add_counters(cache_counters)
+
+            pending[futures[future]] = result
+
+            while next_index in pending:
+                yield (list_of_files[next_index], *pending.pop(next_index))
+                next_index += 1
+
+
+def iter_issue_results(list_of_files, workers=None, cache=None,
+                       report_dir=None, cprofile=False):
+    """
+    Parses list_of_files using pool of worker processes (see
+    iter_file_results) and yields tuples (path to file, issue data, error)
+    in order of list_of_files. If cache (odtparser.cache.IssueCache) is
+    given, issues are taken from it. report_dir and cprofile are passed to
+    get_issue_result.
+    """
+
+    return iter_file_results(get_issue_result, list_of_files, workers,
+                             cache, report_dir, cprofile)
+
+
+def export_issues(list_of_files, workers=None, output_dir="", cache=None,
+                  output_format="json", compress=False, report_dir=None,
+                  cprofile=False):
+    """
+    Exports issues data from list_of_files to JSON (output_format="json")
+    or JSON Lines (output_format="jsonl", gzip compressed if compress is set)
+    files in output_dir using pool of worker processes (see
+    iter_file_results). Each worker writes its files, articles are
+    written one by one (see export_issue). Files are named after journal
+    acronyms, a file with the same output file as a previous one in
+    list_of_files fails.
+
+    If report_dir is given, instrumentation reports (and cProfile stats
+    if cprofile is set) of the files are written there.
+
+    Returns list of tuples (path to file, journal acronym, error) in order
+    of list_of_files. Journal acronym is None for failed files.
+    """
 
-# write_json_to_file(json_data)
+    results = []
+    # Выходные файлы и входные файлы, из которых они получены
+    output_files = {}
+
+    for path_to_file, journal_acronym, error in iter_file_results(
+            get_export_result, list_of_files, workers, output_dir,
+            output_format, compress, cache, report_dir, cprofile):
+        if error is None:
+            # Имя выходного файла известно только после разбора, поэтому
+            # файл переименовывается в порядке list_of_files
+            pending_path = get_output_file_path(
+                get_pending_output_name(path_to_file), output_dir,
+                output_format, compress)
+            output = get_output_file_path(journal_acronym, output_dir,
+                                          output_format, compress)
+
+            if output in output_files:
+                error = (f"Выходной файл {output} совпадает с выходным"
+                         f" файлом {output_files[output]}")
+                journal_acronym = None
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(pending_path)
+            else:
+                output_files[output] = path_to_file
+                os.replace(pending_path, output)
+
+        if error is not None:
+            print(f"Ошибка в файле {path_to_file}:\n{error}", file=sys.stderr)
+
+        results.append((path_to_file, journal_acronym, error))
+
+    return results
+
+
+def main(argv=None, prog=None):
+    arg_parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Exports issues data from odt files to JSON files")
+    arg_parser.add_argument("files", nargs="*", help="odt files of issues")
+    arg_parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="number of worker processes, 0 - number of CPUs (default: 1)")
+    arg_parser.add_argument("-o", "--output-dir", default="",
+                            help="directory for JSON files")
+    arg_parser.add_argument("-f", "--format", choices=["json", "jsonl"],
+                            default="json", help="output format")
+    arg_parser.add_argument("-z", "--gzip", action="store_true",
+                            help="compress JSON Lines files")
+    arg_parser.add_argument("--cache-dir",
+                            help="directory of parsed issues cache")
+    arg_parser.add_argument(
+        "--cache-size", type=int, default=odt_cache.DEFAULT_MAX_SIZE,
+        help="max size of the cache in bytes")
+    arg_parser.add_argument(
+        "--report-dir",
+        help="directory for instrumentation reports of files (JSON)")
+    arg_parser.add_argument("--cprofile", action="store_true",
+                            help="dump cProfile stats to the report directory")
+    arg_parser.add_argument(
+        "--journals",
+        help="JSON file with extra journals and rubrics, replaces "
+             f"{JOURNALS_FILE_ENV} (see journals.py)")
+    args = arg_parser.parse_args(argv)
+
+    if args.cprofile and not args.report_dir:
+        arg_parser.error("--cprofile requires --report-dir")
+
+    if not args.files:
+        print("Searching all odt files in directory...")
+        return 0
+
+    if args.journals:
+        # Файл заменяет данные, загруженные из ODTPARSER_JOURNALS при
+        # импорте
+        try:
+            REGISTRY.reset()
+            REGISTRY.load(args.journals)
+        except (OSError, ValueError, KeyError) as error:
+            arg_parser.error(f"--journals: {error}")
+        # Процессы пула, запущенные через spawn, загружают файл при импорте
+        os.environ[JOURNALS_FILE_ENV] = args.journals
+
+    cache = None
+    if args.cache_dir:
+        cache = odt_cache.IssueCache(args.cache_dir, args.cache_size)
+
+    results = export_issues(args.files, workers=args.workers or None,
+                            output_dir=args.output_dir, cache=cache,
+                            output_format=args.format, compress=args.gzip,
+                            report_dir=args.report_dir,
+                            cprofile=args.cprofile)
+
+    failed = [path for path, _, error in results if error is not None]
+    if failed:
+        print(f"Не обработаны файлы ({len(failed)}): {', '.join(failed)}",
+              file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Repair of Latin/Cyrillic look-alike letters typed by editors. Gives the same
+result as transliterate.translit(text, "ru") and
+translit(text, "ru", reversed=True), but the tables are built once and the
+results are cached.
+"""
+
+import re
+from functools import lru_cache
+
+# Данные языкового пакета "ru" библиотеки transliterate
+LATIN_LETTERS = "abvgdezijklmnoprstufhcC'y'ABVGDEZIJKLMNOPRSTUFH'Y'"
+CYRILLIC_LETTERS = "абвгдезийклмнопрстуфхцЦъыьАБВГДЕЗИЙКЛМНОПРСТУФХЪЫЬ"
+CYRILLIC_SPECIFIC = ("ёэЁЭъьЪЬ", "eeEE''''")
+# Порядок важен: правила применяются последовательно, как в transliterate
+# ("sch" никогда не становится "щ", т.к. "ch" заменяется раньше)
+DIGRAPHS = (
+    ("zh", "ж"), ("ts", "ц"), ("ch", "ч"), ("sh", "ш"), ("sch", "щ"),
+    ("ju", "ю"), ("ja", "я"), ("Zh", "Ж"), ("Ts", "Ц"), ("Ch", "Ч"),
+    ("Sh", "Ш"), ("Sch", "Щ"), ("Ju", "Ю"), ("Ja", "Я"),
+)
+
+# Latin → Cyrillic. Повторяющиеся буквы берут последнее соответствие.
+TO_CYRILLIC_TABLE = {ord(latin): ord(cyrillic) for latin, cyrillic
+                     in zip(LATIN_LETTERS, CYRILLIC_LETTERS)}
+# Cyrillic → Latin одной таблицей: буквы, диграфы и специальные буквы
+# заменяются независимо друг от друга
+TO_LATIN_TABLE = {cyrillic: chr(latin)
+                  for latin, cyrillic in TO_CYRILLIC_TABLE.items()}
+TO_LATIN_TABLE.update({ord(cyrillic): latin for latin, cyrillic in DIGRAPHS})
+TO_LATIN_TABLE.update({ord(cyrillic): latin for cyrillic, latin
+                       in zip(*CYRILLIC_SPECIFIC)})
+
+LATIN_SOURCE_REGEX = re.compile("[%s]" % re.escape("".join(
+    sorted({chr(key) for key in TO_CYRILLIC_TABLE}))))
+CYRILLIC_SOURCE_REGEX = re.compile("[%s]" % re.escape("".join(
+    sorted({chr(key) for key in TO_LATIN_TABLE}))))
+CYRILLIC_LETTER_REGEX = re.compile(r"[а-яА-ЯёЁ]")
+LATIN_LETTER_REGEX = re.compile(r"[a-zA-Z]")
+
+# Имена авторов и рубрики часто повторяются в выпусках
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_cyrillic(text: str) -> str:
+    """
+    Replaces Latin letters with Cyrillic ones (translit(text, "ru"))
+    """
+
+    if LATIN_SOURCE_REGEX.search(text) is None:
+        return text
+
+    for latin, cyrillic in DIGRAPHS:
+        if latin in text:
+            text = text.replace(latin, cyrillic)
+
+    return text.translate(TO_CYRILLIC_TABLE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_latin(text: str) -> str:
+    """
+    Replaces Cyrillic letters with Latin ones
+    (translit(text, "ru", reversed=True))
+    """
+
+    if CYRILLIC_SOURCE_REGEX.search(text) is None:
+        return text
+
+    return text.translate(TO_LATIN_TABLE)
+
+
+def cyrillic_ratio(text: str) -> float:
+    """
+    Returns share of Cyrillic letters among Cyrillic and Latin letters of
+    text, 0.5 for text without letters
+    """
+
+    cyrillic = len(CYRILLIC_LETTER_REGEX.findall(text))
+    latin = len(LATIN_LETTER_REGEX.findall(text))
+
+    if cyrillic + latin == 0:
+        return 0.5
+
+    return cyrillic / (cyrillic + latin)
+
+
+def repair_homoglyphs(text: str, lang: str = None) -> str:
+    """
+    Converts text to the script of lang ("ru" or "en"). If lang is not
+    given, text is converted to the script of the most of its letters.
+    """
+
+    if lang is None:
+        lang = "ru" if cyrillic_ratio(text) >= 0.5 else "en"
+
+    if lang == "ru":
+        return to_cyrillic(text)
+
+    if lang == "en":
+        return to_latin(text)
+
+    raise ValueError(f"Unknown language: {lang}")
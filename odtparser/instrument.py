@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in instrumentation of issue parsing. Records wall time, CPU time,
+peak traced memory, nodes and regex evaluations for each extraction stage:
+
+    with instrument.instrumented() as recorder:
+        export.get_issue_data(path)
+    report = recorder.report()
+
+When instrumentation is disabled stages cost one global lookup.
+"""
+
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Модули, регулярные выражения которых подсчитываются
+REGEX_MODULES = ("odtparser.odtparser", "odtparser.normalize",
+                 "odtparser.homoglyphs", "odtparser.language",
+                 "odtparser.affiliation")
+REGEX_METHODS = ("search", "match", "fullmatch", "findall", "finditer",
+                 "sub", "subn", "split")
+
+# Активный Recorder или None
+_active = None
+
+
+class CountingPattern:
+    """
+    Proxy of compiled regex, which counts evaluations in the active
+    recorder
+    """
+
+    def __init__(self, pattern):
+        self.pattern_object = pattern
+        self.pattern = pattern.pattern
+        self.flags = pattern.flags
+        self.groups = pattern.groups
+        self.groupindex = pattern.groupindex
+
+        for method_name in REGEX_METHODS:
+            setattr(self, method_name, self._counting(method_name))
+
+    def _counting(self, method_name):
+        method = getattr(self.pattern_object, method_name)
+
+        def counting_method(*args, **kwargs):
+            if _active is not None:
+                _active.count("regex")
+            return method(*args, **kwargs)
+
+        return counting_method
+
+
+class Stage:
+
+    __slots__ = ("name", "depth", "wall", "cpu", "memory_peak", "counters",
+                 "start_memory", "running_peak")
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.memory_peak = None
+        self.counters = {}
+        self.start_memory = 0
+        self.running_peak = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "memory_peak": self.memory_peak,
+            "counters": dict(self.counters),
+        }
+
+
+class Recorder:
+    """
+    Stages of parsing in order of their start. Times of a stage include
+    its nested stages, counters don't.
+    """
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.stages = []
+        self.stack = []
+        self.info = {}
+
+    def count(self, name, value=1):
+        """
+        Adds value to the counter of the innermost running stage
+        """
+
+        if self.stack:
+            counters = self.stack[-1].counters
+            counters[name] = counters.get(name, 0) + value
+
+    def _enter_memory(self, stage):
+        current, peak = tracemalloc.get_traced_memory()
+
+        if self.stack:
+            parent = self.stack[-1]
+            parent.running_peak = max(parent.running_peak, peak)
+
+        # До Python 3.9 пик нельзя сбросить: он считается с начала записи
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        stage.start_memory = current
+        stage.running_peak = current
+
+    def _exit_memory(self, stage):
+        peak = tracemalloc.get_traced_memory()[1]
+        stage.memory_peak = max(stage.running_peak, peak) - stage.start_memory
+
+    @contextmanager
+    def stage(self, name):
+        stage = Stage(name, len(self.stack))
+        self.stages.append(stage)
+
+        if self.memory:
+            self._enter_memory(stage)
+
+        self.stack.append(stage)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+
+        try:
+            yield stage
+        finally:
+            stage.wall = time.perf_counter() - start_wall
+            stage.cpu = time.process_time() - start_cpu
+            self.stack.pop()
+
+            if self.memory:
+                self._exit_memory(stage)
+
+    def report(self) -> dict:
+        """
+        Returns report as JSON serializable dictionary
+        """
+
+        totals = {}
+        for stage in self.stages:
+            for name, value in stage.counters.items():
+                totals[name] = totals.get(name, 0) + value
+
+        return dict(self.info,
+                    stages=[stage.as_dict() for stage in self.stages],
+                    counters=totals)
+
+
+def is_active() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def stage(name):
+    """
+    Records stage in the active recorder. Does nothing if instrumentation is
+    disabled.
+    """
+
+    if _active is None:
+        yield None
+    else:
+        with _active.stage(name) as recorded_stage:
+            yield recorded_stage
+
+
+def count(name, value=1):
+    if _active is not None:
+        _active.count(name, value)
+
+
+def _install_regex_counters() -> list:
+    """
+    Replaces compiled regexes of REGEX_MODULES with CountingPattern. Returns
+    list of (module, name, pattern) to restore.
+    """
+
+    replaced = []
+
+    for module_name in REGEX_MODULES:
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+
+        for name, value in list(vars(module).items()):
+            if isinstance(value, re.Pattern):
+                setattr(module, name, CountingPattern(value))
+                replaced.append((module, name, value))
+
+    return replaced
+
+
+@contextmanager
+def instrumented(memory=True, regex=True, **info):
+    """
+    Enables instrumentation in the block and yields Recorder. memory enables
+    tracemalloc, regex counts regex evaluations. info is added to the
+    report.
+    """
+
+    global _active
+
+    if _active is not None:
+        raise RuntimeError("Instrumentation is already enabled")
+
+    recorder = Recorder(memory)
+    recorder.info.update(info)
+
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    replaced = _install_regex_counters() if regex else []
+    _active = recorder
+
+    try:
+        with recorder.stage("total"):
+            yield recorder
+    finally:
+        _active = None
+
+        for module, name, pattern in replaced:
+            setattr(module, name, pattern)
+
+        if started_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Registry of journals, rubrics and months. Built once from journals_info and
+optionally extended from a JSON data file, so a new journal or rubric does
+not require a code change:
+
+    {"journals": [{"name_ru": "...", "name_en": "...", "abbrv": "xx"}],
+     "rubrics": {"Рубрика": "Rubric"}}
+
+The file is given by the ODTPARSER_JOURNALS environment variable (worker
+processes inherit it) or loaded with JournalRegistry.load(). Lookups are
+dictionary lookups by normalized keys (case and whitespace).
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+
+from odtparser.journals_info import JOURNAL_ABBRVS, JOURNAL_NAMES_RU_LIST, \
+    JOURNAL_NAMES_EN_LIST, MONTHS_RU_LIST, MONTHS_EN_LIST, RUBRICS_DICT
+
+JOURNALS_FILE_ENV = "ODTPARSER_JOURNALS"
+
+Journal = namedtuple("Journal", ["name_ru", "name_en", "abbrv"])
+
+
+def normalize_key(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+class JournalRegistry:
+    """
+    Journals, rubrics and months with forward and reverse maps
+    """
+
+    def __init__(self):
+        self.journals = []
+        # Пары (русское, английское название) в порядке добавления
+        self.rubrics = []
+        # Нормализованные названия (русские, английские) и сокращения
+        self._journals_by_key = {}
+        self._rubrics_en = {}
+        self._rubrics_ru = {}
+        self._months = {}
+        # Скомпилированные выражения, зависящие от списка журналов
+        self._compiled = {}
+
+    @classmethod
+    def from_journals_info(cls):
+        registry = cls()
+        registry.reset()
+
+        return registry
+
+    def reset(self):
+        """
+        Replaces data of the registry with journals_info, dropping loaded
+        data files
+        """
+
+        self.journals.clear()
+        self.rubrics.clear()
+        self._journals_by_key.clear()
+        self._rubrics_en.clear()
+        self._rubrics_ru.clear()
+        self._months.clear()
+        self._compiled.clear()
+
+        for name_ru, name_en in zip(JOURNAL_NAMES_RU_LIST,
+                                    JOURNAL_NAMES_EN_LIST):
+            self.add_journal(name_ru, name_en, JOURNAL_ABBRVS[name_ru])
+
+        for rubric_ru, rubric_en in RUBRICS_DICT.items():
+            self.add_rubric(rubric_ru, rubric_en)
+
+        for months in (MONTHS_RU_LIST, MONTHS_EN_LIST):
+            for number, month in enumerate(months, 1):
+                self._months[normalize_key(month)] = number
+
+    def add_journal(self, name_ru: str, name_en: str, abbrv: str):
+        journal = Journal(name_ru, name_en, abbrv)
+        self.journals.append(journal)
+
+        for name in journal:
+            self._journals_by_key[normalize_key(name)] = journal
+
+        self._compiled.clear()
+
+    def add_rubric(self, rubric_ru: str, rubric_en: str):
+        # Английские названия рубрик повторяются; как и при поиске по
+        # RUBRICS_DICT, побеждает последняя рубрика
+        self.rubrics.append((rubric_ru, rubric_en))
+        self._rubrics_en[normalize_key(rubric_ru)] = rubric_en
+        self._rubrics_ru[normalize_key(rubric_en)] = rubric_ru
+
+    def load(self, path: str):
+        """
+        Adds journals and rubrics from JSON data file
+        """
+
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        for journal in data.get("journals", ()):
+            self.add_journal(journal["name_ru"], journal["name_en"],
+                             journal["abbrv"])
+
+        for rubric_ru, rubric_en in data.get("rubrics", {}).items():
+            self.add_rubric(rubric_ru, rubric_en)
+
+    def fingerprint(self) -> str:
+        """
+        Returns sha256 of the journals and rubrics, which parsing results
+        depend on
+        """
+
+        data = json.dumps({"journals": self.journals,
+                           "rubrics": self.rubrics}, ensure_ascii=False)
+
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def journal(self, name: str) -> Journal:
+        """
+        Returns journal by Russian or English name or abbreviation. Raises
+        KeyError for unknown journal.
+        """
+
+        return self._journals_by_key[normalize_key(name)]
+
+    def rubric_ru(self, rubric_en: str) -> str:
+        return self._rubrics_ru.get(normalize_key(rubric_en), "")
+
+    def rubric_en(self, rubric_ru: str) -> str:
+        return self._rubrics_en.get(normalize_key(rubric_ru), "")
+
+    def month_number(self, month: str) -> int:
+        """
+        Returns number of Russian or English month name (1-12). Raises
+        ValueError for unknown month.
+        """
+
+        try:
+            return self._months[normalize_key(month)]
+        except KeyError:
+            raise ValueError(f"Неизвестный месяц: {month}") from None
+
+    def compiled(self, key: str, build):
+        """
+        Returns build(self) compiled once until the list of journals changes
+        """
+
+        pattern = self._compiled.get(key)
+        if pattern is None:
+            pattern = self._compiled[key] = build(self)
+        return pattern
+
+    def find_journal(self, text: str):
+        """
+        Returns the first journal whose Russian name occurs in text as is
+        (case and spaces are not normalized) or None
+        """
+
+        result = self.compiled("footer", build_footer_regex).search(text)
+
+        if result is None:
+            return None
+
+        return self.journal(result.group())
+
+
+def build_footer_regex(registry: JournalRegistry):
+    return re.compile("|".join(re.escape(journal.name_ru)
+                               for journal in registry.journals))
+
+
+REGISTRY = JournalRegistry.from_journals_info()
+
+if os.environ.get(JOURNALS_FILE_ENV):
+    REGISTRY.load(os.environ[JOURNALS_FILE_ENV])
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON Lines output of issue exports. The first line of a file is the issue
+record, every following line is one article:
+
+{"record": "issue", "issue_info": {...}}
+{"record": "article", "index": 0, "article_info": {...}}
+
+Files are written to a temporary file and renamed on completion, so a
+loader never sees a partial file. Files with .gz suffix are gzip
+compressed.
+"""
+
+import gzip
+import json
+import os
+
+JSONL_SUFFIX = ".jsonl"
+GZIP_SUFFIX = ".gz"
+
+
+def open_text(path, mode):
+    if path.endswith(GZIP_SUFFIX):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+class JsonLinesWriter:
+    """
+    Writer of issue records. Use as context manager: the file appears on
+    successful exit, on exception the temporary file is removed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.number_of_articles = 0
+
+        # Суффикс .gz временного файла сохраняется, он определяет сжатие
+        root, suffix = path, ""
+        if path.endswith(GZIP_SUFFIX):
+            root, suffix = path[:-len(GZIP_SUFFIX)], GZIP_SUFFIX
+        self.tmp_path = f"{root}.{os.getpid()}.tmp{suffix}"
+
+    def __enter__(self):
+        self.file = open_text(self.tmp_path, "w")
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.file.close()
+
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+
+        return False
+
+    def write_record(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False,
+                                   separators=(",", ":")))
+        self.file.write("\n")
+
+    def write_issue_info(self, issue_info):
+        self.write_record({"record": "issue", "issue_info": issue_info})
+
+    def write_article_info(self, article_info):
+        self.write_record({"record": "article",
+                           "index": self.number_of_articles,
+                           "article_info": article_info})
+        self.number_of_articles += 1
+
+
+def write_issue_records(records, path):
+    """
+    Writes records of export.iter_record_dicts (tuples (kind, data), the issue
+    first) to JSON Lines file
+    """
+
+    with JsonLinesWriter(path) as writer:
+        for kind, data in records:
+            if kind == "issue":
+                writer.write_issue_info(data)
+            else:
+                writer.write_article_info(data)
+
+
+def iter_records(path):
+    """
+    Yields records of JSON Lines file one by one
+    """
+
+    with open_text(path, "r") as read_file:
+        for line in read_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_issue_data(path) -> dict:
+    """
+    Returns issue data in the format of export.get_issue_data
+    """
+
+    issue_data = {"issue_info": {}, "articles_info": []}
+
+    for record in iter_records(path):
+        if record["record"] == "issue":
+            issue_data["issue_info"] = record["issue_info"]
+        else:
+            issue_data["articles_info"].append(record["article_info"])
+
+    return issue_data
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Detection of article language. Articles are written in Russian or English,
+so the language is decided by the ratio of Cyrillic and Latin letters.
+langdetect is used only for ambiguous texts.
+"""
+
+import functools
+import re
+from collections import namedtuple
+
+CYRILLIC_RUN_REGEX = re.compile(r"[а-яА-ЯёЁ]+")
+LATIN_RUN_REGEX = re.compile(r"[a-zA-Z]+")
+
+# Текст с меньшим числом букв или меньшей долей букв одного алфавита
+# считается неоднозначным
+MIN_LETTERS = 50
+MIN_CONFIDENCE = 0.7
+# Длина начала текста, по которому язык определяет langdetect
+LANGDETECT_TEXT_LENGTH = 1000
+
+# lang: "ru", "en" or other code returned by langdetect; confidence: share
+# of the letters of the language script or langdetect probability; method:
+# "ratio" or "langdetect"
+LanguageDecision = namedtuple("LanguageDecision",
+                              ["lang", "confidence", "method"])
+
+
+def count_letters(text: str) -> tuple:
+    """
+    Returns numbers of Cyrillic and Latin letters in text
+    """
+
+    cyrillic = sum(map(len, CYRILLIC_RUN_REGEX.findall(text)))
+    latin = sum(map(len, LATIN_RUN_REGEX.findall(text)))
+
+    return cyrillic, latin
+
+
+def detect_by_ratio(text: str):
+    """
+    Returns LanguageDecision by letter ratio or None if text is ambiguous
+    """
+
+    cyrillic, latin = count_letters(text)
+    letters = cyrillic + latin
+
+    if letters < MIN_LETTERS:
+        return None
+
+    if cyrillic >= latin:
+        decision = LanguageDecision("ru", cyrillic / letters, "ratio")
+    else:
+        decision = LanguageDecision("en", latin / letters, "ratio")
+
+    if decision.confidence < MIN_CONFIDENCE:
+        return None
+
+    return decision
+
+
+@functools.lru_cache(maxsize=None)
+def get_detector_factory():
+    """
+    Returns langdetect DetectorFactory with loaded language profiles and
+    fixed seed. The factory is created on the first call.
+    """
+
+    # langdetect долго загружает профили языков, поэтому импортируется
+    # только при необходимости
+    from langdetect.detector_factory import DetectorFactory, \
+        PROFILES_DIRECTORY
+
+    # Собственная фабрика не меняет глобальное состояние langdetect, а
+    # фиксированное зерно делает результат независимым от запуска и процесса
+    factory = DetectorFactory()
+    factory.set_seed(0)
+    factory.load_profile(PROFILES_DIRECTORY)
+
+    return factory
+
+
+def detect_by_langdetect(text: str) -> LanguageDecision:
+    """
+    Returns LanguageDecision of langdetect for the beginning of text.
+    Raises langdetect.LangDetectException if text has no features.
+    """
+
+    detector = get_detector_factory().create()
+    detector.append(text[:LANGDETECT_TEXT_LENGTH])
+    languages = detector.get_probabilities()
+
+    if not languages:
+        return LanguageDecision("unknown", 0.0, "langdetect")
+
+    return LanguageDecision(languages[0].lang, languages[0].prob,
+                            "langdetect")
+
+
+def detect_language(text: str) -> LanguageDecision:
+    """
+    Detects language of the article text
+    """
+
+    decision = detect_by_ratio(text)
+
+    if decision is None:
+        decision = detect_by_langdetect(text)
+
+    return decision
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+lxml backend of OdtParser. Implements the same fields directly on
+lxml.etree trees. Output matches the BeautifulSoup backend.
+"""
+
+from lxml import etree
+
+import odtparser.instrument as instrument
+import odtparser.odtparser as odt
+import odtparser.stream as stream
+from odtparser.odtfile import OdtFile, CONTENT_XML, STYLES_XML, NAMESPACES
+from odtparser.styles import StyleIndex
+
+# Пространства имен XPath: ODF и регулярные выражения EXSLT (re:test)
+XPATH_NAMESPACES = dict(NAMESPACES,
+                        re="http://exslt.org/regular-expressions")
+
+REF_LISTS_XPATH = etree.XPath(
+    "//text:list[re:test(@text:style-name, '%s')]"
+    % odt.REF_LIST_STYLE_REGEX.pattern, namespaces=XPATH_NAMESPACES)
+FULL_TEXT_SECTIONS_XPATH = etree.XPath(
+    "//text:section[re:test(@text:name, '%s')]"
+    % odt.FULL_TEXT_SECTION_REGEX.pattern, namespaces=XPATH_NAMESPACES)
+STYLES_XPATH = etree.XPath("//style:style", namespaces=XPATH_NAMESPACES)
+FOOTERS_XPATH = etree.XPath("//style:footer | //style:footer-left",
+                            namespaces=XPATH_NAMESPACES)
+
+
+def count_nodes(root) -> int:
+    return sum(1 for _ in root.iter())
+
+
+class LxmlOdtParser(odt.OdtParser):
+    """
+    OdtParser working on lxml trees. Use OdtParser(path, backend="lxml").
+    """
+
+    @odt.lazy_property
+    def content_data(self):
+        with OdtFile(self.source) as file:
+            with file.open_member(CONTENT_XML) as content_file:
+                content_root = stream.parse_content(content_file)
+
+        if instrument.is_active():
+            instrument.count("nodes", count_nodes(content_root))
+
+        return content_root
+
+    @odt.lazy_property
+    def styles_data(self):
+        with OdtFile(self.source) as file:
+            with file.open_member(STYLES_XML) as styles_file:
+                styles_root = etree.parse(styles_file).getroot()
+
+        if instrument.is_active():
+            instrument.count("nodes", count_nodes(styles_root))
+
+        return styles_root
+
+    @odt.lazy_property
+    def style_index(self):
+        style_index = StyleIndex()
+
+        # Стили content.xml идут последними и переопределяют styles.xml
+        for tree in (self.styles_data, self.content_data):
+            for style in STYLES_XPATH(tree):
+                style_index.add_element(style)
+
+        return style_index
+
+    @odt.lazy_property
+    def paragraphs(self):
+        """
+        List of all text:p elements of the document in document order with
+        their style names and texts
+        """
+
+        return [self._paragraph(node)
+                for node in self.content_data.iter(stream.P)]
+
+    def _body_node(self):
+        return next(self.content_data.iter(stream.OFFICE_TEXT), None)
+
+    @staticmethod
+    def _child_nodes(node) -> list:
+        # Комментарии и инструкции обработки не являются узлами статей
+        return [child for child in node if isinstance(child.tag, str)]
+
+    @staticmethod
+    def _block_descendants(node):
+        return node.iterdescendants(stream.SECTION, stream.LIST)
+
+    @staticmethod
+    def _paragraph(node) -> odt.Paragraph:
+        return odt.Paragraph(node, node.get(stream.TEXT_STYLE_NAME, ""),
+                             stream.element_text(node))
+
+    @staticmethod
+    def _node_paragraphs(node) -> list:
+        return list(node.iter(stream.P))
+
+    @staticmethod
+    def _node_text(node) -> str:
+        return stream.element_text(node)
+
+    @staticmethod
+    def _sibling_texts(node) -> list:
+        return list(stream.iter_sibling_texts(node))
+
+    @staticmethod
+    def _single_string(node):
+        return stream.single_string(node)
+
+    @staticmethod
+    def _cell_style_name(node) -> str:
+        return node.getparent().attrib[stream.TABLE_STYLE_NAME]
+
+    @staticmethod
+    def _is_full_text_section(node) -> bool:
+        return stream.is_full_text_section(node)
+
+    @staticmethod
+    def _is_ref_list(node) -> bool:
+        return stream.is_ref_list(node)
+
+    def _full_text_sections(self) -> list:
+        return FULL_TEXT_SECTIONS_XPATH(self.content_data)
+
+    def _ref_lists(self) -> list:
+        return REF_LISTS_XPATH(self.content_data)
+
+    def _reference_item(self, ref_node) -> tuple:
+        ref_header = stream.preceding_text(ref_node)
+
+        if ref_header is None:
+            raise odt.LayoutError(
+                "Ошибка в оформлении списка литературы."
+                f" См. ниже: \n{stream.element_text(ref_node)}")
+
+        ref_lang = odt.get_ref_list_lang(ref_header.strip())
+
+        return (ref_lang, stream.get_ref_list_items(ref_node,
+                                                    self.style_index))
+
+    @odt.lazy_property
+    def journal_name(self) -> dict:
+        return odt.parse_journal_name_list(
+            [stream.element_text(footer)
+             for footer in FOOTERS_XPATH(self.styles_data)])
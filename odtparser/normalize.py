@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Text normalization. Whitespace is collapsed with str.split, fixed
+substrings are replaced with str.replace, the remaining rules are
+precompiled once and run only when the text contains their trigger
+character. Rules are grouped into named profiles: full_text, citation,
+reference_html, author_name, node_text.
+"""
+
+import re
+
+WHITESPACE_REGEX = re.compile(r"\s+")
+# "№5" -> "№ 5". "№№5" -> "№ №5", as the sign consumes the next character.
+NUMBER_SIGN_REGEX = re.compile(r"№(\S)")
+I_TAGS_SPACE_REGEX = re.compile(r"</i>\s+<i>")
+EMPTY_I_TAGS_REGEX = re.compile(r"<i>\s+</i>")
+
+LINE_BREAK_TAG = "<text:line-break/>"
+# Place of a line break in a text run of the parsed tree. XML text can not
+# contain the null character.
+LINE_BREAK_MARK = "\x00"
+
+
+def collapse_spaces(text: str) -> str:
+    """
+    Replaces every whitespace sequence with one space
+    """
+
+    # Пробел - единственный пробельный символ, который isprintable(), так
+    # что текст без двойных пробелов и непечатаемых символов не меняется
+    if "  " not in text and text.isprintable():
+        return text
+
+    return WHITESPACE_REGEX.sub(" ", text)
+
+
+def squeeze_spaces(text: str) -> str:
+    """
+    Replaces every whitespace sequence with one space and strips text
+    """
+
+    return " ".join(text.split())
+
+
+def normalize_text(text: str) -> str:
+    """
+    Strips text, collapses spaces, removes spaces before dots and commas,
+    replaces line breaks with spaces, "·" with "X" and adds space after "№"
+    """
+
+    # str.split uses the same whitespace as \s, including \xa0. Text is
+    # split only if it has whitespace other than single inner spaces (see
+    # collapse_spaces)
+    if (not text.isprintable() or "  " in text or text.startswith(" ")
+            or text.endswith(" ")):
+        text = " ".join(text.split())
+
+    text = text.replace(" .", ".")
+
+    if LINE_BREAK_TAG in text:
+        text = text.replace(LINE_BREAK_TAG, " ")
+
+    # str.translate is much slower than str.replace on non-ASCII text
+    text = text.replace("·", "X")
+
+    # Знак, за которым везде уже стоит пробел, не требует замены
+    if "№" in text and text.count("№") != text.count("№ "):
+        text = NUMBER_SIGN_REGEX.sub(r"№ \1", text)
+
+    return text.replace(" ,", ",")
+
+
+def normalize_node_text(text: str) -> str:
+    """
+    Normalizes text run of an XML node as normalize_text normalized it in
+    the whole document: spaces are collapsed, but not stripped, line breaks
+    (LINE_BREAK_MARK) are replaced with spaces, "№" at the end of the run
+    gets a space as it was followed by a tag.
+    """
+
+    if not text.isprintable() or "  " in text:
+        text = WHITESPACE_REGEX.sub(" ", text)
+
+    if " ." in text:
+        text = text.replace(" .", ".")
+
+    if LINE_BREAK_MARK in text:
+        text = text.replace(LINE_BREAK_MARK, " ")
+
+    if "·" in text:
+        text = text.replace("·", "X")
+
+    if "№" in text:
+        text = NUMBER_SIGN_REGEX.sub(r"№ \1", text + "<")[:-1]
+
+    if " ," in text:
+        text = text.replace(" ,", ",")
+
+    return text
+
+
+def normalize_reference_html(html: str) -> str:
+    """
+    Joins doubled, trippled i tags in reference HTML string and deletes
+    spaces. String must start with <p> and end with </p>.
+    """
+
+    html = html.replace("</i><i>", "")
+
+    if "<i>" in html:
+        html = I_TAGS_SPACE_REGEX.sub(" ", html)
+        html = EMPTY_I_TAGS_REGEX.sub(" ", html)
+
+    # Whitespace at the ends is impossible because of <p> and </p>
+    html = " ".join(html.split())
+
+    return html.replace("<p> ", "<p>", 1)
+
+
+def normalize_author_names(text: str) -> str:
+    """
+    Collapses spaces and removes bullets marking corresponding author
+    """
+
+    text = collapse_spaces(text)
+
+    if "•" in text:
+        text = text.replace("•,", "").replace("•", "")
+
+    return text
+
+
+PROFILES = {
+    "full_text": normalize_text,
+    "citation": normalize_text,
+    "reference_html": normalize_reference_html,
+    "author_name": normalize_author_names,
+    "node_text": normalize_node_text,
+}
+
+
+def normalize(text: str, profile: str) -> str:
+    """
+    Normalizes text with the named profile
+    """
+
+    try:
+        normalizer = PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown normalization profile: {profile}")
+
+    return normalizer(text)
@@ -1,21 +1,147 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import io
+import mmap
+import os
 import zipfile
 
+CONTENT_XML = "content.xml"
+STYLES_XML = "styles.xml"
+
+NAMESPACES = {
+    "office": "urn:oasis:names:tc:opendocument:xmlns:office:1.0",
+    "style": "urn:oasis:names:tc:opendocument:xmlns:style:1.0",
+    "text": "urn:oasis:names:tc:opendocument:xmlns:text:1.0",
+    "table": "urn:oasis:names:tc:opendocument:xmlns:table:1.0",
+    "fo": "urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0",
+}
+
+
+def qname(name: str) -> str:
+    """
+    Returns lxml tag or attribute name for prefixed ODF name ("text:p")
+    """
+
+    prefix, local_name = name.split(":")
+
+    return "{%s}%s" % (NAMESPACES[prefix], local_name)
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Seekable read-only file over bytes-like object without copying it
+    """
+
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer).cast("B")
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        data = self.buffer[self.position:self.position + len(b)]
+        size = len(data)
+        b[:size] = data
+        self.position += size
+
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        else:
+            self.position = len(self.buffer) + offset
+
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        # Освобождаем буфер, иначе mmap нельзя закрыть
+        self.buffer.release()
+        super().close()
+
 
 class OdtFile:
+    """
+    ODT archive. Accepts path, bytes, bytearray, memoryview or binary
+    file-like object. Files on disk are memory-mapped. Use as context
+    manager or call close().
+    """
 
     def __init__(self, odt_filename):
-        self.odt_filename = odt_filename
-        self.odt_file_as_zip = zipfile.ZipFile(odt_filename, 'r')
-        self.content_file_bytes = None
-        self.styles_file_bytes = None
+        self.odt_filename = None
+        self._file = None
+        self._mmap = None
+        self._reader = None
+
+        if isinstance(odt_filename, (str, os.PathLike)):
+            self.odt_filename = odt_filename
+            self._file = open(odt_filename, "rb")
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+                self._reader = source = BufferReader(self._mmap)
+            except (ValueError, OSError):
+                # Пустой файл или файл, который нельзя отобразить в память
+                source = self._file
+        elif isinstance(odt_filename, (bytes, bytearray, memoryview)):
+            source = BufferReader(odt_filename)
+        else:
+            source = odt_filename
+
+        try:
+            self.odt_file_as_zip = zipfile.ZipFile(source, "r")
+        except Exception:
+            self._close_source()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+        return False
+
+    def _close_source(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        self.odt_file_as_zip.close()
+        self._close_source()
+
+    def open_member(self, name):
+        """
+        Returns binary file-like object with decompressed member, so it can
+        be parsed without reading it into memory first
+        """
+
+        return self.odt_file_as_zip.open(name)
+
+    def read_member(self, name) -> bytes:
+        return self.odt_file_as_zip.read(name)
 
     def get_content_data(self):
-        self.content_file_bytes = self.odt_file_as_zip.read('content.xml')
-        return self.content_file_bytes.decode('utf-8')
+        return self.read_member(CONTENT_XML).decode('utf-8')
 
     def get_styles_data(self):
-        self.styles_file_bytes = self.odt_file_as_zip.read('styles.xml')
-        return self.styles_file_bytes.decode('utf-8')
+        return self.read_member(STYLES_XML).decode('utf-8')
@@ -3,17 +3,75 @@
 
 
 import re
-import sys
 from typing import Type
 
-import bs4
-import langdetect
-from transliterate import translit
-from collections import OrderedDict
-
-from odtparser.odtfile import OdtFile
-from odtparser.journals_info import JOURNAL_NAMES_RU_LIST,\
-    JOURNAL_NAMES_EN_LIST, MONTHS_RU_LIST, MONTHS_EN_LIST
+from collections import OrderedDict, namedtuple
+
+# bs4 импортируется внутри функций BeautifulSoup-бэкенда, чтобы lxml-код
+# (stream, export) его не загружал
+import odtparser.instrument as instrument
+from odtparser.affiliation import find_author_data
+from odtparser.article import Affiliation
+from odtparser.references import get_ref_element_item, render_full_text
+from odtparser.homoglyphs import to_cyrillic, to_latin
+from odtparser.language import detect_language
+from odtparser.odtfile import OdtFile, CONTENT_XML, STYLES_XML
+from odtparser.normalize import LINE_BREAK_MARK, collapse_spaces,\
+    normalize_author_names, normalize_node_text, normalize_text,\
+    squeeze_spaces
+from odtparser.styles import StyleIndex
+from odtparser.journals import REGISTRY
+
+
+CITATION_REGEX = re.compile(r"Для цитирования:|Please cite this article as:")
+CITATION_EN_MARK = "Please cite this article as:"
+CITATION_RU_REGEX = re.compile(r"Для цитирования")
+ABSTRACT_REGEX = re.compile(r"Аннотация|Abstract")
+PUBLISHER_REGEX = re.compile(r"Издательский дом ФИНАНСЫ и КРЕДИТ|"
+                             r"Publishing house FINANCE and CREDIT")
+RUBRIC_STYLE_REGEX = re.compile(r"СтатьяРубрика")
+AUTHORS_STYLE_REGEX = re.compile(r"СтатьяАвторыРус|СтатьяАвторыАнгл")
+AFFILIATION_STYLE_REGEX = re.compile(r"СтатьяАффилиация")
+RUBRIC_RU_REGEX = re.compile(r"^[а-яА-ЯёЁ\s\.\,\-]+")
+THROUGH_ISSUE_NUMBER_REGEX = re.compile(
+    r".*Валовый\s+\(сквозной\)\s+номер\s+(\d+)\s+")
+ARTICLE_INFO_REGEX = re.compile(r"История статьи:|Article history:")
+PUB_DATES_STYLE_REGEX = re.compile(r"Титу.?Номер.*|Титу.?Год.*")
+REF_LIST_STYLE_REGEX = re.compile("СтатьяСписокЛит")
+FULL_TEXT_SECTION_REGEX = re.compile(r"Раздел|Статья")
+CITATION_INFO_RU_REGEX = re.compile(
+    r"^Для цитирования:\s+(.*?[А-ЯЁ]\.)\s+(.*)\s+\/\/.*\s+–\s+(\d\d\d\d)"
+    r"\.\s+–\s+Т\.\s+(\d+)\,\s+№\s+(\d+)\.\s+\–\s+С\.\s+(\d+\s\–\s+\d+)"
+)
+PAGES_RANGE_REGEX = re.compile(r"^(\d+)[^\d]+(\d+)")
+CORRESPONDING_AUTHOR_REGEX = re.compile(
+    r"•[\s]+Ответственный[\s]+автор|•[\s]+Corresponding[\s]+author")
+WORKPLACE_REGEX = re.compile(r"^([a-zаесор]\s)?(.*)")
+ARTICLE_INFO_RU_REGEX = re.compile(
+    r"(.*)?Получена\s+(\d\d.\d\d.\d\d\d\d).*Получена.*?"
+    r"(\d\d.\d\d.\d\d\d\d).*Одобрена.*?(\d\d.\d\d.\d\d\d\d).*"
+    r"Доступна онлайн.*?(\d\d.\d\d.\d\d\d\d).*?УДК:?\s(.*)\s+JEL:\s+"
+    r"(.*)\s+Ключевые слова:\s+(.*)"
+)
+ARTICLE_INFO_EN_REGEX = re.compile(
+    r"(.*)?Received\s+(\d?\d\s\S+\s\d\d\d\d)\s+Received\sin\srevised."
+    r"*?(\d?\d\s\S+\s\d\d\d\d)\s+Accepted\s.*?(\d?\d\s\S+\s\d\d\d"
+    r"\d)\s+Available\sonline\s.*?(\d?\d\s\S+\s\d\d\d\d)\s+JEL"
+    r"\sclassification:\s+(.*)\s+Keywords:\s(.*)"
+)
+AUTHOR_NAME_RU_REGEX = re.compile(r"[а-яА-ЯёЁ\s\-\.]+")
+AUTHOR_NAME_SUPERSCRIPT_REGEX = re.compile(r"(.*)[a-zа-я]$")
+PUB_DATES_RU_REGEX = re.compile(r"том\s+(\d+),\s+выпуск\s+(\d+)\s+"
+                                r"([а-яА-ЯёЁ\-\–]+)\s+(\d\d\d\d)")
+PUB_DATES_EN_REGEX = re.compile(r"volume\s+(\d+),\s+issue\s+(\d+)\s+"
+                                r"([a-z\-\–]+)\s+(\d\d\d\d)")
+
+
+class LayoutError(Exception):
+    """
+    Ошибка в оформлении макета выпуска: строка для цитирования, список
+    литературы, колонтитул и т.д. не соответствуют шаблону
+    """
 
 
 def clear_text(text: str) -> str:
@@ -21,98 +79,60 @@ def clear_text(text: str) -> str:
     Clears text data
     """
 
-    stripped_text = text.strip()
-    cleared_text = re.sub(r"\s+", " ", stripped_text)
-    cleared_text = re.sub(r"\xa0", " ", cleared_text)
-    cleared_text = re.sub(r"\s\.", ".", cleared_text)
-    cleared_text = re.sub(r"<text:line-break/>", " ", cleared_text)
-    cleared_text = re.sub(r"·", "X", cleared_text)
-    cleared_text = re.sub(r"(№)(\S)", r"\1 \2", cleared_text)
-    cleared_text = re.sub(r"\s,", ",", cleared_text)
+    return normalize_text(text)
 
-    return cleared_text
 
-
-def correct_tree(odt_content: bs4.BeautifulSoup, style_name: str, tag_name: str):
+def normalize_soup_text(soup):
     """
-    Normalizes odt content adding text:style-name element.
+    Normalizes strings of BeautifulSoup tree with normalize_node_text.
+    Line breaks are removed from the tree, the strings around them are
+    joined into one.
     """
 
-    nodes_list = odt_content.find_all(
-        "style:style", {"style:parent-style-name": style_name}
-    )
+    import bs4
 
-    list_of_node_number_styles = []
+    for tag in soup.find_all(True):
+        # Отрезки текста: строки и переводы строки между другими тегами
+        runs = []
+        run = []
 
-    for node in nodes_list:
-        if node["style:name"] not in list_of_node_number_styles:
-            list_of_node_number_styles.append(node["style:name"])
+        for child in tag.contents:
+            if type(child) is bs4.element.NavigableString or (
+                    child.name == "line-break" and child.prefix == "text"):
+                run.append(child)
+            elif run:
+                runs.append(run)
+                run = []
 
-    for number_style in list_of_node_number_styles:
-        nodes_list = odt_content.find_all(
-            tag_name, {"text:style-name": number_style})
+        if run:
+            runs.append(run)
 
-        for node in nodes_list:
-            element = odt_content.find(
-                tag_name, {"text:style-name": number_style})
-            element["text:style-name"] = style_name
+        for run in runs:
+            _replace_run(run)
 
 
-def clear_ref_element(element, content_data):
-    """
-    Clears reference element from odt tags and adds HTML tags 
-    """
-
-    # print(element)
-
-    el_string = "<p>"
+def _replace_run(run):
+    import bs4
 
-    for el in element:
-        if isinstance(el, bs4.element.Tag):
-
-            if el.name == "soft-page-break":
-                el_string = el_string + " "
-                continue
-
-            if el.name in ("bookmark", "s"):
-                continue
-
-            el_pattern = re.compile(r"^T[\d]+")
-
-            if el_pattern.search(el["text:style-name"]):
-                style_name = el["text:style-name"]
-
-                style_element = content_data.find(
-                    "style:style", {"style:name": style_name}
-                )
-
-                font_type = style_element.find("style:text-properties")
-
-                if font_type.get("fo:font-style") == "italic":
-                    el_string = el_string + "<i>" + el.text + "</i>"
-                else:
-                    el_string += el.text
-
-            else:
-                el_string += el.text
+    text = normalize_node_text("".join(
+        LINE_BREAK_MARK if isinstance(node, bs4.element.Tag) else node
+        for node in run))
 
-        if isinstance(el, bs4.element.NavigableString):
-            el_string = el_string + (el.string)
+    # BeautifulSoup заменяет строку из одних пробелов одним пробелом, так
+    # было и с текстом, нормализованным до разбора
+    if text.isspace():
+        text = " "
 
-    el_string = el_string + "</p>"
+    if len(run) == 1 and text == run[0]:
+        return
 
-    # Join doubled, trippled i in getted string and delete spaces
+    run[0].replace_with(bs4.element.NavigableString(text))
 
-    el_string = el_string.replace("</i><i>", "")
-    el_string = re.sub(r"</i>\s+<i>", " ", el_string)
-    el_string = re.sub(r"<i>\s+</i>", " ", el_string)
-    el_string = re.sub(r"\s+", " ", el_string)
-    el_string = re.sub(r"<p>\s+(.+)", r"<p>\1", el_string)
+    for node in run[1:]:
+        node.extract()
 
-    return el_string
 
-
-def get_ref_header(ref_node: bs4.BeautifulSoup):
+def get_ref_header(ref_node: "bs4.Tag"):
     """
     Gets a node with references list and returns name
     """
@@ -125,21 +145,27 @@ def get_ref_header(ref_node: bs4.BeautifulSoup):
     return ref_header
 
 
-def get_ref_list_html(ref_node, content_data):
+def get_ref_list_items(ref_node, style_index: StyleIndex) -> tuple:
+    """
+    Gets reference node and returns tuple of Reference records
+    """
+
+    return tuple(get_ref_element_item(element, style_index)
+                 for element in ref_node.find_all("text:p"))
+
+
+def get_pages_range(pages: str) -> str:
     """
-    Gets reference node and returns string containing reference list in HTML
-    format
+    Returns pages string with an en dash between the first and the last
+    page
     """
 
-    ref_node_str_html = ""
-    ref_element = ref_node.find_all("text:p")
+    result = PAGES_RANGE_REGEX.match(pages)
 
-    for element in ref_element:
-        ref_node_str_html = (
-            ref_node_str_html + clear_ref_element(element, content_data) + "\n"
-        )
+    if result is None:
+        return pages
 
-    return ref_node_str_html
+    return f"{result.group(1)}–{result.group(2)}{pages[result.end():]}"
 
 
 def get_info_from_citation_str_ru(citation_ru_str: str) -> dict:
@@ -147,73 +173,70 @@ def get_info_from_citation_str_ru(citation_ru_str: str) -> dict:
     Gets Russian citation string and returns dictionary of article params
     """
 
-    citation_info_ru_dict = {}
-
-    regex_ru_citation = re.compile(
-        r"^Для цитирования:\s+(.*?[А-ЯЁ]\.)\s+(.*)\s+\/\/.*\s+–\s+(\d\d\d\d)"
-        r"\.\s+–\s+Т\.\s+(\d+)\,\s+№\s+(\d+)\.\s+\–\s+С\.\s+(\d+\s\–\s+\d+)"
-    )
-
-    citation_ru_str = translit(citation_ru_str, "ru")
+    citation_ru_str = to_cyrillic(citation_ru_str)
 
-    result = regex_ru_citation.match(citation_ru_str)
+    result = CITATION_INFO_RU_REGEX.match(citation_ru_str)
 
     if result is None:
-        print(
-            "Что-то не так со строкой для цитирования - {0}."
-            " Программа аварийно завершена.".format(citation_ru_str)
-        )
-        sys.exit(1)
-
-    citation_info_ru_dict["authors_ru"] = re.sub(r"\s+", " ", result.group(1))
-    citation_info_ru_dict["article_name_ru"] = re.sub(
-        r"\s+", " ", result.group(2))
-    citation_info_ru_dict["year"] = result.group(3)
-    citation_info_ru_dict["volume"] = result.group(4)
-    citation_info_ru_dict["number_in_year"] = result.group(5)
-    citation_info_ru_dict["pages_range"] = re.sub(
-        r"^(\d+)[^\d]+(\d+)", r"\1–\2", result.group(6)
-    )
+        raise LayoutError(
+            "Что-то не так со строкой для цитирования - {0}.".format(
+                citation_ru_str))
 
-    return citation_info_ru_dict
+    authors, article_name, year, volume, number_in_year, pages = \
+        result.groups()
 
+    return {
+        "authors_ru": collapse_spaces(authors),
+        "article_name_ru": collapse_spaces(article_name),
+        "year": year,
+        "volume": volume,
+        "number_in_year": number_in_year,
+        "pages_range": get_pages_range(pages),
+    }
 
-def get_info_from_citation_str_en(citation_en_str: str) -> dict:
 
-    citation_info_en_dict = {}
+def build_citation_info_en_regex(registry):
+    """
+    Returns regex of English citation string with journal names of registry
+    """
 
-    regex_en_citation = re.compile(
+    return re.compile(
         r"Please cite this article as:\s+([a-zA-Z\s\.\'\,]+[A-Z][a-z]?\.)"
-        r"\s+(.*)\.\s+(Finance and Credit|Economic Analysis: Theory and "
-        r"Practice|Regional Economics: Theory and Practice|National "
-        r"Interests: Priorities and Security|Financial Analytics: Science "
-        r"and Experience|International Accounting|Digest Finance|Accounting "
-        r"in Budgetary and Non-Profit Organizations)\,\s+(\d\d\d\d)\,\svol\."
+        r"\s+(.*)\.\s+("
+        + "|".join(re.escape(journal.name_en)
+                   for journal in registry.journals)
+        + r")\,\s+(\d\d\d\d)\,\svol\."
         r"\s+(\d+)\,\s+iss\.\s+(\d+)\,\s+pp\.\s+(.*)\."
     )
 
-    citation_en_str = translit(citation_en_str, "ru", reversed=True)
 
-    result = regex_en_citation.match(citation_en_str)
+def get_info_from_citation_str_en(citation_en_str: str) -> dict:
+    """
+    Gets English citation string and returns dictionary of article params
+    """
+
+    citation_en_str = to_latin(citation_en_str)
+
+    # Выражение компилируется заново, только если в реестр добавлен журнал
+    result = REGISTRY.compiled(
+        "citation_en", build_citation_info_en_regex).match(citation_en_str)
 
     if result is None:
-        print(
-            "Что-то не так со строкой для цитирования - {0}."
-            " Программа аварийно завершена.".format(citation_en_str)
-        )
-        sys.exit(1)
-
-    citation_info_en_dict["authors_en"] = re.sub(r"\s+", " ", result.group(1))
-    citation_info_en_dict["article_name_en"] = re.sub(
-        r"\s+", " ", result.group(2))
-    citation_info_en_dict["year"] = result.group(4)
-    citation_info_en_dict["volume"] = result.group(5)
-    citation_info_en_dict["number_in_year"] = result.group(6)
-    citation_info_en_dict["pages_range"] = re.sub(
-        r"^(\d+)[^\d]+(\d+)", r"\1–\2", result.group(7)
-    )
+        raise LayoutError(
+            "Что-то не так со строкой для цитирования - {0}.".format(
+                citation_en_str))
 
-    return citation_info_en_dict
+    authors, article_name, _, year, volume, number_in_year, pages = \
+        result.groups()
+
+    return {
+        "authors_en": collapse_spaces(authors),
+        "article_name_en": collapse_spaces(article_name),
+        "year": year,
+        "volume": volume,
+        "number_in_year": number_in_year,
+        "pages_range": get_pages_range(pages),
+    }
 
 
 def compose_by_article_info_list(raw_info_list):
@@ -253,14 +276,269 @@ def compose_by_article_info_list(raw_info_list):
     return composed_by_article_info_list
 
 
+def get_citation_info(citation_str: str) -> tuple:
+    """
+    Gets citation paragraph text and returns tuple (lang, dictionary of
+    article params)
+    """
+
+    citation_str = clear_text(citation_str)
+
+    if CITATION_RU_REGEX.search(citation_str):
+        return ("ru", get_info_from_citation_str_ru(citation_str))
+
+    return ("en", get_info_from_citation_str_en(citation_str))
+
+
+# Строка для цитирования, которую не удалось разобрать: номер в списке,
+# текст и сообщение об ошибке
+CitationFailure = namedtuple("CitationFailure", ["index", "text", "error"])
+
+
+def parse_citations(citation_strs) -> tuple:
+    """
+    Parses citation paragraphs in one call. Returns tuple (results,
+    failures): results has (lang, dictionary of article params) for each
+    paragraph or None if it could not be parsed, failures is list of
+    CitationFailure. Never raises LayoutError, so a batch of strings from
+    many issues is parsed to the end.
+    """
+
+    results = []
+    failures = []
+
+    for index, citation_str in enumerate(citation_strs):
+        try:
+            results.append(get_citation_info(citation_str))
+        except LayoutError as error:
+            results.append(None)
+            failures.append(CitationFailure(index, citation_str, str(error)))
+
+    return (results, failures)
+
+
+def get_full_text_info(full_text: str) -> dict:
+    """
+    Gets article full text and returns dictionary with detected article
+    language and cleared text
+    """
+
+    cleared_text = clear_text(full_text)
+
+    article_lang = detect_language(cleared_text).lang
+    if article_lang not in ["ru", "en"]:
+        raise LayoutError("Язык основного текста статьи не распознан.")
+
+    return {"article_lang": article_lang, article_lang: cleared_text}
+
+
+def get_ref_list_lang(ref_header: str) -> str:
+    """
+    Returns language of references list by its header
+    """
+
+    if ref_header == "Список литературы":
+        return "ru"
+
+    return "en"
+
+
+def parse_rubric_str(rubric_str: str):
+    """
+    Gets rubric paragraph text and returns tuple (lang, rubric name). Returns
+    None for an empty paragraph.
+    """
+
+    if rubric_str == "":
+        return None
+
+    if RUBRIC_RU_REGEX.fullmatch(rubric_str[0].strip()):
+        return ("ru", to_cyrillic(rubric_str))
+
+    return ("en", to_latin(rubric_str))
+
+
+def get_abstract_html(abstract_paragraphs_list) -> str:
+    """
+    Gets texts of the paragraphs following the abstract header and returns
+    abstract in HTML format
+    """
+
+    abstract_paragraphs = []
+
+    for paragraph_text in abstract_paragraphs_list:
+        paragraph_text = collapse_spaces(paragraph_text)
+
+        if (PUBLISHER_REGEX.search(paragraph_text) is None
+                and paragraph_text != ""):
+            abstract_paragraphs.append("<p>")  # Add HTML tags
+            abstract_paragraphs.append(paragraph_text)
+            abstract_paragraphs.append("</p>\n")
+
+    return "".join(abstract_paragraphs)
+
+
+def parse_affiliation_str(affiliation_text: str) -> tuple:
+    """
+    Gets affiliation text of one article in one language and returns tuple
+    (lang, list of Affiliation records)
+    """
+
+    affiliation_text = squeeze_spaces(affiliation_text)
+
+    # Удаляем из абзаца подстроку "• Ответственный автор"
+    affiliation_text = CORRESPONDING_AUTHOR_REGEX.sub("", affiliation_text)
+
+    # Массив информации об авторах для данного блока аффилиацции
+    article_authors_list = []
+
+    # Выбираем в параграфе список строк авторских данных: место
+    # работы, e-mail, ORCID, SPIN - все авторы для одной статьи
+    author_data_list = find_author_data(str.strip(affiliation_text) + " ")
+
+    author_data_lang = ""
+
+    for author in author_data_list:
+        workplace = WORKPLACE_REGEX.sub(r"\2", str.strip(author[0]))
+
+        affiliation = Affiliation(workplace=collapse_spaces(workplace),
+                                  email=str.strip(author[1]),
+                                  orcid=str.strip(author[2]),
+                                  spin=str.strip(author[3]))
+
+        if author_data_lang == "":
+            if affiliation.spin == "":
+                author_data_lang = "en"
+            else:
+                author_data_lang = "ru"
+
+        article_authors_list.append(affiliation)
+
+    return (author_data_lang, article_authors_list)
+
+
+def parse_article_info_str(article_info_lang: str,
+                           article_info_str: str) -> dict:
+    """
+    Gets text of the article history cell and returns dictionary with
+    article history dates, UDK, JEL and keywords
+    """
+
+    article_info_dict = {}
+
+    article_info_str = collapse_spaces(article_info_str)
+
+    if article_info_lang == "ru":
+        res = ARTICLE_INFO_RU_REGEX.findall(article_info_str)
+
+        if res != None:
+            article_info_dict = {
+                "reg_number": str.strip(res[0][0]),
+                "received_date_ru": res[0][1],
+                "revised_date_ru": res[0][2],
+                "accepted_date_ru": res[0][3],
+                "available_date_ru": res[0][4],
+                "UDK": collapse_spaces(res[0][5]),
+                "JEL": collapse_spaces(res[0][6]),
+                "keywords_ru": collapse_spaces(res[0][7])
+            }
+    else:
+        res = ARTICLE_INFO_EN_REGEX.findall(article_info_str)
+        if res != None:
+            article_info_dict = {
+                "reg_number": str.strip(res[0][0]),
+                "received_date_en": res[0][1],
+                "revised_date_en": res[0][2],
+                "accepted_date_en": res[0][3],
+                "available_date_en": res[0][4],
+                "JEL": collapse_spaces(res[0][5]),
+                "keywords_en": collapse_spaces(to_latin(res[0][6]))
+            }
+
+    return article_info_dict
+
+
+def parse_pub_dates_list(pub_dates_text_list) -> dict:
+    """
+    Gets texts of the title page paragraphs with issue volume, number, month
+    and year and returns dictionary of Russian and English publication dates
+    """
+
+    pub_dates_text_list = [str.lower(x) for x in pub_dates_text_list]
+
+    date_str_ru = " ".join(pub_dates_text_list[:2])
+
+    date_str_en = " ".join(pub_dates_text_list[-2:])
+
+    res_ru = PUB_DATES_RU_REGEX.fullmatch(date_str_ru)
+    res_en = PUB_DATES_EN_REGEX.fullmatch(date_str_en)
+
+    pub_dates_ru_dict = {}
+    pub_dates_en_dict = {}
+
+    if res_ru != None:
+        pub_dates_ru_dict = {
+            "volume_ru": res_ru[1],
+            "issue_ru": res_ru[2],
+            "month_ru": res_ru[3],
+            "year_ru":  res_ru[4]
+        }
+
+    if res_en != None:
+        pub_dates_en_dict = {
+            "volume_en": res_en[1],
+            "issue_en": res_en[2],
+            "month_en": res_en[3],
+            "year_en":  res_en[4]
+        }
+
+    articles_pub_dates_dict = {"ru": pub_dates_ru_dict,
+                               "en": pub_dates_en_dict}
+
+    return articles_pub_dates_dict
+
+
+def parse_journal_name_list(footer_texts_list) -> dict:
+    """
+    Gets texts of page footers and returns dictionary with journal names in
+    Russian and English
+    """
+
+    # Собираем журналы, найденные в нижнем колонтитуле каждого из стилей
+    # страниц макета
+    cur_journals = set()
+
+    for footer_text in footer_texts_list:
+        journal = REGISTRY.find_journal(footer_text)
+
+        if journal is None:
+            # Еcли встречается хоть один колонтитул с названием не
+            # из списка, выкидываем исключение
+            raise LayoutError(
+                "Найденное название журнала отсутствует в списке."
+                " Неверно оформлен колонтитул макета.")
+
+        cur_journals.add(journal)
+
+    # Редакторы иногда оставляют стиль страницы из шаблона-примера.
+    # Из нескольких названий выбирается наибольшее через max(), как и
+    # прежде (число вхождений на выбор не влияло)
+    journal = max(cur_journals)
+
+    journal_name_dict = {
+        "journal_name_ru": journal.name_ru, "journal_name_en": journal.name_en
+    }
+
+    return journal_name_dict
+
+
 def parse_authors_list(authors_string):
     # Функция разбирает строку ФИО авторов в разделе аффилиации и возвращает
     # список с отдельным элементом для каждого ФИО
 
     authors_list = []
 
-    authors_string = re.sub(r"•,", "", authors_string)
-    authors_string = re.sub(r"•", "", authors_string)
+    authors_string = normalize_author_names(authors_string)
 
     authors_list = authors_string.split(",")
 
@@ -275,617 +553,750 @@ def parse_authors_list(authors_string):
                 del authors_list[i]
                 continue
 
-            cleared_author_name = re.sub(r"(.*)[a-zа-я]$", r"\1", author)
+            cleared_author_name = AUTHOR_NAME_SUPERSCRIPT_REGEX.sub(r"\1", author)
             cleared_author_name = cleared_author_name.rstrip()
             cleared_author_name = cleared_author_name.strip()
             authors_list[i] = cleared_author_name
 
-    author_name_ru_regex = re.compile(r"[а-яА-ЯёЁ\s\-\.]+")
-
-    lang = author_name_ru_regex.search(authors_list[0])
+    lang = AUTHOR_NAME_RU_REGEX.search(authors_list[0])
 
     if lang[0] == authors_list[0]:
         for i, author in enumerate(authors_list):
-            authors_list[i] = translit(author, "ru")
+            authors_list[i] = to_cyrillic(author)
 
         authors_list = ("ru", authors_list)
     else:
         for i, author in enumerate(authors_list):
-            authors_list[i] = translit(author, "ru", reversed=True)
+            authors_list[i] = to_latin(author)
 
         authors_list = ("en", authors_list)
 
     return authors_list
 
 
-class OdtParser:
-    def __init__(self, full_path_to_file):
-        file = OdtFile(full_path_to_file)
+class lazy_property:
+    """
+    Property computed on the first access and stored in the instance, so
+    repeated access is free. Computation is a stage of instrumentation
+    (odtparser.instrument).
+    """
 
-        # Clear data text from unwanted symbols, tags, etc.
-        content_data = clear_text(file.get_content_data())
+    def __init__(self, method):
+        self.method = method
+        self.name = method.__name__
+        self.__doc__ = method.__doc__
 
-        self.content_data = bs4.BeautifulSoup(content_data, "lxml-xml")
-        self.styles_data = bs4.BeautifulSoup(
-            file.get_styles_data(), "lxml-xml")
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
 
-    def get_article_references_list(self) -> list:
-        """
-        Returns a list with lists, containing both English an Russian
-        (or English only) references list in HTML format for each
-        article of issue.
-        """
+        with instrument.stage(self.name):
+            value = self.method(instance)
+        instance.__dict__[self.name] = value
 
-        references_list = []
+        return value
 
-        ref_nodes_list = self.content_data.find_all(
-            "text:list", {"text:style-name": re.compile("СтатьяСписокЛит")}
-        )
 
-        for ref_node in ref_nodes_list:
+# Paragraph of the document with its style name and text
+Paragraph = namedtuple("Paragraph", ["node", "style_name", "text"])
 
-            try:
-                ref_header = get_ref_header(ref_node).strip()
+# Article in the document body: positions of its blocks (see
+# OdtParser.body_nodes) are start <= position < stop
+ArticleRange = namedtuple("ArticleRange", ["start", "stop"])
 
-            except TypeError:
+# Kinds of body blocks, which delimit articles (see build_article_index)
+SECTION_NODE = "section"
+REFERENCES_NODE = "references"
 
-                print("Ошибка в оформлении списка литературы."
-                      " Программа аварийно завершена." 
-                      f" См. ниже: \n{ref_node.text}")
-                sys.exit(1)
+# Fields of one article, see OdtParser.extract_article_fields
+ARTICLE_FIELDS = ("citation_info", "article_abstracts", "article_rubrics",
+                  "article_full_texts", "full_author_names",
+                  "affiliation_info", "article_info", "article_references")
 
-            if ref_header == "Список литературы":
-                ref_lang = "ru"
-            else:
-                ref_lang = "en"
 
-            ref_str = get_ref_list_html(ref_node, self.content_data)
+def build_article_index(node_kinds) -> list:
+    """
+    Gets kinds of the body blocks (SECTION_NODE for an article full
+    text, REFERENCES_NODE for a references list, None for others) and
+    returns ArticleRange of each article.
+
+    An article ends with the last references list following its full text,
+    so rubric, citation and tables before a full text belong to its
+    article. The first article includes the title page of the issue, the
+    last one includes nodes after its references.
+    """
 
-            references_list.append((ref_lang, ref_str))
+    sections = [position for position, kind in enumerate(node_kinds)
+                if kind == SECTION_NODE]
 
-        composed_ref_list = compose_by_article_info_list(references_list)
+    article_index = []
+    start = 0
 
-        return composed_ref_list
+    for i, section in enumerate(sections):
+        if i + 1 == len(sections):
+            stop = len(node_kinds)
+        else:
+            stop = section + 1
 
-    def get_journal_name(self) -> dict:
-        """
-            Gets journal names from colontitle in Russian and English. Returns
-            tuple journal names.
-            """
+            for position in range(section + 1, sections[i + 1]):
+                if node_kinds[position] == REFERENCES_NODE:
+                    stop = position + 1
 
-        # Получаем список всех элементов style:footer и style:footer-left
-        # для дальнейшего поиска назаний журналов
-        footer_styles = self.styles_data.find_all(
-            ["style:footer-left", "style:footer"])
+        article_index.append(ArticleRange(start, stop))
+        start = stop
+
+    return article_index
 
-        # Формируем регулярное выражение для поиска
-        journal_names_ru_string = "|".join(JOURNAL_NAMES_RU_LIST)
-        regex_string = "(?:" + journal_names_ru_string + ")"
 
-        # Собираем названия журнала в нижнем колонтитуле каждого из стилей
-        # страниц макета в список cur_journal_names_list
-        cur_journal_names_list = []
+def get_article_item(items, name: str, number: int):
+    """
+    Returns the only item of the article field composed by articles.
+    Raises LayoutError if the article number (from 0) has no item or
+    several items of the field.
+    """
 
-        for footer_style in footer_styles:
-            footer_text = footer_style.text
-            res = re.search(regex_string, footer_text)
+    if len(items) != 1:
+        raise LayoutError(
+            f"Статья {number + 1}: не удалось выделить поле {name}."
+            " Неверно оформлен макет статьи.")
 
-            try:
-                if res:
-                    cur_journal_names_list.append(res.group())
-                else:
-                    # Еcли встречается хоть один колонтитул с названием не
-                    # из списка, выкидываем исключение
-                    raise ValueError()
-            except ValueError:
-                print(
-                    " Найденное название журнала отсутствует в списке.\n",
-                    "Неверно оформлен колонтитул макета.\n",
-                    "Программа аварийно завершена.",
-                )
-                sys.exit(1)
+    return items[0]
+
+
+class OdtParser:
+    """
+    Parser of journal issue layout. Every field is computed lazily on the
+    first access and cached, fields share one index of the paragraphs.
+    Fields of a single article are extracted from its nodes only (see
+    article_index and extract_article_fields).
+    """
 
-        # Множество уникальных названий в нижнем колонтитуле макета
-        cur_journal_names_set = set(cur_journal_names_list)
+    def __new__(cls, full_path_to_file=None, backend="bs4"):
+        # OdtParser(path, backend="lxml") создает парсер выбранного бэкенда
+        if cls is OdtParser:
+            cls = get_parser_class(backend)
 
-        # Редакторы иногда оставляют стиль страницы из шаблона-примера.
-        # Чтобы выбрать правильное название журнала, вводим алгоритм выбора
-        # наиболее часто встречающегося названия.
+        return super().__new__(cls)
 
-        # Собираем количество вхождений каждого названия
-        # в cur_journals_dict.
+    def __init__(self, full_path_to_file, backend="bs4"):
+        # Путь, bytes или file-like объект (см. OdtFile). Архив открывается
+        # только на время чтения.
+        self.source = full_path_to_file
 
-        # Словарь содержащий название журнала и количество его вхождений
-        # в колонтитулы журнала.
-        uniq_journals_dict = {}
+    @lazy_property
+    def content_data(self):
+        import bs4
 
-        for uniq_journal_value in cur_journal_names_set:
-            number_of_entries = 0
+        with OdtFile(self.source) as file:
+            with file.open_member(CONTENT_XML) as content_file:
+                content_soup = bs4.BeautifulSoup(content_file, "lxml-xml")
 
-            for name in cur_journal_names_list:
-                if name == uniq_journal_value:
-                    number_of_entries += 1
+        normalize_soup_text(content_soup)
+        if instrument.is_active():
+            instrument.count("nodes", len(content_soup.find_all(True)))
 
-            uniq_journals_dict[uniq_journal_value] = number_of_entries
-        # Выбираем наиболее часто встречающееся название журнала через
-        # функцию max()
-        journal_name_ru = max(uniq_journals_dict.keys())
+        return content_soup
 
-        i = JOURNAL_NAMES_RU_LIST.index(journal_name_ru)
+    @lazy_property
+    def styles_data(self):
+        import bs4
 
-        journal_name_en = JOURNAL_NAMES_EN_LIST[i]
+        with OdtFile(self.source) as file:
+            with file.open_member(STYLES_XML) as styles_file:
+                styles_soup = bs4.BeautifulSoup(styles_file, "lxml-xml")
 
-        journal_name_dict = {
-            "journal_name_ru": journal_name_ru, "journal_name_en": journal_name_en
-        }
+        if instrument.is_active():
+            instrument.count("nodes", len(styles_soup.find_all(True)))
 
-        return journal_name_dict
+        return styles_soup
 
-    def get_number_of_articles_in_issue(self) -> int:
+    @lazy_property
+    def style_index(self):
+        return StyleIndex.from_soup(self.styles_data, self.content_data)
+
+    @lazy_property
+    def paragraphs(self):
         """
-        Gets quantity of articles in issue
+        List of all text:p elements of the document in document order with
+        their style names and texts
         """
 
-        number_of_articles = 0
-        for element in self.content_data.find_all("text:p"):
-            if "Please cite this article as:" in element.text:
-                number_of_articles += 1
+        return [self._paragraph(node)
+                for node in self.content_data.find_all("text:p")]
 
-        return number_of_articles
+    @lazy_property
+    def body_nodes(self) -> list:
+        """
+        Blocks of the document body, which articles consist of: children of
+        office:text. A container of full text sections or references lists
+        (e.g. a section with columns) is replaced by its children, so
+        articles are delimited at any depth.
+        """
 
-    def get_citation_paragraphs_list(self) -> list:
+        body = self._body_node()
+        if body is None:
+            return []
+
+        return self._article_blocks(self._child_nodes(body))
+
+    def _article_blocks(self, nodes) -> list:
+        blocks = []
+
+        for node in nodes:
+            if (not self._is_article_block(node)
+                    and any(self._is_article_block(descendant)
+                            for descendant in self._block_descendants(node))):
+                blocks.extend(self._article_blocks(self._child_nodes(node)))
+            else:
+                blocks.append(node)
+
+        return blocks
+
+    def _is_article_block(self, node) -> bool:
+        return self._is_full_text_section(node) or self._is_ref_list(node)
+
+    @lazy_property
+    def article_index(self) -> list:
         """
-        Gets citation paragraphs from entire issue and returns dictionary with
-        keys.
-        For Russian citation:
-        authors_ru, article_name_ru, year, volume, number_in_year,
-        pages_range
-        For English citation:
-        authors_en, article_name_ru, year, volume, number_in_year, pages_range
+        ArticleRange of each article in body_nodes
+        """
+
+        node_kinds = []
+
+        for node in self.body_nodes:
+            if self._is_full_text_section(node):
+                node_kinds.append(SECTION_NODE)
+            elif self._is_ref_list(node):
+                node_kinds.append(REFERENCES_NODE)
+            else:
+                node_kinds.append(None)
+
+        return build_article_index(node_kinds)
+
+    @lazy_property
+    def body_positions(self) -> dict:
+        """
+        Positions of the blocks in body_nodes by id of the node
+        """
+
+        return {id(node): position
+                for position, node in enumerate(self.body_nodes)}
 
+    @lazy_property
+    def article_numbers(self) -> list:
+        """
+        Number of the article of each block of body_nodes
         """
 
-        raw_info_list = []
+        article_numbers = []
+        for number, article_range in enumerate(self.article_index):
+            article_numbers.extend(
+                [number] * (article_range.stop - article_range.start))
 
-        citation_regex = re.compile(
-            r"Для цитирования:|Please cite this " r"article as:"
-        )
+        return article_numbers
+
+    def _styled_paragraphs(self, style_regex, parent_style_names,
+                           paragraphs):
+        """
+        Returns paragraphs with style names matching style_regex. Automatic
+        styles inherited from parent_style_names are matched as their
+        parents.
+        """
 
-        for element in self.content_data.find_all("text:p"):
+        return [
+            paragraph for paragraph in paragraphs
+            if style_regex.search(self.style_index.resolve(
+                paragraph.style_name, parent_style_names))
+        ]
 
-            ru_citation_regex = re.compile(r"Для цитирования")
-            search_result = citation_regex.search(element.text)
+    def _following_texts(self, node) -> list:
+        """
+        Texts of the nodes following node within its parent. For a
+        block of body_nodes the texts end with its article.
+        """
 
-            if search_result:
-                citation_element_str = clear_text(element.text)
-                if ru_citation_regex.search(citation_element_str):
-                    raw_info_list.append(
-                        ("ru", get_info_from_citation_str_ru(citation_element_str))
-                    )
-                else:
-                    raw_info_list.append(
-                        ("en", get_info_from_citation_str_en(citation_element_str))
-                    )
+        position = self.body_positions.get(id(node))
+        if position is None:
+            return self._sibling_texts(node)
 
-        composed_cit_info_list = compose_by_article_info_list(raw_info_list)
+        if self.article_numbers:
+            stop = self.article_index[self.article_numbers[position]].stop
+        else:
+            stop = len(self.body_nodes)
 
-        return composed_cit_info_list
+        return [self._node_text(sibling)
+                for sibling in self.body_nodes[position + 1:stop]]
 
-    def get_article_abstracts_list(self) -> list:
+    # Операции над узлами, которые зависят от дерева бэкенда
+
+    @staticmethod
+    def _paragraph(node) -> Paragraph:
+        return Paragraph(node, node.get("text:style-name", ""), node.text)
+
+    @staticmethod
+    def _node_paragraphs(node) -> list:
         """
-        Gets article abstracts in English and Russian (if exists). 
+        text:p elements of node including node itself in document order
         """
 
-        p_tags = self.content_data.find_all("text:p")
+        paragraphs = node.find_all("text:p")
 
-        abstracts_list = []  # List of annotations to all articles of issue
+        if node.prefix == "text" and node.name == "p":
+            return [node] + paragraphs
 
-        for p_tag in p_tags:
-            if re.search(r"Аннотация|Abstract", p_tag.text):
-                lang = ""
-                abstract = ""
-                abstract_paragraphs = []  # List of all abstracts of
-                # paragraph
+        return paragraphs
 
-                if "Аннотация" in p_tag.text:
-                    lang = "ru"
-                else:
-                    lang = "en"
+    def _body_node(self):
+        return self.content_data.find("office:text")
 
-                for sibling in p_tag.next_siblings:  # Gather all siblings
-                    # of p tag, containing string "Abstract" or
-                    # "Аннотация"
-                    paragraph_text = re.sub(r"\s+", " ", sibling.text)
+    @staticmethod
+    def _child_nodes(node) -> list:
+        import bs4
 
-                    if (
-                        re.search(
-                            r"Издательский дом ФИНАНСЫ и КРЕДИТ|"
-                            r"Publishing house FINANCE and CREDIT",
-                            paragraph_text,
-                        )
-                        == None
-                        and paragraph_text != ""
-                    ):
-                        abstract_paragraphs.append("<p>")  # Add HTML tags
-                        abstract_paragraphs.append(paragraph_text)
-                        abstract_paragraphs.append("</p>\n")
+        return [child for child in node.children
+                if isinstance(child, bs4.Tag)]
 
-                abstracts_list.append(
-                    (lang, abstract.join(abstract_paragraphs)))
+    @staticmethod
+    def _block_descendants(node):
+        """
+        Sections and lists inside node
+        """
 
-        composed_abstracts_list = compose_by_article_info_list(abstracts_list)
+        return node.find_all(["text:section", "text:list"])
 
-        return composed_abstracts_list
+    @staticmethod
+    def _node_text(node) -> str:
+        return node.text
 
-    def get_article_rubrics_list(self):
+    @staticmethod
+    def _sibling_texts(node) -> list:
+        """
+        Texts of the nodes following node within its parent
+        """
 
-        style_name_ru = "СтатьяРубрикаРус"
-        style_name_en = "СтатьяРубрикаАнгл"
+        return [sibling.text for sibling in node.next_siblings]
 
-        correct_tree(self.content_data, style_name_ru, "text:p")
-        correct_tree(self.content_data, style_name_en, "text:p")
+    @staticmethod
+    def _single_string(node):
+        """
+        The only string inside node or None
+        """
 
-        rubric_nodes_list = self.content_data.find_all(
-            "text:p", {"text:style-name": re.compile(r"СтатьяРубрика")}
-        )
+        return node.string
 
-        rubric_names_list = []
-        composed_rubric_names_list = []
+    @staticmethod
+    def _cell_style_name(node) -> str:
+        """
+        Style name of the table cell containing node
+        """
 
-        ru_regex = re.compile(r"^[а-яА-ЯёЁ\s\.\,\-]+")
+        return node.parent["table:style-name"]
 
-        for element in rubric_nodes_list:
+    @staticmethod
+    def _is_full_text_section(node) -> bool:
+        return (node.prefix == "text" and node.name == "section"
+                and FULL_TEXT_SECTION_REGEX.search(
+                    node.get("text:name", "")) is not None)
 
-            element = element.text
+    @staticmethod
+    def _is_ref_list(node) -> bool:
+        return (node.prefix == "text" and node.name == "list"
+                and REF_LIST_STYLE_REGEX.search(
+                    node.get("text:style-name", "")) is not None)
 
-            res = ru_regex.fullmatch(element[0].strip())
+    def _full_text_sections(self) -> list:
+        """
+        Article full text sections of the issue
+        """
 
-            if element != "":
-                if res != None:
-                    rubric_names_list.append(("ru",
-                                    translit(element, "ru")))
-                else:
-                    rubric_names_list.append(("en", 
-                                    translit(element, "ru", reversed=True)))
+        return self.content_data.find_all(
+            "text:section", {"text:name": FULL_TEXT_SECTION_REGEX})
 
-        composed_rubric_names_list = compose_by_article_info_list(
-            rubric_names_list)
+    def _ref_lists(self) -> list:
+        """
+        References lists of the issue
+        """
 
-        return composed_rubric_names_list
+        return self.content_data.find_all(
+            "text:list", {"text:style-name": REF_LIST_STYLE_REGEX})
 
-    def get_article_full_texts_list(self) -> list:
+    def _reference_item(self, ref_node) -> tuple:
         """
-            Метод возвращает список полных текстов всех статей выпуска журнала.
-            """
+        Returns tuple (lang, tuple of Reference records)
+        """
+
+        try:
+            ref_header = get_ref_header(ref_node).strip()
 
-        full_texts_list = []
+        except TypeError:
+            raise LayoutError("Ошибка в оформлении списка литературы."
+                              f" См. ниже: \n{ref_node.text}")
 
-        full_text_nodes_list = self.content_data.find_all(
-            "text:section", {"text:name": re.compile(r"Раздел|Статья")}
-        )
+        ref_lang = get_ref_list_lang(ref_header)
 
-        for text_node in full_text_nodes_list:
+        return (ref_lang, get_ref_list_items(ref_node, self.style_index))
 
-            # Добавляем пробелы и скобки перед и после подстраничных сносок.
-            footnotes_list = text_node.find_all(
-                "text:note", {"text:note-class": "footnote"}
-            )
-            for note in footnotes_list:
-                note_body = note.find("text:note-body")
-                text = note_body.get_text()
-                note.string = " (" + text + ") "
+    # Извлечение полей из абзацев и узлов выпуска или одной статьи. Методы
+    # возвращают списки (lang, данные) до объединения по статьям
 
-            # Добавляем тире перед элементами списка
-            list_tags_list = text_node.find_all("text:list-item")
+    def _citation_items(self, paragraphs) -> list:
+        results, failures = parse_citations(
+            [paragraph.text for paragraph in paragraphs
+             if CITATION_REGEX.search(paragraph.text)])
+
+        # Сообщаем обо всех ошибочных строках выпуска сразу
+        if failures:
+            raise LayoutError("\n".join(failure.error
+                                         for failure in failures))
+
+        return results
+
+    def _abstract_items(self, paragraphs) -> list:
+        abstracts_list = []
+
+        for paragraph in paragraphs:
+            if ABSTRACT_REGEX.search(paragraph.text):
+                if "Аннотация" in paragraph.text:
+                    lang = "ru"
+                else:
+                    lang = "en"
 
-            for list_tag in list_tags_list:
-                text = list_tag.get_text()
-                list_tag.string = "- " + text + "\n"
+                # Gather siblings of p tag, containing string "Abstract" or
+                # "Аннотация", up to the end of the article
+                abstract = get_abstract_html(
+                    self._following_texts(paragraph.node))
 
-            # Добавляем пробелы перед и после тега text:p
-            p_tags_list = text_node.find_all("text:p")
+                abstracts_list.append((lang, abstract))
 
-            for p_tag in p_tags_list:
-                text = p_tag.get_text()
-                p_tag.string = text + "\n"
+        return abstracts_list
 
-            # Добавляем пробелы перед и после тега text:span
-            span_tags_list = text_node.find_all("text:span")
+    def _rubric_items(self, paragraphs) -> list:
+        style_name_ru = "СтатьяРубрикаРус"
+        style_name_en = "СтатьяРубрикаАнгл"
 
-            for span_tag in span_tags_list:
-                text = span_tag.get_text()
-                span_tag.string = " " + text + " "
+        rubric_names_list = []
 
-            cleared_text = clear_text(text_node.get_text())
+        for paragraph in self._styled_paragraphs(
+                RUBRIC_STYLE_REGEX, (style_name_ru, style_name_en),
+                paragraphs):
+            rubric_name = parse_rubric_str(paragraph.text)
 
-            short_text = cleared_text[:1000]
-            article_lang = langdetect.detect(short_text)
-            try:
-                if article_lang not in ["ru", "en"]:
-                    raise ValueError
-            except ValueError:
-                print(r"Язык основного текста статьи не распознан. Программа"
-                      r" остановлена.")
-                sys.exit(1) 
+            if rubric_name is not None:
+                rubric_names_list.append(rubric_name)
 
-            full_texts_list.append(
-                {"article_lang": article_lang, article_lang: cleared_text}
-            )
+        return rubric_names_list
 
-        return full_texts_list
+    def _full_text_items(self, sections) -> list:
+        return [get_full_text_info(render_full_text(section))
+                for section in sections]
 
-    def get_full_author_names_list(self):
-        # Метод возвращает список списков полных авторских ФИО, взятых из
-        # аффилиации. Пример: ['Евгений Васильевич ПОПОВ',
-        # 'Виктория Львовна СИМОНОВА', 'Анна Дмитриевна ТИХОНОВА']
+    def _author_names_items(self, paragraphs) -> list:
         style_name_ru = r"СтатьяАвторыРус"
         style_name_en = r"СтатьяАвторыАнгл"
 
-        correct_tree(self.content_data, style_name_ru, "text:p")
-        correct_tree(self.content_data, style_name_en, "text:p")
+        return [parse_authors_list(paragraph.text)
+                for paragraph in self._styled_paragraphs(
+                    AUTHORS_STYLE_REGEX, (style_name_ru, style_name_en),
+                    paragraphs)]
+
+    def _affiliation_items(self, paragraphs) -> list:
+        style_name_ru = "СтатьяАффилиацияРус"
+        style_name_en = "СтатьяАффилиацияАнгл"
+
+        # Создаем словарь, в котором ключами будут стили таблиц, содержащих
+        # аффилиацию, а значениями тексты всех абзацев стиля
+        # СтатьяАффилиацияРус. Тем самым мы группируем абзацы (тег p),
+        # относящиеся к одной статье
+        articles_affiliation_dict = OrderedDict()
+
+        # Распределяем абзацы со стилем СтатьяАффилиацияРус и
+        # СтатьяАффилиацияАнгл по принадлежности к статьям (через parent-тег
+        # table:style-name)
+        for paragraph in self._styled_paragraphs(
+                AFFILIATION_STYLE_REGEX, (style_name_ru, style_name_en),
+                paragraphs):
+            # Имя стиля таблицы, в которой находится аффилиация
+            table_style_name = self._cell_style_name(paragraph.node)
+
+            # Add space to every paragraph to prevent joining of strings
+            articles_affiliation_dict.setdefault(
+                table_style_name, []).append(paragraph.text + " ")
 
-        style_name_regex = re.compile(r"СтатьяАвторыРус|СтатьяАвторыАнгл")
+        # Собираем список элементов для каждой статьи
+        return [
+            parse_affiliation_str("".join(affiliation_texts))
+            for affiliation_texts in articles_affiliation_dict.values()
+        ]
 
-        author_nodes_list = self.content_data.find_all(
-            "text:p", {"text:style-name": style_name_regex}
-        )
+    def _article_info_items(self, paragraphs) -> list:
+        issue_articles_info_list = []
 
-        author_strings_list = []
-        for authors in author_nodes_list:
-            author_strings_list.append(parse_authors_list(re.sub(
-                r"\s+", " ", authors.text)))
+        for paragraph in paragraphs:
+            p_string = self._single_string(paragraph.node)
 
-        composed_authors_names_list = compose_by_article_info_list(
-            author_strings_list)
+            if p_string is None or not ARTICLE_INFO_REGEX.search(p_string):
+                continue
+
+            if str.strip(paragraph.text) == "История статьи:":
+                article_info_lang = "ru"
+            else:
+                article_info_lang = "en"
 
-        return composed_authors_names_list
+            article_p_list = self._sibling_texts(paragraph.node)
 
-    def get_affiliation_info_list(self):
+            article_info_dict = parse_article_info_str(
+                article_info_lang, " ".join(article_p_list))
+
+            issue_articles_info_list.append((article_info_lang,
+                                             article_info_dict))
+
+        return issue_articles_info_list
+
+    def _reference_items(self, ref_nodes) -> list:
+        return [self._reference_item(ref_node) for ref_node in ref_nodes]
+
+    @lazy_property
+    def article_references(self) -> list:
         """
-        Метод возвращает список списков словарей данных об авторах (место
-        работы, e-mail, ORCID и SPIN-код)
+        List with lists, containing both English an Russian (or English
+        only) references lists (tuples of Reference records) for each article
+        of issue.
         """
 
-        style_name_ru = "СтатьяАффилиацияРус"
-        style_name_en = "СтатьяАффилиацияАнгл"
+        return compose_by_article_info_list(
+            self._reference_items(self._ref_lists()))
 
-        # Корректируем контент-файл для однообразности именования стилей тега p
-        correct_tree(self.content_data, style_name_ru, "text:p")
-        correct_tree(self.content_data, style_name_en, "text:p")
+    @lazy_property
+    def journal_name(self) -> dict:
+        """
+        Journal names from colontitle in Russian and English.
+        """
 
-        # Список, содержащий данные из аффилиаций всех статей
-        issue_affiliation_list = []
+        # Получаем список всех элементов style:footer и style:footer-left
+        # для дальнейшего поиска назаний журналов
+        footer_styles = self.styles_data.find_all(
+            ["style:footer-left", "style:footer"])
 
-        # Создаем словарь, в котором ключами будут стили таблиц, содержащих
-        # аффилиацию, а значениями списки всех нод стиля СтатьяАффилиацияРус.
-        # Тем самым мы группируем ноды (тег p), относящиеся к одной статье
-        articles_affiliation_dict = OrderedDict()
+        return parse_journal_name_list(
+            [footer_style.text for footer_style in footer_styles])
 
-        affiliation_regex = re.compile(r"СтатьяАффилиация")
+    @lazy_property
+    def number_of_articles(self) -> int:
+        """
+        Quantity of articles in issue
+        """
 
-        # Список всех тегов p со стилем СтатьяАффилиацияРус и
-        # СтатьяАффилиацияАнгл
-        affiliation_nodes_list = self.content_data.find_all(
-            "text:p", {"text:style-name": affiliation_regex}
-        )
+        number_of_articles = 0
+        for paragraph in self.paragraphs:
+            if CITATION_EN_MARK in paragraph.text:
+                number_of_articles += 1
 
-        # Распределяем теги по принадлежности к статьям (через parent-тег
-        # table:style-name)
-        for node in affiliation_nodes_list:
-            table = node.parent  # Узел элемента table, в котором находится
-            # аффилиация
-            table_style_name = table["table:style-name"]  # Имя стиля таблицы
-            # Add space to every node to prevent joining of strings
-            node.append(bs4.BeautifulSoup(
-                "<text:span> </text:span>", "lxml-xml"))
-
-            if table_style_name in articles_affiliation_dict:
-                articles_affiliation_dict[table_style_name].append(node)
-            else:
-                articles_affiliation_dict[table_style_name] = node
+        return number_of_articles
 
-        # Собираем список элементов для каждой статьи
-        for affiliation in articles_affiliation_dict.keys():
-            affiliation_text = articles_affiliation_dict[affiliation].text
-            affiliation_text = str.strip(re.sub(r"\s+", " ", affiliation_text))
+    @lazy_property
+    def citation_info(self) -> list:
+        """
+        Citation paragraphs from entire issue as dictionaries with keys.
+        For Russian citation:
+        authors_ru, article_name_ru, year, volume, number_in_year,
+        pages_range
+        For English citation:
+        authors_en, article_name_ru, year, volume, number_in_year, pages_range
 
-            # Удаляем из абзаца подстроку "• Ответственный автор"
-            affiliation_text = re.sub(
-                r"•[\s]+Ответственный[\s]+автор|•[\s]+Corresponding[\s]"
-                r"+author",
-                "",
-                affiliation_text,
-            )
+        """
 
-            # Массив информации об авторах для данного блока аффилиацции
-            article_authors_list = []
+        return compose_by_article_info_list(
+            self._citation_items(self.paragraphs))
 
-            # Выбираем в параграфе список строк авторских данных: место
-            # работы, e-mail, ORCID, SPIN - все авторы для одной статьи
-            author_data_list = re.findall(
-                r"(?P<workplace>[0-9a-zA-Zа-яА-ЯёЁ\&\s,\(\)\.\«\»\-\;\']+?)\b"
-                r"(?P<email>[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~\-]+@[a-zA-Z0-9.\-]"
-                r"+\.[a-zA-Z]{2,})\b\s+\b(?P<orcid>https://orcid.org[/\dX\-]"
-                r"+|ORCID:\snot\savailable|ORCID:\sотсутствует)?\s"
-                r"(?P<spin>SPIN-код:\s\d\d\d\d-\d\d\d\d|SPIN-код:\s"
-                r"отсутствует)?",
-                str.strip(affiliation_text) + " ",
-            )
+    @lazy_property
+    def article_abstracts(self) -> list:
+        """
+        Article abstracts in English and Russian (if exists). 
+        """
 
-            author_data_lang = ""
+        return compose_by_article_info_list(
+            self._abstract_items(self.paragraphs))
+
+    @lazy_property
+    def article_rubrics(self) -> list:
+        """
+        Article rubrics in Russian and English
+        """
 
-            for author in author_data_list:
-                workplace = re.sub(
-                    r"^([a-zаесор]\s)?(.*)", r"\2", str.strip(author[0]))
+        return compose_by_article_info_list(
+            self._rubric_items(self.paragraphs))
 
-                author_dict = {
-                    "workplace": re.sub(r"\s+", " ", workplace),
-                    "email": str.strip(author[1]),
-                    "orcid": str.strip(author[2]),
-                    "spin": str.strip(author[3]),
-                }
+    @lazy_property
+    def article_full_texts(self) -> list:
+        """
+            Список полных текстов всех статей выпуска журнала.
+            """
 
-                if author_data_lang == "":
-                    if author_dict["spin"] == "":
-                        author_data_lang = "en"
-                    else:
-                        author_data_lang = "ru"
+        return self._full_text_items(self._full_text_sections())
 
-                article_authors_list.append(author_dict)
+    @lazy_property
+    def full_author_names(self) -> list:
+        """
+        Списки полных авторских ФИО, взятых из аффилиации. Пример:
+        ['Евгений Васильевич ПОПОВ', 'Виктория Львовна СИМОНОВА',
+        'Анна Дмитриевна ТИХОНОВА']
+        """
 
-            issue_affiliation_list.append(
-                (author_data_lang, article_authors_list))
+        return compose_by_article_info_list(
+            self._author_names_items(self.paragraphs))
 
-        composed_info = compose_by_article_info_list(issue_affiliation_list)
+    @lazy_property
+    def affiliation_info(self) -> list:
+        """
+        Списки словарей данных об авторах (место работы, e-mail, ORCID и
+        SPIN-код)
+        """
 
-        return composed_info
+        return compose_by_article_info_list(
+            self._affiliation_items(self.paragraphs))
 
-    def get_through_issue_number(self):
+    @lazy_property
+    def through_issue_number(self) -> str:
         """
-        Метод возвращает сквозной номер выпуска 
+        Сквозной номер выпуска 
         """
 
         through_issue_number = ""
 
-        p_list = self.content_data.find_all("text:p")
-
-        for p in p_list:
-            res = re.search(
-                r".*Валовый\s+\(сквозной\)\s+номер\s+(\d+)\s+", p.text)
+        for paragraph in self.paragraphs:
+            res = THROUGH_ISSUE_NUMBER_REGEX.search(paragraph.text)
             if res != None:
                 through_issue_number = res.group(1)
                 break
 
         return through_issue_number
 
-    def get_article_info_list(self):
+    @lazy_property
+    def article_info(self) -> list:
         """
-        Метод получает информацию из ячейки таблицы, содержащей строку
-        'История статьи:' - Даты истории статьи, УДК, JEL, ключевые слова.
-        Возвращает список словарей.
+        Информация из ячейки таблицы, содержащей строку 'История статьи:' -
+        Даты истории статьи, УДК, JEL, ключевые слова. Список словарей.
         """
 
-        issue_articles_info_list = []
+        return compose_by_article_info_list(
+            self._article_info_items(self.paragraphs))
 
-        article_info_list = []
+    @lazy_property
+    def issue_pub_dates(self) -> dict:
+        """
+        Том, выпуск, месяц и год выпуска на русском и английском языках
+        """
 
-        re_text = re.compile(r"История статьи:|Article history:")
+        return parse_pub_dates_list([
+            paragraph.text for paragraph in self.paragraphs
+            if PUB_DATES_STYLE_REGEX.search(paragraph.style_name)
+        ])
 
-        article_info_list = self.content_data.find_all("text:p", text=re_text)
+    def extract_article_fields(self, number: int) -> dict:
+        """
+        Extracts fields of the article number (from 0) scanning only its
+        nodes. Keys are ARTICLE_FIELDS, values are the items of the issue
+        fields for the article: for a well formed layout
+        extract_article_fields(i)["citation_info"] is citation_info[i].
+        """
 
-        for p_el in article_info_list:
+        article_range = self.article_index[number]
+        nodes = self.body_nodes[article_range.start:article_range.stop]
+
+        paragraphs = [self._paragraph(paragraph_node) for node in nodes
+                      for paragraph_node in self._node_paragraphs(node)]
+
+        article_items = {
+            "citation_info": self._citation_items(paragraphs),
+            "article_abstracts": self._abstract_items(paragraphs),
+            "article_rubrics": self._rubric_items(paragraphs),
+            "article_full_texts": self._full_text_items(
+                [node for node in nodes if self._is_full_text_section(node)]),
+            "full_author_names": self._author_names_items(paragraphs),
+            "affiliation_info": self._affiliation_items(paragraphs),
+            "article_info": self._article_info_items(paragraphs),
+            "article_references": self._reference_items(
+                [node for node in nodes if self._is_ref_list(node)]),
+        }
 
-            article_info_list = []
+        article_fields = {}
+        for name in ARTICLE_FIELDS:
+            items = article_items[name]
 
-            article_info_lang = ""
+            # Полный текст статьи не объединяется по языкам
+            if name != "article_full_texts":
+                items = compose_by_article_info_list(items)
 
-            article_p_list = []
+            article_fields[name] = get_article_item(items, name, number)
 
-            article_info_dict = {}
+        return article_fields
 
-            if str.strip(p_el.text) == "История статьи:":
-                article_info_lang = "ru"
-            else:
-                article_info_lang = "en"
+    def iter_articles(self):
+        """
+        Yields issue fields (journal_name, issue_pub_dates,
+        through_issue_number) first, then fields of each article (see
+        extract_article_fields). Fields of the articles are not stored in
+        the parser.
+        """
 
-            for el in p_el.next_siblings:
-                article_p_list.append(el.text)
-
-            article_info_str = " ".join(article_p_list)
-
-            article_info_str = re.sub(r"\s+", " ", article_info_str)
-
-            article_info_ru_regex = re.compile(
-                r"(.*)?Получена\s+(\d\d.\d\d.\d\d\d\d).*Получена.*?"
-                r"(\d\d.\d\d.\d\d\d\d).*Одобрена.*?(\d\d.\d\d.\d\d\d\d).*"
-                r"Доступна онлайн.*?(\d\d.\d\d.\d\d\d\d).*?УДК:?\s(.*)\s+JEL:\s+"
-                r"(.*)\s+Ключевые слова:\s+(.*)"
-            )
-
-            article_info_en_regex = re.compile(
-                r"(.*)?Received\s+(\d?\d\s\S+\s\d\d\d\d)\s+Received\sin\srevised."
-                r"*?(\d?\d\s\S+\s\d\d\d\d)\s+Accepted\s.*?(\d?\d\s\S+\s\d\d\d"
-                r"\d)\s+Available\sonline\s.*?(\d?\d\s\S+\s\d\d\d\d)\s+JEL"
-                r"\sclassification:\s+(.*)\s+Keywords:\s(.*)"
-            )
-
-            if article_info_lang == "ru":
-                res = article_info_ru_regex.findall(article_info_str)
-
-                if res != None:
-                    article_info_dict = {
-                        "reg_number": str.strip(res[0][0]),
-                        "received_date_ru": res[0][1],
-                        "revised_date_ru": res[0][2],
-                        "accepted_date_ru": res[0][3],
-                        "available_date_ru": res[0][4],
-                        "UDK": re.sub(r"\s+", " ", res[0][5]),
-                        "JEL": re.sub(r"\s+", " ", res[0][6]),
-                        "keywords_ru": re.sub(r"\s+", " ", res[0][7])
-                    }
-            else:
-                res = article_info_en_regex.findall(article_info_str)
-                if res != None:
-                    article_info_dict = {
-                        "reg_number": str.strip(res[0][0]),
-                        "received_date_en": res[0][1],
-                        "revised_date_en": res[0][2],
-                        "accepted_date_en": res[0][3],
-                        "available_date_en": res[0][4],
-                        "JEL": re.sub(r"\s+", " ", res[0][5]),
-                        "keywords_en": re.sub(r"\s+", " ", translit(res[0][6],
-                                                        "ru", reversed=True))
-                    }
+        yield {
+            "journal_name": self.journal_name,
+            "issue_pub_dates": self.issue_pub_dates,
+            "through_issue_number": self.through_issue_number,
+        }
 
-            issue_articles_info_list.append((article_info_lang,
-                                             article_info_dict))
+        for number in range(len(self.article_index)):
+            yield self.extract_article_fields(number)
+
+    def get_article_references_list(self) -> list:
+        return self.article_references
 
-        composed_info = compose_by_article_info_list(issue_articles_info_list)
+    def get_journal_name(self) -> dict:
+        return self.journal_name
 
-        return composed_info
+    def get_number_of_articles_in_issue(self) -> int:
+        return self.number_of_articles
 
-    def get_issue_pub_dates_dict(self):
+    def get_citation_paragraphs_list(self) -> list:
+        return self.citation_info
+
+    def get_article_abstracts_list(self) -> list:
+        return self.article_abstracts
 
-        re_text = re.compile(r"Титу.?Номер.*|Титу.?Год.*")
+    def get_article_rubrics_list(self) -> list:
+        return self.article_rubrics
 
-        pub_dates_list = self.content_data.find_all("text:p",
-                                                    {"text:style-name": re_text})
+    def get_article_full_texts_list(self) -> list:
+        return self.article_full_texts
 
-        pub_dates_text_list = [str.lower(x.text) for x in pub_dates_list]
+    def get_full_author_names_list(self) -> list:
+        return self.full_author_names
 
-        date_str_ru = " ".join(pub_dates_text_list[:2])
+    def get_affiliation_info_list(self) -> list:
+        return self.affiliation_info
 
-        date_str_en = " ".join(pub_dates_text_list[-2:])
+    def get_through_issue_number(self) -> str:
+        return self.through_issue_number
 
-        ru_regex = re.compile(r"том\s+(\d+),\s+выпуск\s+(\d+)\s+"
-                              r"([а-яА-ЯёЁ\-\–]+)\s+(\d\d\d\d)")
+    def get_article_info_list(self) -> list:
+        return self.article_info
 
-        en_regex = re.compile(r"volume\s+(\d+),\s+issue\s+(\d+)\s+"
-                              r"([a-z\-\–]+)\s+(\d\d\d\d)")
+    def get_issue_pub_dates_dict(self) -> dict:
+        return self.issue_pub_dates
 
-        res_ru = ru_regex.fullmatch(date_str_ru)
-        res_en = en_regex.fullmatch(date_str_en)
 
-        pub_dates_ru_dict = {}
-        pub_dates_en_dict = {}
+def get_parser_class(backend: str = "bs4") -> Type[OdtParser]:
+    """
+    Returns OdtParser class of the backend: "bs4" (BeautifulSoup) or "lxml"
+    """
 
-        if res_ru != None:
-            pub_dates_ru_dict = {
-                "volume_ru": res_ru[1],
-                "issue_ru": res_ru[2],
-                "month_ru": res_ru[3],
-                "year_ru":  res_ru[4]
-            }
+    if backend == "bs4":
+        return OdtParser
 
-        if res_en != None:
-            pub_dates_en_dict = {
-                "volume_en": res_en[1],
-                "issue_en": res_en[2],
-                "month_en": res_en[3],
-                "year_en":  res_en[4]
-            }
+    if backend == "lxml":
+        # Импорт здесь, т.к. odtparser.lxmlparser импортирует этот модуль
+        from odtparser.lxmlparser import LxmlOdtParser
 
-        articles_pub_dates_dict = {"ru": pub_dates_ru_dict,
-                                   "en": pub_dates_en_dict}
+        return LxmlOdtParser
 
-        return articles_pub_dates_dict
+    raise ValueError(f"Unknown OdtParser backend: {backend}")
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bulk loader of parsed issues to PostgreSQL. Issues are upserted by journal,
+year and issue number, articles, authors, affiliations and references of
+the issue are replaced and loaded with COPY FROM STDIN. Example:
+python -m odtparser.pgloader --dsn "dbname=finizdat" --create-schema -j 4 ./odtparser/test_odt/*.odt
+"""
+
+import argparse
+import io
+import sys
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS issues (
+    issue_id serial PRIMARY KEY,
+    journal_name_ru text NOT NULL,
+    journal_name_en text,
+    through_issue_number text,
+    volume_ru text,
+    volume_en text,
+    issue_number_ru text NOT NULL,
+    issue_number_en text,
+    issue_month_ru text,
+    issue_month_en text,
+    year_ru text NOT NULL,
+    year_en text,
+    UNIQUE (journal_name_ru, year_ru, issue_number_ru)
+);
+
+CREATE TABLE IF NOT EXISTS articles (
+    issue_id integer NOT NULL REFERENCES issues ON DELETE CASCADE,
+    article_number integer NOT NULL,
+    article_lang text,
+    article_name_ru text,
+    article_name_en text,
+    article_rubric_ru text,
+    article_rubric_en text,
+    article_abstract_ru text,
+    article_abstract_en text,
+    article_date_received_ru text,
+    article_date_received_en text,
+    article_date_revised_ru text,
+    article_date_revised_en text,
+    article_date_accepted_ru text,
+    article_date_accepted_en text,
+    article_date_available_ru text,
+    article_date_available_en text,
+    article_reg_number text,
+    article_udk text,
+    article_jel_ru text,
+    article_jel_en text,
+    article_keywords_ru text,
+    article_keywords_en text,
+    article_pages_range_ru text,
+    article_pages_range_en text,
+    article_full_text text,
+    PRIMARY KEY (issue_id, article_number)
+);
+
+CREATE TABLE IF NOT EXISTS authors (
+    issue_id integer NOT NULL,
+    article_number integer NOT NULL,
+    author_number integer NOT NULL,
+    author_short_name_ru text,
+    author_short_name_en text,
+    author_full_name_ru text,
+    author_full_name_en text,
+    author_orcid_ru text,
+    author_orcid_en text,
+    author_spin text,
+    PRIMARY KEY (issue_id, article_number, author_number),
+    FOREIGN KEY (issue_id, article_number) REFERENCES articles
+        ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS affiliations (
+    issue_id integer NOT NULL,
+    article_number integer NOT NULL,
+    author_number integer NOT NULL,
+    lang text NOT NULL,
+    workplace text,
+    email text,
+    PRIMARY KEY (issue_id, article_number, author_number, lang),
+    FOREIGN KEY (issue_id, article_number, author_number) REFERENCES authors
+        ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS article_references (
+    issue_id integer NOT NULL,
+    article_number integer NOT NULL,
+    lang text NOT NULL,
+    reference_number integer NOT NULL,
+    reference_html text,
+    PRIMARY KEY (issue_id, article_number, lang, reference_number),
+    FOREIGN KEY (issue_id, article_number) REFERENCES articles
+        ON DELETE CASCADE
+);
+"""
+
+ISSUE_COLUMNS = (
+    "journal_name_ru", "journal_name_en", "through_issue_number",
+    "volume_ru", "volume_en", "issue_number_ru", "issue_number_en",
+    "issue_month_ru", "issue_month_en", "year_ru", "year_en",
+)
+
+# Столбец таблицы articles и ключ словаря статьи export.get_issue_data
+ARTICLE_COLUMNS = (
+    ("article_lang", "article_lang"),
+    ("article_name_ru", "article_name_ru"),
+    ("article_name_en", "article_name_en"),
+    ("article_rubric_ru", "article_rubric_ru"),
+    ("article_rubric_en", "article_rubric_en"),
+    ("article_abstract_ru", "article_astract_ru"),
+    ("article_abstract_en", "article_astract_en"),
+    ("article_date_received_ru", "article_date_received_ru"),
+    ("article_date_received_en", "article_date_received_en"),
+    ("article_date_revised_ru", "article_date_revised_ru"),
+    ("article_date_revised_en", "article_date_revised_en"),
+    ("article_date_accepted_ru", "article_date_accepted_ru"),
+    ("article_date_accepted_en", "article_date_accepted_en"),
+    ("article_date_available_ru", "article_date_available_ru"),
+    ("article_date_available_en", "article_date_available_en"),
+    ("article_reg_number", "article_reg_number"),
+    ("article_udk", "article_udk"),
+    ("article_jel_ru", "article_jel_ru"),
+    ("article_jel_en", "article_jel_en"),
+    ("article_keywords_ru", "article_keywords_ru"),
+    ("article_keywords_en", "article_keywords_en"),
+    ("article_pages_range_ru", "article_pages_range_ru"),
+    ("article_pages_range_en", "article_pages_range_en"),
+    ("article_full_text", "article_full_text"),
+)
+
+AUTHOR_COLUMNS = (
+    "author_short_name_ru", "author_short_name_en", "author_full_name_ru",
+    "author_full_name_en", "author_orcid_ru", "author_orcid_en",
+    "author_spin",
+)
+
+# Таблица и ее столбцы в порядке полей строк COPY
+COPY_TABLES = (
+    ("articles", ("issue_id", "article_number")
+     + tuple(column for column, _ in ARTICLE_COLUMNS)),
+    ("authors", ("issue_id", "article_number", "author_number")
+     + AUTHOR_COLUMNS),
+    ("affiliations", ("issue_id", "article_number", "author_number", "lang",
+                      "workplace", "email")),
+    ("article_references", ("issue_id", "article_number", "lang",
+                            "reference_number", "reference_html")),
+)
+
+UPSERT_ISSUE_SQL = """
+INSERT INTO issues ({columns}) VALUES ({values})
+ON CONFLICT (journal_name_ru, year_ru, issue_number_ru) DO UPDATE SET
+{updates}
+RETURNING issue_id
+""".format(
+    columns=", ".join(ISSUE_COLUMNS),
+    values=", ".join(["%s"] * len(ISSUE_COLUMNS)),
+    updates=",\n".join(f"{column} = EXCLUDED.{column}"
+                       for column in ISSUE_COLUMNS),
+)
+
+DEFAULT_BATCH_SIZE = 50  # issues in one transaction
+
+# Экранирование текстового формата COPY. Обратная косая черта первой.
+COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+
+    value = str(value)
+
+    # str.replace быстрее str.translate на тексте с кириллицей
+    for char, escaped_char in COPY_ESCAPES:
+        if char in value:
+            value = value.replace(char, escaped_char)
+
+    return value
+
+
+def copy_line(row) -> str:
+    """
+    Returns row as a line of COPY text format
+    """
+
+    return "\t".join(copy_value(value) for value in row) + "\n"
+
+
+def get_reference_items(references_html):
+    """
+    Splits references list in HTML format (one <p> per line) into items
+    """
+
+    if not references_html:
+        return []
+
+    return [line for line in references_html.split("\n") if line.strip()]
+
+
+def iter_article_rows(issue_id, issue_data):
+    for article_number, article in enumerate(issue_data["articles_info"], 1):
+        yield (issue_id, article_number) + tuple(
+            article.get(key) for _, key in ARTICLE_COLUMNS)
+
+
+def iter_author_rows(issue_id, issue_data):
+    for article_number, article in enumerate(issue_data["articles_info"], 1):
+        for author_number, author in enumerate(article["article_authors"],
+                                               1):
+            yield (issue_id, article_number, author_number) + tuple(
+                author.get(column) for column in AUTHOR_COLUMNS)
+
+
+def iter_affiliation_rows(issue_id, issue_data):
+    for article_number, article in enumerate(issue_data["articles_info"], 1):
+        for author_number, author in enumerate(article["article_authors"],
+                                               1):
+            for lang in ("ru", "en"):
+                yield (issue_id, article_number, author_number, lang,
+                       author.get(f"author_workplace_{lang}"),
+                       author.get(f"author_email_{lang}"))
+
+
+def iter_reference_rows(issue_id, issue_data):
+    for article_number, article in enumerate(issue_data["articles_info"], 1):
+        # В англоязычных статьях оба списка содержат английский список
+        if article.get("article_lang") == "en":
+            langs = ("en",)
+        else:
+            langs = ("ru", "en")
+
+        for lang in langs:
+            references = get_reference_items(
+                article.get(f"article_references_{lang}_list"))
+
+            for reference_number, reference in enumerate(references, 1):
+                yield (issue_id, article_number, lang, reference_number,
+                       reference)
+
+
+# Функции, формирующие строки каждой из таблиц COPY_TABLES
+TABLE_ROWS = {
+    "articles": iter_article_rows,
+    "authors": iter_author_rows,
+    "affiliations": iter_affiliation_rows,
+    "article_references": iter_reference_rows,
+}
+
+
+class CopyStream(io.TextIOBase):
+    """
+    File-like object reading COPY text lines from an iterable of rows, so
+    rows are not collected in memory before COPY
+    """
+
+    def __init__(self, rows):
+        self.lines = (copy_line(row) for row in rows)
+        self.buffer = ""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            line = next(self.lines, None)
+            if line is None:
+                break
+            self.buffer += line
+
+        if size < 0:
+            size = len(self.buffer)
+
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+
+        return data
+
+    def readline(self, size=-1):
+        return self.read(size)
+
+
+def create_schema(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(SCHEMA_SQL)
+
+    connection.commit()
+
+
+def upsert_issue(cursor, issue_info) -> int:
+    """
+    Inserts or updates the issue row, removes its articles (with authors,
+    affiliations and references) and returns issue_id
+    """
+
+    cursor.execute(UPSERT_ISSUE_SQL,
+                   [issue_info.get(column) for column in ISSUE_COLUMNS])
+    issue_id = cursor.fetchone()[0]
+
+    cursor.execute("DELETE FROM articles WHERE issue_id = %s", (issue_id,))
+
+    return issue_id
+
+
+def load_issue_batch(connection, issues_data) -> int:
+    """
+    Loads list of issues (export.get_issue_data results) in one transaction
+    and returns number of loaded issues
+    """
+
+    with connection.cursor() as cursor:
+        # Повторно загруженный в пакете выпуск заменяет предыдущий
+        batch_issues = {}
+        for issue_data in issues_data:
+            issue_id = upsert_issue(cursor, issue_data["issue_info"])
+            batch_issues[issue_id] = issue_data
+
+        def iter_table_rows(table):
+            for issue_id, issue_data in batch_issues.items():
+                yield from TABLE_ROWS[table](issue_id, issue_data)
+
+        # Родительские таблицы загружаются раньше дочерних
+        for table, columns in COPY_TABLES:
+            cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN",
+                CopyStream(iter_table_rows(table)))
+
+    connection.commit()
+
+    return len(batch_issues)
+
+
+def load_issues(connection, issues_data, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Loads iterable of issues (export.get_issue_data results) by batches of
+    batch_size issues. Returns number of loaded issues.
+    """
+
+    number_of_issues = 0
+    batch = []
+
+    try:
+        for issue_data in issues_data:
+            batch.append(issue_data)
+
+            if len(batch) >= batch_size:
+                number_of_issues += load_issue_batch(connection, batch)
+                batch = []
+
+        if batch:
+            number_of_issues += load_issue_batch(connection, batch)
+    except Exception:
+        connection.rollback()
+        raise
+
+    return number_of_issues
+
+
+def main(argv=None):
+    import psycopg2
+
+    import odtparser.export as export
+
+    arg_parser = argparse.ArgumentParser(
+        description="Loads issues data from odt files to PostgreSQL")
+    arg_parser.add_argument("files", nargs="+", help="odt files of issues")
+    arg_parser.add_argument("--dsn", required=True,
+                            help="PostgreSQL connection string")
+    arg_parser.add_argument("--create-schema", action="store_true",
+                            help="create tables if they do not exist")
+    arg_parser.add_argument(
+        "-b", "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help=f"issues in one transaction (default: {DEFAULT_BATCH_SIZE})")
+    arg_parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="number of worker processes, 0 - number of CPUs (default: 1)")
+    args = arg_parser.parse_args(argv)
+
+    failed = []
+
+    def iter_issues_data():
+        for path_to_file, issue_data, error in export.iter_issue_results(
+                args.files, args.workers or None):
+            if error is None:
+                yield issue_data
+            else:
+                print(f"Ошибка в файле {path_to_file}:\n{error}",
+                      file=sys.stderr)
+                failed.append(path_to_file)
+
+    connection = psycopg2.connect(args.dsn)
+    try:
+        if args.create_schema:
+            create_schema(connection)
+
+        number_of_issues = load_issues(connection, iter_issues_data(),
+                                       args.batch_size)
+    finally:
+        connection.close()
+
+    print(f"Загружено выпусков: {number_of_issues}, "
+          f"с ошибками: {len(failed)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Renderer of references list items and article full texts. Text runs of a
+reference paragraph are written into one buffer; adjacent italic runs share
+one <i> tag as they are added, and the paragraph is normalized once
+(normalize_reference_html). Items are Reference records, so references are
+not joined into one string until export.
+
+The renderers walk bs4 and lxml trees alike (see get_tree), so both
+backends share one implementation.
+"""
+
+import re
+
+from lxml import etree
+
+from odtparser.article import Reference
+from odtparser.normalize import normalize_reference_html
+from odtparser.odtfile import qname
+from odtparser.styles import StyleIndex
+
+REF_SPAN_STYLE_REGEX = re.compile(r"^T[\d]+")
+
+P = qname("text:p")
+SPAN = qname("text:span")
+LIST_ITEM = qname("text:list-item")
+NOTE = qname("text:note")
+NOTE_BODY = qname("text:note-body")
+BOOKMARK = qname("text:bookmark")
+SPACE = qname("text:s")
+SOFT_PAGE_BREAK = qname("text:soft-page-break")
+
+
+class LxmlTree:
+    """
+    Operations on lxml elements used by the renderers
+    """
+
+    # Ключи атрибутов lxml по именам с префиксами
+    attributes = {name: qname(name)
+                  for name in ("text:style-name", "text:note-class")}
+
+    @staticmethod
+    def children(node):
+        """
+        Yields children of node in document order: tuples (tag, element)
+        for elements with lxml tags ("{namespace}p") and (None, text) for
+        text between them. Comments and processing instructions are
+        skipped.
+        """
+
+        if node.text:
+            yield None, node.text
+
+        for child in node:
+            if isinstance(child.tag, str):
+                yield child.tag, child
+
+            if child.tail:
+                yield None, child.tail
+
+    @classmethod
+    def get(cls, element, name: str, default=None):
+        return element.get(cls.attributes[name], default)
+
+    @staticmethod
+    def text(node) -> str:
+        return "".join(node.itertext())
+
+
+class SoupTree:
+    """
+    Operations on bs4 tags used by the renderers, as in LxmlTree
+    """
+
+    @staticmethod
+    def children(node):
+        import bs4
+
+        for child in node.children:
+            if isinstance(child, bs4.Tag):
+                yield f"{{{child.namespace}}}{child.name}", child
+            # Strings included in text (as in Tag.get_text)
+            elif type(child) in (bs4.NavigableString, bs4.CData):
+                yield None, child
+
+    @staticmethod
+    def get(element, name: str, default=None):
+        return element.get(name, default)
+
+    @staticmethod
+    def text(node) -> str:
+        return node.get_text()
+
+
+def get_tree(node):
+    """
+    Returns LxmlTree or SoupTree for node
+    """
+
+    if isinstance(node, etree._Element):
+        return LxmlTree
+
+    return SoupTree
+
+
+class ReferenceBuilder:
+    """
+    Builds Reference record from text runs of one paragraph
+    """
+
+    def __init__(self):
+        self.buffer = ["<p>"]
+        self.italic = False
+
+    def add(self, text: str, italic: bool = False):
+        if italic != self.italic:
+            self.buffer.append("<i>" if italic else "</i>")
+            self.italic = italic
+
+        self.buffer.append(text)
+
+    def html(self) -> str:
+        """
+        Returns paragraph HTML before normalization
+        """
+
+        return "".join(self.buffer) + ("</i></p>" if self.italic else "</p>")
+
+    def reference(self) -> Reference:
+        return Reference(html=normalize_reference_html(self.html()))
+
+
+def get_ref_element_item(element, style_index: StyleIndex) -> Reference:
+    """
+    Returns Reference record of reference paragraph of bs4 or lxml tree
+    """
+
+    tree = get_tree(element)
+    builder = ReferenceBuilder()
+
+    for tag, child in tree.children(element):
+        if tag is None:
+            builder.add(child)
+        elif tag == SOFT_PAGE_BREAK:
+            builder.add(" ")
+        elif tag not in (BOOKMARK, SPACE):
+            style_name = tree.get(child, "text:style-name", "")
+
+            builder.add(tree.text(child),
+                        REF_SPAN_STYLE_REGEX.search(style_name) is not None
+                        and style_index.is_italic(style_name))
+
+    return builder.reference()
+
+
+def _footnote_text(tree, note) -> str:
+    for tag, child in tree.children(note):
+        if tag == NOTE_BODY:
+            return " (" + tree.text(child) + ") "
+
+    return " () "
+
+
+def _flat_text(tree, node, parts):
+    """
+    Appends node text to parts replacing footnotes with their text in
+    parentheses
+    """
+
+    for tag, child in tree.children(node):
+        if tag is None:
+            parts.append(child)
+        elif (tag == NOTE
+              and tree.get(child, "text:note-class") == "footnote"):
+            parts.append(_footnote_text(tree, child))
+        else:
+            _flat_text(tree, child, parts)
+
+
+def _render_text(tree, node, parts):
+    """
+    Appends node text to parts adding dashes before list items and spaces
+    around paragraphs, spans and footnotes
+    """
+
+    for tag, child in tree.children(node):
+        if tag is None:
+            parts.append(child)
+        elif (tag == NOTE
+              and tree.get(child, "text:note-class") == "footnote"):
+            parts.append(_footnote_text(tree, child))
+        elif tag == LIST_ITEM:
+            parts.append("- ")
+            _flat_text(tree, child, parts)
+            parts.append("\n")
+        elif tag == P:
+            _flat_text(tree, child, parts)
+            parts.append("\n")
+        elif tag == SPAN:
+            parts.append(" ")
+            _flat_text(tree, child, parts)
+            parts.append(" ")
+        else:
+            _render_text(tree, child, parts)
+
+
+def render_full_text(section) -> str:
+    """
+    Returns plain text of the article section (text:section) of bs4 or lxml
+    tree in one pass without changing the tree
+    """
+
+    parts = []
+    _render_text(get_tree(section), section, parts)
+
+    return "".join(parts)
@@ -0,0 +1,979 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Single-pass extraction engine. Visits content.xml once with lxml iterparse
+and sends each paragraph, section and list to the registered field
+collectors. One traversal produces every field export.get_issue_data
+needs.
+"""
+
+import abc
+import contextlib
+
+from lxml import etree
+
+import odtparser.instrument as instrument
+import odtparser.odtparser as odt
+from odtparser.normalize import LINE_BREAK_MARK, normalize_node_text
+from odtparser.references import get_ref_element_item, render_full_text
+from odtparser.odtfile import OdtFile, CONTENT_XML, STYLES_XML, qname
+from odtparser.styles import StyleIndex
+
+
+OFFICE_TEXT = qname("office:text")
+STYLE = qname("style:style")
+STYLE_NAME = qname("style:name")
+STYLE_PARENT = qname("style:parent-style-name")
+FOOTER = qname("style:footer")
+FOOTER_LEFT = qname("style:footer-left")
+P = qname("text:p")
+LIST = qname("text:list")
+SECTION = qname("text:section")
+SECTION_NAME = qname("text:name")
+TEXT_STYLE_NAME = qname("text:style-name")
+TABLE_STYLE_NAME = qname("table:style-name")
+LINE_BREAK = qname("text:line-break")
+
+# Paragraphs with automatic styles inherited from these styles are treated
+# as if they had the parent style
+RUBRIC_STYLES = ("СтатьяРубрикаРус", "СтатьяРубрикаАнгл")
+AUTHORS_STYLES = ("СтатьяАвторыРус", "СтатьяАвторыАнгл")
+AFFILIATION_STYLES = ("СтатьяАффилиацияРус", "СтатьяАффилиацияАнгл")
+
+
+def _normalize_texts(element):
+    """
+    Normalizes text of element and tails of its children with
+    normalize_node_text. Must be called when element is closed, the
+    children are normalized before.
+    """
+
+    text = element.text
+    if text:
+        normalized_text = normalize_node_text(text)
+        if normalized_text != text:
+            element.text = normalized_text
+
+    for child in element:
+        tail = child.tail
+        if tail:
+            normalized_tail = normalize_node_text(tail)
+            if normalized_tail != tail:
+                child.tail = normalized_tail
+
+
+def _normalize_runs(element):
+    """
+    Normalizes text runs of element joined by line breaks, as
+    _normalize_texts. Line breaks are removed from the tree, the texts
+    around them are joined into one run.
+    """
+
+    # Текст, к которому относится текущий отрезок: element.text или хвост
+    # предыдущего дочернего элемента
+    owner = None
+    run = [element.text or ""]
+
+    for child in list(element):
+        if child.tag == LINE_BREAK:
+            run.append(LINE_BREAK_MARK)
+            run.append(child.tail or "")
+            element.remove(child)
+            continue
+
+        _set_run(element, owner, run)
+        owner = child
+        run = [child.tail or ""]
+
+    _set_run(element, owner, run)
+
+
+def _set_run(element, owner, run):
+    text = normalize_node_text("".join(run)) or None
+
+    if owner is None:
+        if text != element.text:
+            element.text = text
+    elif text != owner.tail:
+        owner.tail = text
+
+
+def parse_content(source):
+    """
+    Parses content.xml normalizing text of every node (see
+    _normalize_runs) and returns the root element
+    """
+
+    root = etree.parse(source).getroot()
+
+    # Переводы строк удаляются после обхода, чтобы не менять дерево во
+    # время него. Отрезки текста разных элементов не зависят друг от друга.
+    line_break_parents = {line_break.getparent()
+                          for line_break in root.iter(LINE_BREAK)}
+
+    # Весь документ уже прочитан, так что каждый элемент нормализует свой
+    # текст и свой хвост
+    for element in root.iter():
+        text = element.text
+        if text:
+            normalized_text = normalize_node_text(text)
+            if (normalized_text != text
+                    and element not in line_break_parents):
+                element.text = normalized_text
+
+        tail = element.tail
+        if tail:
+            normalized_tail = normalize_node_text(tail)
+            if (normalized_tail != tail
+                    and element.getparent() not in line_break_parents):
+                element.tail = normalized_tail
+
+    for element in line_break_parents:
+        _normalize_runs(element)
+
+    return root
+
+
+def element_text(element) -> str:
+    """
+    Returns text of element with all descendants
+    """
+
+    return "".join(element.itertext())
+
+
+def iter_sibling_texts(element):
+    """
+    Yields texts of the nodes following element within its parent, including
+    text between them
+    """
+
+    if element.tail:
+        yield element.tail
+
+    for sibling in element.itersiblings():
+        yield element_text(sibling)
+
+        if sibling.tail:
+            yield sibling.tail
+
+
+def single_string(element):
+    """
+    Returns the only string inside element or None if element contains
+    several nodes
+    """
+
+    while True:
+        if len(element) == 0:
+            return element.text
+
+        if len(element) > 1 or element.text or element[0].tail:
+            return None
+
+        element = element[0]
+
+
+def preceding_text(element):
+    """
+    Returns the text right before element start tag. Returns None if element
+    is preceded by an empty element.
+    """
+
+    previous = element.getprevious()
+
+    # Текст открытого родителя еще не нормализован
+    if previous is None:
+        return _open_text(element.getparent().text)
+
+    if previous.tail:
+        return _open_text(previous.tail)
+
+    while len(previous):
+        previous = previous[-1]
+
+        if previous.tail:
+            return previous.tail
+
+    return previous.text or None
+
+
+def _open_text(text):
+    if not text:
+        return None
+
+    return normalize_node_text(text)
+
+
+def is_full_text_section(element) -> bool:
+    return (element.tag == SECTION
+            and odt.FULL_TEXT_SECTION_REGEX.search(
+                element.get(SECTION_NAME, "")) is not None)
+
+
+def is_ref_list(element) -> bool:
+    return (element.tag == LIST
+            and odt.REF_LIST_STYLE_REGEX.search(
+                element.get(TEXT_STYLE_NAME, "")) is not None)
+
+
+def is_article_block(element) -> bool:
+    return is_full_text_section(element) or is_ref_list(element)
+
+
+def contains_article_block(element) -> bool:
+    return any(is_article_block(descendant)
+               for descendant in element.iterdescendants(SECTION, LIST))
+
+
+def is_body_block(element) -> bool:
+    """
+    Returns True if element is a block of the document body (see
+    OdtParser.body_nodes)
+    """
+
+    parent = element.getparent()
+
+    while parent is not None and parent.tag != OFFICE_TEXT:
+        if is_article_block(parent) or not contains_article_block(parent):
+            return False
+
+        parent = parent.getparent()
+
+    return parent is not None
+
+
+def _block_texts(nodes, stop, texts) -> bool:
+    for node in nodes:
+        if not isinstance(node.tag, str):
+            continue
+
+        if node is stop:
+            texts.append(element_text(node))
+            return True
+
+        if not is_article_block(node) and contains_article_block(node):
+            if _block_texts(node, stop, texts):
+                return True
+        else:
+            texts.append(element_text(node))
+
+    return False
+
+
+def following_block_texts(element, stop) -> list:
+    """
+    Returns texts of the blocks of the document body following element up
+    to stop or to the end of the document if stop is None
+    """
+
+    texts = []
+    node = element
+
+    while node.tag != OFFICE_TEXT:
+        if _block_texts(node.itersiblings(), stop, texts):
+            break
+
+        node = node.getparent()
+
+    return texts
+
+
+def get_ref_list_items(element, style_index: StyleIndex) -> tuple:
+    """
+    Returns tuple of Reference records of references list element
+    """
+
+    return tuple(get_ref_element_item(p, style_index)
+                 for p in element.iter(P))
+
+
+class FieldCollector(abc.ABC):
+    """
+    Base class of field collectors. Collector gets closed elements with tags
+    listed in `tags`, opened elements with tags listed in `start_tags` and,
+    if `paragraphs` is set, every paragraph with its text and style name.
+    Style names are resolved with stream.style_index.
+    Collected field value is returned by result().
+    """
+
+    field = ""
+    tags = ()
+    start_tags = ()
+    paragraphs = False
+
+    def start(self, element, stream):
+        pass
+
+    def end(self, element, stream):
+        pass
+
+    def paragraph(self, element, text, style_name, stream):
+        pass
+
+    @abc.abstractmethod
+    def result(self):
+        """
+        Returns collected field value
+        """
+
+
+class PubDatesCollector(FieldCollector):
+    field = "issue_pub_dates"
+    paragraphs = True
+
+    def __init__(self):
+        self.pub_dates_text_list = []
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.PUB_DATES_STYLE_REGEX.search(style_name):
+            self.pub_dates_text_list.append(text)
+
+    def result(self):
+        return odt.parse_pub_dates_list(self.pub_dates_text_list)
+
+
+class ThroughIssueNumberCollector(FieldCollector):
+    field = "through_issue_number"
+    paragraphs = True
+
+    def __init__(self):
+        self.through_issue_number = ""
+
+    def paragraph(self, element, text, style_name, stream):
+        if self.through_issue_number == "":
+            res = odt.THROUGH_ISSUE_NUMBER_REGEX.search(text)
+            if res is not None:
+                self.through_issue_number = res.group(1)
+
+    def result(self):
+        return self.through_issue_number
+
+
+class NumberOfArticlesCollector(FieldCollector):
+    field = "number_of_articles"
+    paragraphs = True
+
+    def __init__(self):
+        self.number_of_articles = 0
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.CITATION_EN_MARK in text:
+            self.number_of_articles += 1
+
+    def result(self):
+        return self.number_of_articles
+
+
+class ArticleFieldCollector(FieldCollector):
+    """
+    Collector of a field with a value per article. Items (lang, value) are
+    gathered in document order and composed by articles.
+    IssueStream.iter_articles takes the items of each article as soon as
+    the article ends, so they are not kept to the end of the document.
+    """
+
+    # Key of the field in the fields of an article (odt.ARTICLE_FIELDS)
+    article_field = ""
+
+    def __init__(self):
+        self.items = []
+        # Number of items taken by the previous articles
+        self.taken = 0
+
+    def mark(self) -> int:
+        """
+        Number of items gathered from the start of the document
+        """
+
+        return self.taken + len(self.items)
+
+    def take_items(self, mark: int) -> list:
+        """
+        Removes and returns items gathered before mark
+        """
+
+        count = mark - self.taken
+        items = self.items[:count]
+        del self.items[:count]
+        self.taken = mark
+
+        return items
+
+    def compose(self, items) -> list:
+        return odt.compose_by_article_info_list(items)
+
+    def result(self):
+        return self.compose(self.items)
+
+
+class CitationCollector(ArticleFieldCollector):
+    field = "article_citation_info_list"
+    article_field = "citation_info"
+    paragraphs = True
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.CITATION_REGEX.search(text):
+            self.items.append(odt.get_citation_info(text))
+
+
+class AbstractCollector(ArticleFieldCollector):
+    field = "article_abstracts_list"
+    article_field = "article_abstracts"
+    paragraphs = True
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.ABSTRACT_REGEX.search(text):
+            lang = "ru" if "Аннотация" in text else "en"
+            abstract = [lang, ""]
+            self.items.append(abstract)
+
+            # Abstract paragraphs follow the header, so it is gathered when
+            # the enclosing element is closed. The abstract in the document
+            # body ends with its article (see OdtParser._following_texts).
+            def gather_abstract(parent):
+                abstract[1] = odt.get_abstract_html(
+                    iter_sibling_texts(element))
+
+            def gather_article_abstract(stop):
+                if is_body_block(element):
+                    texts = following_block_texts(element, stop)
+                else:
+                    texts = iter_sibling_texts(element)
+
+                abstract[1] = odt.get_abstract_html(texts)
+
+            if element.getparent().tag in (OFFICE_TEXT, SECTION):
+                stream.on_article_end(element, gather_article_abstract)
+            else:
+                stream.on_close(element.getparent(), gather_abstract)
+
+    def compose(self, items) -> list:
+        return odt.compose_by_article_info_list(
+            [tuple(abstract) for abstract in items])
+
+
+class RubricCollector(ArticleFieldCollector):
+    field = "article_rubrics_list"
+    article_field = "article_rubrics"
+    paragraphs = True
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.RUBRIC_STYLE_REGEX.search(
+                stream.style_index.resolve(style_name, RUBRIC_STYLES)):
+            rubric_name = odt.parse_rubric_str(text)
+
+            if rubric_name is not None:
+                self.items.append(rubric_name)
+
+
+class AuthorNamesCollector(ArticleFieldCollector):
+    field = "article_full_author_names_list"
+    article_field = "full_author_names"
+    paragraphs = True
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.AUTHORS_STYLE_REGEX.search(
+                stream.style_index.resolve(style_name, AUTHORS_STYLES)):
+            self.items.append(odt.parse_authors_list(text))
+
+
+class AffiliationCollector(ArticleFieldCollector):
+    field = "article_affiliation_info_list"
+    article_field = "affiliation_info"
+    paragraphs = True
+
+    def __init__(self):
+        super().__init__()
+        # Paragraph texts of not taken items by the style of the table
+        # cell, containing affiliation of one article. Items are tuples
+        # (table style name, paragraph texts).
+        self.articles_affiliation_dict = {}
+
+    def paragraph(self, element, text, style_name, stream):
+        if odt.AFFILIATION_STYLE_REGEX.search(
+                stream.style_index.resolve(style_name, AFFILIATION_STYLES)):
+            table_style_name = element.getparent().attrib[TABLE_STYLE_NAME]
+
+            if table_style_name not in self.articles_affiliation_dict:
+                texts = []
+                self.articles_affiliation_dict[table_style_name] = texts
+                self.items.append((table_style_name, texts))
+
+            self.articles_affiliation_dict[table_style_name].append(
+                text + " ")
+
+    def take_items(self, mark: int) -> list:
+        items = super().take_items(mark)
+
+        for table_style_name, _ in items:
+            del self.articles_affiliation_dict[table_style_name]
+
+        return items
+
+    def compose(self, items) -> list:
+        return odt.compose_by_article_info_list(
+            [odt.parse_affiliation_str("".join(texts))
+             for _, texts in items])
+
+
+class ArticleInfoCollector(ArticleFieldCollector):
+    field = "article_info_list"
+    article_field = "article_info"
+    paragraphs = True
+
+    def paragraph(self, element, text, style_name, stream):
+        string = single_string(element)
+
+        if string is not None and odt.ARTICLE_INFO_REGEX.search(string):
+            if str.strip(text) == "История статьи:":
+                lang = "ru"
+            else:
+                lang = "en"
+
+            article_info = [lang, {}]
+            self.items.append(article_info)
+
+            def gather_article_info(parent):
+                article_info[1] = odt.parse_article_info_str(
+                    lang, " ".join(iter_sibling_texts(element)))
+
+            stream.on_close(element.getparent(), gather_article_info)
+
+    def compose(self, items) -> list:
+        return odt.compose_by_article_info_list(
+            [tuple(info) for info in items])
+
+
+class FullTextCollector(ArticleFieldCollector):
+    field = "article_full_texts_list"
+    article_field = "article_full_texts"
+    tags = (SECTION,)
+
+    def end(self, element, stream):
+        if is_full_text_section(element):
+            self.items.append(
+                odt.get_full_text_info(render_full_text(element)))
+
+    def compose(self, items) -> list:
+        # Полный текст статьи не объединяется по языкам
+        return list(items)
+
+
+class ReferencesCollector(ArticleFieldCollector):
+    field = "article_references_list"
+    article_field = "article_references"
+    tags = (LIST,)
+    start_tags = (LIST,)
+
+    def __init__(self):
+        super().__init__()
+        # Languages of the opened references lists
+        self.ref_langs = {}
+
+    def start(self, element, stream):
+        if is_ref_list(element):
+            ref_header = preceding_text(element)
+
+            # The header is gathered on the start tag while preceding nodes
+            # are still in the tree, the list itself is rendered when closed
+            if ref_header is None:
+                self.ref_langs[element] = None
+            else:
+                self.ref_langs[element] = odt.get_ref_list_lang(
+                    ref_header.strip())
+
+    def end(self, element, stream):
+        if element not in self.ref_langs:
+            return
+
+        ref_lang = self.ref_langs.pop(element)
+
+        if ref_lang is None:
+            raise odt.LayoutError("Ошибка в оформлении списка литературы."
+                                  f" См. ниже: \n{element_text(element)}")
+
+        self.items.append((ref_lang, get_ref_list_items(element,
+                                                        stream.style_index)))
+
+
+def issue_collectors() -> list:
+    """
+    Returns collectors of the issue fields export needs before articles
+    """
+
+    return [PubDatesCollector(), ThroughIssueNumberCollector()]
+
+
+def article_collectors() -> list:
+    """
+    Returns collectors of all article fields (odt.ARTICLE_FIELDS)
+    """
+
+    return [RubricCollector(), CitationCollector(), AbstractCollector(),
+            FullTextCollector(), AuthorNamesCollector(),
+            AffiliationCollector(), ArticleInfoCollector(),
+            ReferencesCollector()]
+
+
+def default_collectors() -> list:
+    """
+    Returns collectors of all fields export.get_issue_data needs
+    """
+
+    return [PubDatesCollector(), ThroughIssueNumberCollector(),
+            NumberOfArticlesCollector(), *article_collectors()]
+
+
+class IssueStream:
+    """
+    Visits content.xml once and dispatches its elements to the collectors.
+    Text of every element is normalized when the element is closed (see
+    _normalize_runs), before the collectors get it.
+    """
+
+    def __init__(self, source, collectors=None, style_index=None):
+        self.source = source
+        self.collectors = []
+        # Automatic styles of content.xml are added to the index as they
+        # come before the document body
+        self.style_index = style_index or StyleIndex()
+        # Callbacks, waiting for closing of their elements
+        self.close_callbacks = {}
+        # Callbacks, waiting for the end of the current article, and the
+        # callbacks after its last full text or references list, which may
+        # belong to the next article
+        self.article_end_callbacks = []
+        self.block_callbacks = []
+
+        for collector in collectors or []:
+            self.register(collector)
+
+    def register(self, collector: FieldCollector):
+        self.collectors.append(collector)
+
+    def on_close(self, element, callback):
+        """
+        Calls callback(element) when element is closed
+        """
+
+        self.close_callbacks.setdefault(element, []).append(callback)
+
+    def on_article_end(self, element, callback):
+        """
+        Calls callback(stop) when the article of element ends (see
+        iter_articles). Stop is the last full text section or references
+        list of the article or None at the end of the document. Element
+        and the nodes following it are kept in the tree until then.
+        """
+
+        self.block_callbacks.append((element, callback))
+
+    def _end_article(self, stop):
+        callbacks = self.article_end_callbacks
+        self.article_end_callbacks = []
+
+        for _, callback in callbacks:
+            callback(stop)
+
+    def _held_nodes(self) -> set:
+        """
+        Elements waiting for the end of their articles and their ancestors
+        """
+
+        held = set()
+
+        for element, _ in self.article_end_callbacks + self.block_callbacks:
+            held.add(element)
+            held.update(element.iterancestors())
+
+        return held
+
+    def run(self) -> dict:
+        """
+        Visits content.xml and returns dictionary of collected fields
+        """
+
+        for _ in self._visit(split_articles=False):
+            pass
+
+        fields = {}
+        for collector in self.collectors:
+            with instrument.stage(collector.field):
+                fields[collector.field] = collector.result()
+
+        return fields
+
+    def iter_articles(self):
+        """
+        Visits content.xml and yields fields of each article (dictionary
+        with article_field keys of the article collectors) as soon as the
+        article ends. Articles are delimited as in
+        odt.build_article_index: an article ends with the last references
+        list after its full text section. Full text sections and
+        references lists delimit articles at any depth.
+        """
+
+        return self._visit(split_articles=True)
+
+    def issue_fields(self) -> dict:
+        """
+        Returns fields of the collectors, which are not article fields,
+        gathered so far
+        """
+
+        return {collector.field: collector.result()
+                for collector in self.collectors
+                if not isinstance(collector, ArticleFieldCollector)}
+
+    def _take_article(self, marks, number) -> dict:
+        """
+        Returns fields of the article number from the items gathered
+        before marks of the article collectors
+        """
+
+        article_fields = {}
+
+        for collector, mark in marks:
+            article_fields[collector.article_field] = odt.get_article_item(
+                collector.compose(collector.take_items(mark)),
+                collector.article_field, number)
+
+        return article_fields
+
+    def _visit(self, split_articles):
+        """
+        Visits content.xml. If split_articles is set, yields fields of each
+        article (see iter_articles).
+        """
+
+        start_handlers = {}
+        end_handlers = {}
+        paragraph_collectors = []
+
+        for collector in self.collectors:
+            for tag in collector.start_tags:
+                start_handlers.setdefault(tag, []).append(collector)
+            for tag in collector.tags:
+                end_handlers.setdefault(tag, []).append(collector)
+            if collector.paragraphs:
+                paragraph_collectors.append(collector)
+
+        article_field_collectors = [
+            collector for collector in self.collectors
+            if isinstance(collector, ArticleFieldCollector)]
+
+        close_callbacks = self.close_callbacks
+        line_break_parents = set()
+        nodes = 0
+        # Marks of the ends of the read articles and the last possible end
+        # of the current one (its full text or references list)
+        article_ends = []
+        article_end = None
+        article_stop = None
+        # Opened full text section or references list, which delimits
+        # articles. Sections and lists inside it do not.
+        block = None
+        number_of_articles = 0
+
+        for event, element in etree.iterparse(self.source,
+                                              events=("start", "end")):
+            tag = element.tag
+
+            if event == "start":
+                for collector in start_handlers.get(tag, ()):
+                    collector.start(element, self)
+
+                if block is not None or tag not in (SECTION, LIST):
+                    continue
+
+                if is_full_text_section(element):
+                    block = element
+
+                    # Full text of the next article starts: the current one
+                    # has ended with its last references list
+                    if article_stop is not None:
+                        self._end_article(article_stop)
+                        if split_articles:
+                            article_ends.append(article_end)
+                    article_end = article_stop = None
+                elif is_ref_list(element):
+                    block = element
+                continue
+
+            nodes += 1
+
+            # Текст нормализуется до того, как его получат сборщики (см.
+            # _normalize_runs). Переводы строк закрываются раньше
+            # родителя, так что его отрезки известны заранее.
+            if tag == LINE_BREAK:
+                line_break_parents.add(element.getparent())
+            elif line_break_parents and element in line_break_parents:
+                line_break_parents.remove(element)
+                _normalize_runs(element)
+            else:
+                _normalize_texts(element)
+
+            if tag == P:
+                text = element_text(element)
+                style_name = element.get(TEXT_STYLE_NAME, "")
+
+                for collector in paragraph_collectors:
+                    collector.paragraph(element, text, style_name, self)
+            elif tag == STYLE:
+                self.style_index.add_element(element)
+
+            for collector in end_handlers.get(tag, ()):
+                collector.end(element, self)
+
+            if close_callbacks and element in close_callbacks:
+                for callback in close_callbacks.pop(element):
+                    callback(element)
+
+            if element is block:
+                block = None
+                article_stop = element
+                self.article_end_callbacks += self.block_callbacks
+                self.block_callbacks = []
+
+                if split_articles:
+                    article_end = [(collector, collector.mark())
+                                   for collector in article_field_collectors]
+
+            # Blocks of the document body are children of office:text and
+            # of the sections, which contain full text sections or
+            # references lists (see OdtParser.body_nodes)
+            parent = element.getparent()
+            if (parent is None or parent.tag != OFFICE_TEXT
+                    and (parent.tag != SECTION or block is not None)):
+                continue
+
+            # Processed blocks of the document body are dropped to keep
+            # memory bounded. The last block stays, so the header of the
+            # next references list is still available. Nothing is dropped
+            # and no article is yielded while some element waits for its
+            # closing. Elements waiting for the end of their articles are
+            # kept with the following blocks.
+            if close_callbacks:
+                continue
+
+            if self.article_end_callbacks or self.block_callbacks:
+                held = self._held_nodes()
+            else:
+                held = ()
+
+            while element.getprevious() is not None and parent[0] not in held:
+                del parent[0]
+
+            for marks in article_ends:
+                yield self._take_article(marks, number_of_articles)
+                number_of_articles += 1
+            article_ends = []
+
+        self.article_end_callbacks += self.block_callbacks
+        self.block_callbacks = []
+        self._end_article(None)
+        instrument.count("nodes", nodes)
+
+        if split_articles and (article_ends or article_end is not None):
+            article_ends.append([(collector, collector.mark())
+                                 for collector in article_field_collectors])
+
+            for marks in article_ends:
+                yield self._take_article(marks, number_of_articles)
+                number_of_articles += 1
+
+
+def get_journal_name(styles) -> dict:
+    """
+    Gets journal names from page footers of parsed styles.xml
+    """
+
+    return odt.parse_journal_name_list(
+        [element_text(footer) for footer in styles.iter(FOOTER, FOOTER_LEFT)])
+
+
+@contextlib.contextmanager
+def open_issue(full_path_to_file):
+    """
+    Opens ODT file and returns context manager of tuple (parsed styles.xml,
+    StyleIndex of styles.xml, content.xml file). content.xml is decompressed
+    while it is parsed, so it is never held in memory as a whole; its text
+    is normalized by nodes (see IssueStream).
+    """
+
+    with OdtFile(full_path_to_file) as file:
+        with instrument.stage("styles_data"):
+            with file.open_member(STYLES_XML) as styles_file:
+                styles = etree.parse(styles_file).getroot()
+
+            style_index = StyleIndex()
+            for style in styles.iter(STYLE):
+                style_index.add_element(style)
+
+        with file.open_member(CONTENT_XML) as content_file:
+            yield styles, style_index, content_file
+
+
+def get_issue_fields(full_path_to_file) -> dict:
+    """
+    Returns dictionary of all fields of the issue in one pass over
+    content.xml
+    """
+
+    with open_issue(full_path_to_file) as (styles, style_index,
+                                           content_file):
+        with instrument.stage("stream"):
+            issue_stream = IssueStream(content_file, default_collectors(),
+                                       style_index)
+            issue_fields = issue_stream.run()
+
+    with instrument.stage("journal_name"):
+        issue_fields["journal_name"] = get_journal_name(styles)
+
+    return issue_fields
+
+
+def iter_issue_articles(full_path_to_file):
+    """
+    Yields issue fields (journal_name, issue_pub_dates,
+    through_issue_number) first, then fields of each article (see
+    IssueStream.iter_articles) in one pass over content.xml. Fields of an
+    article are released after it is read, so memory does not grow with
+    the number of articles. The issue fields are gathered from the nodes
+    before the end of the first article. Raises LayoutError after the
+    last article if the number of articles differs from the number of
+    citations.
+    """
+
+    with open_issue(full_path_to_file) as (styles, style_index,
+                                           content_file):
+        citations = NumberOfArticlesCollector()
+        issue_stream = IssueStream(content_file,
+                                   issue_collectors() + [citations]
+                                   + article_collectors(), style_index)
+
+        articles = issue_stream.iter_articles()
+        first_article = next(articles, None)
+
+        issue_fields = issue_stream.issue_fields()
+        # Цитирования еще не подсчитаны до конца документа
+        del issue_fields[citations.field]
+        issue_fields["journal_name"] = get_journal_name(styles)
+
+        yield issue_fields
+
+        number_of_articles = 0
+        if first_article is not None:
+            yield first_article
+            number_of_articles += 1
+
+            for article in articles:
+                yield article
+                number_of_articles += 1
+
+        if number_of_articles != citations.result():
+            raise odt.LayoutError(
+                f"Выделено статей: {number_of_articles}, найдено цитирований:"
+                f" {citations.result()}. Неверно оформлен макет выпуска.")
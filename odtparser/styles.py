@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Style index of an ODT document. Built once per document, maps automatic
+styles to their parent styles and effective text properties, so extractors
+resolve styles without searching or mutating the document tree.
+"""
+
+
+class StyleIndex:
+    """
+    Index of document styles: style name → parent style name → effective
+    text properties (italic, bold, etc.)
+    """
+
+    def __init__(self):
+        # Style name mapped to parent style name
+        self.parent_styles = {}
+        # Style name mapped to its own text properties. Property names are
+        # stored without namespace prefix: "font-style", "font-weight".
+        self.text_properties = {}
+        self._effective_properties = {}
+
+    @classmethod
+    def from_soup(cls, *soups):
+        """
+        Builds index from BeautifulSoup trees of styles.xml and content.xml.
+        Styles of the later trees override styles with the same name, so
+        content.xml should go last.
+        """
+
+        style_index = cls()
+
+        for soup in soups:
+            for style in soup.find_all("style:style"):
+                text_properties = style.find("style:text-properties")
+                if text_properties is None:
+                    text_properties = {}
+                else:
+                    text_properties = text_properties.attrs
+
+                style_index.add_style(
+                    style.get("style:name"),
+                    style.get("style:parent-style-name"),
+                    text_properties,
+                )
+
+        return style_index
+
+    def add_element(self, element):
+        """
+        Adds style:style element of lxml tree to the index
+        """
+
+        name = parent_name = None
+        for key, value in element.attrib.items():
+            if key.endswith("}name"):
+                name = value
+            elif key.endswith("}parent-style-name"):
+                parent_name = value
+
+        text_properties = {}
+        for child in element:
+            if child.tag.endswith("}text-properties"):
+                text_properties = child.attrib
+
+        self.add_style(name, parent_name, text_properties)
+
+    def add_style(self, name, parent_name, text_properties):
+        if name is None:
+            return
+
+        if parent_name is not None:
+            self.parent_styles[name] = parent_name
+        else:
+            self.parent_styles.pop(name, None)
+
+        self.text_properties[name] = {
+            _local_name(key): value for key, value in text_properties.items()
+        }
+        self._effective_properties.clear()
+
+    def parent_style(self, name):
+        """
+        Returns parent style name or None
+        """
+
+        return self.parent_styles.get(name)
+
+    def resolve(self, name, parent_names) -> str:
+        """
+        Returns parent style name if style inherits one of parent_names,
+        otherwise returns the style name itself. LibreOffice creates
+        automatic styles (P1, P2...) for manually edited paragraphs, so
+        "P5" with parent "СтатьяРубрикаРус" resolves to "СтатьяРубрикаРус".
+        """
+
+        parent_name = self.parent_styles.get(name)
+
+        if parent_name in parent_names:
+            return parent_name
+
+        return name
+
+    def effective_properties(self, name) -> dict:
+        """
+        Returns text properties of style merged with properties of its
+        parents
+        """
+
+        properties = self._effective_properties.get(name)
+
+        if properties is None:
+            chain = []
+            style_name = name
+            while style_name is not None and style_name not in chain:
+                chain.append(style_name)
+                style_name = self.parent_styles.get(style_name)
+
+            properties = {}
+            for style_name in reversed(chain):
+                properties.update(self.text_properties.get(style_name, {}))
+
+            self._effective_properties[name] = properties
+
+        return properties
+
+    def is_italic(self, name) -> bool:
+        return self.effective_properties(name).get("font-style") == "italic"
+
+    def is_bold(self, name) -> bool:
+        return self.effective_properties(name).get("font-weight") == "bold"
+
+
+def _local_name(attribute_name: str) -> str:
+    """
+    Returns attribute name without namespace: "fo:font-style" and
+    "{urn:...}font-style" become "font-style"
+    """
+
+    return attribute_name.rsplit("}", 1)[-1].rsplit(":", 1)[-1]
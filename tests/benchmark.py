@@ -0,0 +1,245 @@
+"""
+Бенчмарк разбора синтетических выпусков (tests/odtfactory.py).
+
+Для каждого размера выпуска измеряет этапы OdtParser (разбор XML, индекс
+стилей и абзацев, каждый get_* метод) и export.get_issue_data. Результаты
+сохраняются в JSON, чтобы сравнивать их между коммитами:
+
+    python -m tests.benchmark -o before.json
+    python -m tests.benchmark -o after.json --compare before.json
+    python -m tests.benchmark --sizes 5 50 --backends lxml
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from tests.odtfactory import write_issue
+
+DEFAULT_SIZES = (5, 50, 500, 2000)
+DEFAULT_BACKENDS = ("bs4", "lxml")
+
+# Этапы, общие для всех get_* методов: измеряются отдельно, чтобы время
+# метода не включало разбор документа
+PARSER_STAGES = ("styles_data", "content_data", "style_index", "paragraphs")
+
+
+def get_commit():
+    """
+    Returns current git commit of the repository or None
+    """
+
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timed(function):
+    """
+    Returns (wall time in seconds, result) of function call
+    """
+
+    # Мусор предыдущих измерений (деревья bs4 с циклическими ссылками) не
+    # должен собираться во время этого
+    gc.collect()
+
+    start = time.perf_counter()
+    result = function()
+
+    return time.perf_counter() - start, result
+
+
+def best_time(function, repeat):
+    return min(timed(function)[0] for _ in range(repeat))
+
+
+def benchmark_parser(path, backend, repeat=1) -> dict:
+    """
+    Returns timings of OdtParser stages and get_* methods
+    """
+
+    from odtparser.odtparser import OdtParser
+
+    getters = sorted(name for name in dir(OdtParser)
+                     if name.startswith("get_"))
+    timings = {}
+
+    for _ in range(repeat):
+        odt_parser = OdtParser(path, backend=backend)
+
+        for name in PARSER_STAGES:
+            elapsed = timed(lambda: getattr(odt_parser, name))[0]
+            timings[name] = min(timings.get(name, elapsed), elapsed)
+
+        for name in getters:
+            elapsed = timed(getattr(odt_parser, name))[0]
+            timings[name] = min(timings.get(name, elapsed), elapsed)
+
+    def parse_issue():
+        odt_parser = OdtParser(path, backend=backend)
+        return [getattr(odt_parser, name)() for name in getters]
+
+    timings["total"] = best_time(parse_issue, repeat)
+
+    return timings
+
+
+def benchmark_issue(articles, backends=DEFAULT_BACKENDS, references=10,
+                    paragraphs=8, sentence_words=12, repeat=1,
+                    tmp_dir=None) -> dict:
+    """
+    Generates issue with the number of articles and returns its timings
+    """
+
+    import odtparser.export as export
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as issue_dir:
+        path = write_issue(os.path.join(issue_dir, "issue.odt"),
+                           articles=articles, references=references,
+                           paragraphs=paragraphs,
+                           sentence_words=sentence_words, english_every=4)
+
+        result = {
+            "articles": articles,
+            "references": references,
+            "paragraphs": paragraphs,
+            "sentence_words": sentence_words,
+            "file_size": os.path.getsize(path),
+            "get_issue_data": best_time(
+                lambda: export.get_issue_data(path), repeat),
+            "parser": {},
+        }
+
+        for backend in backends:
+            result["parser"][backend] = benchmark_parser(path, backend,
+                                                         repeat)
+
+    return result
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, backends=DEFAULT_BACKENDS,
+                  progress=None, **params) -> dict:
+    """
+    Returns benchmark report for issues of the given sizes
+    """
+
+    results = []
+
+    for articles in sizes:
+        result = benchmark_issue(articles, backends, **params)
+        results.append(result)
+
+        if progress is not None:
+            progress(result)
+
+    return {
+        "commit": get_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def iter_timings(report):
+    """
+    Yields ((articles, stage name), seconds) of the report
+    """
+
+    for result in report["results"]:
+        articles = result["articles"]
+        yield (articles, "get_issue_data"), result["get_issue_data"]
+
+        for backend, timings in result["parser"].items():
+            for name, seconds in timings.items():
+                yield (articles, f"{backend}.{name}"), seconds
+
+
+def compare_reports(old_report, new_report) -> list:
+    """
+    Returns rows (articles, stage, old time, new time, new / old) for stages
+    present in both reports
+    """
+
+    old_timings = dict(iter_timings(old_report))
+    rows = []
+
+    for key, new_time in iter_timings(new_report):
+        old_time = old_timings.get(key)
+        if old_time is None:
+            continue
+
+        ratio = new_time / old_time if old_time else float("inf")
+        rows.append((key[0], key[1], old_time, new_time, ratio))
+
+    return rows
+
+
+def print_result(result):
+    print(f"{result['articles']} статей ({result['file_size']} байт): "
+          f"get_issue_data {result['get_issue_data']:.3f} с", end="")
+
+    for backend, timings in result["parser"].items():
+        print(f", OdtParser[{backend}] {timings['total']:.3f} с", end="")
+
+    print(flush=True)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Benchmark of parsing synthetic issues")
+    arg_parser.add_argument("--sizes", type=int, nargs="+",
+                            default=list(DEFAULT_SIZES),
+                            help="numbers of articles in issues")
+    arg_parser.add_argument("--backends", nargs="+",
+                            default=list(DEFAULT_BACKENDS),
+                            choices=list(DEFAULT_BACKENDS),
+                            help="OdtParser backends")
+    arg_parser.add_argument("--references", type=int, default=10,
+                            help="references in each list")
+    arg_parser.add_argument("--paragraphs", type=int, default=8,
+                            help="paragraphs in each article text")
+    arg_parser.add_argument("--sentence-words", type=int, default=12,
+                            help="words in each sentence of article text")
+    arg_parser.add_argument("-r", "--repeat", type=int, default=1,
+                            help="best of the number of runs")
+    arg_parser.add_argument("-o", "--output", help="JSON file for results")
+    arg_parser.add_argument("--compare",
+                            help="JSON file with results to compare with")
+    args = arg_parser.parse_args(argv)
+
+    report = run_benchmark(args.sizes, args.backends,
+                           progress=print_result,
+                           references=args.references,
+                           paragraphs=args.paragraphs,
+                           sentence_words=args.sentence_words,
+                           repeat=args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as compare_file:
+            old_report = json.load(compare_file)
+
+        for articles, name, old_time, new_time, ratio in compare_reports(
+                old_report, report):
+            print(f"{articles:5} {name:45} {old_time:9.4f} {new_time:9.4f} "
+                  f"{ratio:6.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+"""
+Модуль формирует синтетические ODT-макеты выпусков журналов для тестов.
+
+Макет повторяет оформление реальных выпусков: стили СтатьяРубрика*,
+СтатьяАвторы*, СтатьяАффилиация*, СтатьяСписокЛит*, абзацы для цитирования,
+таблицы с историей статьи и аннотацией, разделы Статья<n> с подстраничными
+сносками и списками.
+"""
+
+import io
+import os
+import random
+import tempfile
+import unittest
+import zipfile
+from xml.sax.saxutils import escape
+
+from odtparser.journals_info import JOURNAL_NAMES_RU_LIST, \
+    JOURNAL_NAMES_EN_LIST, MONTHS_RU_LIST, MONTHS_EN_LIST, RUBRICS_DICT
+
+
+NAMESPACES = (
+    'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+    'xmlns:style="urn:oasis:names:tc:opendocument:xmlns:style:1.0" '
+    'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+    'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+    'xmlns:fo="urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0" '
+    'office:version="1.2"'
+)
+
+SURNAMES = [("Попов", "Popov"), ("Симонова", "Simonova"),
+            ("Тихонова", "Tikhonova"), ("Леонов", "Leonov"),
+            ("Пронин", "Pronin"), ("Балашова", "Balashova"),
+            ("Строева", "Stroeva"), ("Косов", "Kosov"),
+            ("Назарова", "Nazarova"), ("Дмитриева", "Dmitrieva")]
+
+NAMES = [("Евгений", "Evgenii", "Е", "E"), ("Виктория", "Viktoriya", "В", "V"),
+         ("Анна", "Anna", "А", "A"), ("Михаил", "Mikhail", "М", "M"),
+         ("Ольга", "Ol'ga", "О", "O"), ("Юлия", "Yuliya", "Ю", "Yu")]
+
+PATRONYMICS = [("Васильевич", "В", "V"), ("Львовна", "Л", "L"),
+               ("Дмитриевна", "Д", "D"), ("Евгеньевич", "Е", "E"),
+               ("Андреевна", "А", "A")]
+
+WORKPLACES = [
+    ("Уральский федеральный университет, Екатеринбург, Российская Федерация",
+     "Ural Federal University, Yekaterinburg, Russian Federation"),
+    ("Финансовый университет при Правительстве РФ, Москва, Российская "
+     "Федерация",
+     "Financial University under Government of Russian Federation, Moscow, "
+     "Russian Federation"),
+    ("Институт экономики УрО РАН, Екатеринбург, Российская Федерация",
+     "Institute of Economics of Ural Branch of RAS, Yekaterinburg, Russian "
+     "Federation"),
+]
+
+WORDS_RU = ("экономический рынок развитие показатели регионы институты "
+            "доверие отрасли деятельность предприятий анализ модели "
+            "взаимодействия производства выводы результаты исследования "
+            "политики государства стоимость капитала эффективность "
+            "управления населения субъектов инвестиции ресурсы").split()
+
+WORDS_EN = ("economic market development indicators regions institutions "
+            "trust industries activity enterprises analysis models "
+            "interaction production findings results research policy "
+            "government value capital efficiency management population "
+            "investment resources").split()
+
+SUPERSCRIPTS = "abcdef"
+
+
+def _p(text, style="Standard"):
+    return f'<text:p text:style-name="{style}">{text}</text:p>'
+
+
+def _words(rnd, words, count):
+    return " ".join(rnd.choice(words) for _ in range(count))
+
+
+def _sentence(rnd, words, count=12):
+    sentence = _words(rnd, words, count)
+    return sentence[0].upper() + sentence[1:] + "."
+
+
+class IssueBuilder:
+    """
+    Собирает content.xml и styles.xml синтетического выпуска журнала.
+    """
+
+    def __init__(self, articles=5, references=10, paragraphs=8,
+                 english_every=0, journal=1, seed=0, sentence_words=12,
+                 columns=False, abstract_every=0):
+        self.articles = articles
+        self.references = references
+        # Длина текста статьи: число абзацев и слов в предложении
+        self.paragraphs = paragraphs
+        self.sentence_words = sentence_words
+        self.english_every = english_every
+        self.journal = journal
+        # Статьи вложены в раздел с колонками
+        self.columns = columns
+        # Аннотация каждой abstract_every статьи в теле документа, а не в
+        # таблице
+        self.abstract_every = abstract_every
+        self.rnd = random.Random(seed)
+        self.parts = []
+        self.table_number = 0
+        self.first_page = 800
+
+    def _table(self, paragraphs_by_cell):
+        self.table_number += 1
+        name = f"Таблица{self.table_number}"
+        cells = []
+        for column, paragraphs in zip("ABCD", paragraphs_by_cell):
+            cells.append(
+                f'<table:table-cell table:style-name="{name}.{column}1" '
+                f'office:value-type="string">{"".join(paragraphs)}'
+                '</table:table-cell>'
+            )
+        return (f'<table:table table:name="{name}" '
+                f'table:style-name="{name}">'
+                f'<table:table-row>{"".join(cells)}</table:table-row>'
+                '</table:table>')
+
+    def _authors(self, number):
+        authors = []
+        for i in range(self.rnd.randint(1, 3)):
+            surname = SURNAMES[(number + i) % len(SURNAMES)]
+            name = NAMES[(number * 3 + i) % len(NAMES)]
+            patronymic = PATRONYMICS[(number + 2 * i) % len(PATRONYMICS)]
+            workplace = WORKPLACES[(number + i) % len(WORKPLACES)]
+            has_orcid = (number + i) % 3 != 0
+            has_spin = (number + i) % 4 != 0
+            authors.append({
+                "full_ru": f"{name[0]} {patronymic[0]} {surname[0].upper()}",
+                "full_en": f"{name[1]} {patronymic[2]}. "
+                           f"{surname[1].upper()}",
+                "short_ru": f"{surname[0]} {name[2]}.{patronymic[1]}.",
+                "short_en": f"{surname[1]} {name[3]}.{patronymic[2]}.",
+                "workplace": workplace,
+                "email": f"{surname[1].lower()}{number}@mail.ru",
+                "orcid": (f"https://orcid.org/0000-000{i}-{1000 + number}-"
+                          f"{2000 + i}") if has_orcid else None,
+                "spin": f"{1000 + number}-{5000 + i}" if has_spin else None,
+            })
+        return authors
+
+    def _authors_paragraph(self, authors, lang, style):
+        key = "full_ru" if lang == "ru" else "full_en"
+        names = []
+        for i, author in enumerate(authors):
+            if len(authors) > 1:
+                names.append(
+                    f'{author[key]}<text:span text:style-name="T4">'
+                    f'{SUPERSCRIPTS[i]}</text:span>')
+            else:
+                names.append(author[key])
+        return _p(", ".join(names) + "•", style)
+
+    def _affiliation_table(self, authors, lang, style):
+        paragraphs = []
+        for i, author in enumerate(authors):
+            workplace = author["workplace"][0 if lang == "ru" else 1]
+            if len(authors) > 1:
+                workplace = f"{SUPERSCRIPTS[i]} {workplace}"
+            paragraphs.append(_p(escape(workplace), style))
+            paragraphs.append(_p(author["email"], style))
+            if author["orcid"]:
+                paragraphs.append(_p(author["orcid"], style))
+            elif lang == "ru":
+                paragraphs.append(_p("ORCID: отсутствует", style))
+            else:
+                paragraphs.append(_p("ORCID: not available", style))
+            if lang == "ru":
+                spin = author["spin"] or "отсутствует"
+                paragraphs.append(_p(f"SPIN-код: {spin}", style))
+        if lang == "ru":
+            paragraphs.append(_p("• Ответственный автор", style))
+        else:
+            paragraphs.append(_p("• Corresponding author", style))
+        return self._table([paragraphs])
+
+    def _history_table(self, number, lang):
+        day = 10 + number % 18
+        if lang == "ru":
+            history = [
+                _p("История статьи:", "СтатьяИстория"),
+                _p(f"Рег. № {300 + number}/2019"),
+                _p(f"Получена {day:02}.02.2019"),
+                _p(f"Получена в доработанном виде {day:02}.03.2019"),
+                _p(f"Одобрена {day:02}.04.2019"),
+                _p(f"Доступна онлайн {day:02}.05.2019"),
+                _p(f"УДК 330.{number}"),
+                _p("JEL: B52, D02"),
+                _p("Ключевые слова: " + ", ".join(
+                    _words(self.rnd, WORDS_RU, 2) for _ in range(4))),
+            ]
+            abstract = [_p("Аннотация", "СтатьяАннотация")]
+            for title in ("Предмет.", "Цели.", "Методология.", "Результаты."):
+                abstract.append(_p(
+                    f"{title} {_sentence(self.rnd, WORDS_RU, 20)}"))
+            abstract.append(_p("© Издательский дом ФИНАНСЫ и КРЕДИТ, 2019"))
+        else:
+            history = [
+                _p("Article history:", "СтатьяИстория"),
+                _p(f"Received {day} February 2019"),
+                _p(f"Received in revised form {day} March 2019"),
+                _p(f"Accepted {day} April 2019"),
+                _p(f"Available online {day} May 2019"),
+                _p("JEL classification: B52, D02"),
+                _p("Keywords: " + ", ".join(
+                    _words(self.rnd, WORDS_EN, 2) for _ in range(4))),
+            ]
+            abstract = [_p("Abstract", "СтатьяАннотация")]
+            for title in ("Subject.", "Objectives.", "Methods.", "Results."):
+                abstract.append(_p(
+                    f"{title} {_sentence(self.rnd, WORDS_EN, 20)}"))
+            abstract.append(_p("© Publishing house FINANCE and CREDIT, 2019"))
+        if self.abstract_every and number % self.abstract_every == 0:
+            return self._table([history]) + "".join(abstract)
+        return self._table([history, abstract])
+
+    def _citation(self, authors, title, lang, pages):
+        if lang == "ru":
+            return _p(
+                "Для цитирования: "
+                + ", ".join(a["short_ru"] for a in authors)
+                + f" {title} // {JOURNAL_NAMES_RU_LIST[self.journal]}. – "
+                  f"2019. – Т. 18, № 5. – С. {pages[0]} – {pages[1]}.",
+                "СтатьяЦитирование")
+        return _p(
+            "Please cite this article as: "
+            + ", ".join(a["short_en"] for a in authors)
+            + f" {title}. {JOURNAL_NAMES_EN_LIST[self.journal]}, 2019, "
+              f"vol. 18, iss. 5, pp. {pages[0]}–{pages[1]}.",
+            "СтатьяЦитирование")
+
+    def _body(self, number, lang):
+        words = WORDS_RU if lang == "ru" else WORDS_EN
+
+        def sentence():
+            return _sentence(self.rnd, words, self.sentence_words)
+
+        parts = [f'<text:section text:style-name="Sect1" '
+                 f'text:name="Статья{number}">',
+                 '<text:h text:style-name="Heading" text:outline-level="1">'
+                 f'<text:span text:style-name="T2">'
+                 f'{_sentence(self.rnd, words, 4)}</text:span></text:h>']
+        for i in range(self.paragraphs):
+            kind = i % 5
+            if kind == 0:
+                parts.append(_p(
+                    f"{sentence()} <text:span "
+                    f'text:style-name="T1">{_words(self.rnd, words, 3)}'
+                    f"</text:span>, {sentence()}",
+                    "Text_20_body"))
+            elif kind == 1:
+                parts.append(_p(
+                    f"{sentence()}"
+                    f'<text:note text:id="ftn{number}_{i}" '
+                    'text:note-class="footnote"><text:note-citation>1'
+                    '</text:note-citation><text:note-body>'
+                    f'{_p(_sentence(self.rnd, words, 6), "Footnote")}'
+                    '</text:note-body></text:note> '
+                    f"{sentence()}", "Text_20_body"))
+            elif kind == 2:
+                items = "".join(
+                    f'<text:list-item>'
+                    f'{_p(_words(self.rnd, words, 5) + ";", "List")}'
+                    '</text:list-item>' for _ in range(3))
+                parts.append(f'<text:list text:style-name="L1">{items}'
+                             '</text:list>')
+            elif kind == 3:
+                parts.append(_p(
+                    f"{sentence()}<text:s/>"
+                    f"{sentence()}<text:line-break/>"
+                    f"{sentence()} ( {_words(self.rnd, words, 2)}"
+                    f" , {_words(self.rnd, words, 2)} ) № 5",
+                    "Text_20_body"))
+            else:
+                parts.append(_p(
+                    f"{sentence()}<text:soft-page-break/>"
+                    f"{sentence()}", "Text_20_body"))
+        parts.append("</text:section>")
+        return "".join(parts)
+
+    def _references(self, lang):
+        if lang == "ru":
+            header = _p("Список литературы", "СтатьяСписокЛитЗаголовок")
+            style = "СтатьяСписокЛит"
+            words = WORDS_RU
+        else:
+            header = _p("References", "СтатьяСписокЛитЗаголовок")
+            style = "СтатьяСписокЛитАнгл"
+            words = WORDS_EN
+        items = []
+        for i in range(self.references):
+            surname = SURNAMES[i % len(SURNAMES)][0 if lang == "ru" else 1]
+            items.append(
+                '<text:list-item><text:p text:style-name="P9">'
+                f'<text:bookmark text:name="ref{i}"/>{surname} A.B. '
+                f'<text:span text:style-name="T1">{_words(self.rnd, words, 3)}'
+                '</text:span><text:span text:style-name="T1"> '
+                f'{_words(self.rnd, words, 2)}</text:span>'
+                f'<text:s/>. <text:span text:style-name="T2">'
+                f'{_words(self.rnd, words, 2)}</text:span>'
+                f'<text:soft-page-break/>, 2018, no. {i + 1}, '
+                f'pp. {10 + i}–{20 + i}.</text:p></text:list-item>')
+        return (header + f'<text:list text:style-name="{style}">'
+                + "".join(items) + "</text:list>")
+
+    def _article(self, number):
+        english = self.english_every and number % self.english_every == 0
+        langs = ("en",) if english else ("ru", "en")
+        authors = self._authors(number)
+        rubric_ru, rubric_en = list(RUBRICS_DICT.items())[
+            number * 7 % len(RUBRICS_DICT)]
+        pages = (self.first_page, self.first_page + 15)
+        self.first_page += 16
+        title_ru = _sentence(self.rnd, WORDS_RU, 6)[:-1]
+        title_en = _sentence(self.rnd, WORDS_EN, 6)[:-1]
+
+        parts = []
+        for lang in langs:
+            suffix = "Рус" if lang == "ru" else "Англ"
+            # Half of the articles use automatic styles inherited from the
+            # named ones, as LibreOffice writes them after manual edits.
+            auto = number % 2 == 0
+            parts.append(_p(rubric_ru if lang == "ru" else rubric_en,
+                            f"P_R{suffix}" if auto else
+                            f"СтатьяРубрика{suffix}"))
+            parts.append(_p(title_ru if lang == "ru" else title_en,
+                            f"СтатьяНазвание{suffix}"))
+            parts.append(self._authors_paragraph(
+                authors, lang,
+                f"P_A{suffix}" if auto else f"СтатьяАвторы{suffix}"))
+            parts.append(self._affiliation_table(
+                authors, lang,
+                f"P_F{suffix}" if auto else f"СтатьяАффилиация{suffix}"))
+            parts.append(self._history_table(number, lang))
+            parts.append(self._citation(
+                authors, title_ru if lang == "ru" else title_en, lang, pages))
+        parts.append(self._body(number, langs[0]))
+        for lang in langs:
+            parts.append(self._references(lang))
+        return "".join(parts)
+
+    def content_xml(self):
+        styles = []
+        for suffix in ("Рус", "Англ"):
+            for short, full in (("R", "СтатьяРубрика"), ("A", "СтатьяАвторы"),
+                                ("F", "СтатьяАффилиация")):
+                styles.append(
+                    f'<style:style style:name="P_{short}{suffix}" '
+                    'style:family="paragraph" '
+                    f'style:parent-style-name="{full}{suffix}"/>')
+        styles.append('<style:style style:name="P9" style:family="paragraph" '
+                      'style:parent-style-name="СтатьяСписокЛит"/>')
+        for name, props in (("T1", 'fo:font-style="italic"'),
+                            ("T2", 'fo:font-weight="bold"'),
+                            ("T4", 'style:text-position="super 58%"')):
+            styles.append(
+                f'<style:style style:name="{name}" style:family="text">'
+                f'<style:text-properties {props}/></style:style>')
+
+        month_ru = MONTHS_RU_LIST[4].capitalize()
+        month_en = MONTHS_EN_LIST[4].capitalize()
+        body = [
+            _p("Том 18, выпуск 5", "ТитулНомерРус"),
+            _p(f"{month_ru} 2019", "ТитулГодРус"),
+            _p("Volume 18, Issue 5", "ТитулНомерАнгл"),
+            _p(f"{month_en} 2019", "ТитулГодАнгл"),
+            _p("Валовый (сквозной) номер 488 выпуска", "Выходные"),
+        ]
+        articles = [self._article(number)
+                    for number in range(1, self.articles + 1)]
+        if self.columns:
+            articles = ['<text:section text:style-name="Sect2" '
+                        'text:name="Columns">', *articles, '</text:section>']
+        body.extend(articles)
+
+        return ('<?xml version="1.0" encoding="UTF-8"?>'
+                f'<office:document-content {NAMESPACES}>'
+                f'<office:automatic-styles>{"".join(styles)}'
+                '</office:automatic-styles><office:body><office:text>'
+                f'{"".join(body)}</office:text></office:body>'
+                '</office:document-content>')
+
+    def styles_xml(self):
+        journal_ru = JOURNAL_NAMES_RU_LIST[self.journal]
+        footer = _p(f"{journal_ru}. 2019. Т. 18, № 5", "Footer")
+        return ('<?xml version="1.0" encoding="UTF-8"?>'
+                f'<office:document-styles {NAMESPACES}><office:master-styles>'
+                '<style:master-page style:name="Standard">'
+                f'<style:footer>{footer}</style:footer>'
+                f'<style:footer-left>{footer}</style:footer-left>'
+                '</style:master-page></office:master-styles>'
+                '</office:document-styles>')
+
+
+def build_issue(**params) -> bytes:
+    """
+    Returns synthetic ODT issue as bytes. Parameters are passed to
+    IssueBuilder.
+    """
+
+    builder = IssueBuilder(**params)
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as odt:
+        odt.writestr("mimetype", "application/vnd.oasis.opendocument.text",
+                     compress_type=zipfile.ZIP_STORED)
+        odt.writestr("content.xml", builder.content_xml())
+        odt.writestr("styles.xml", builder.styles_xml())
+
+    return buffer.getvalue()
+
+
+def write_issue(path, **params):
+    """
+    Writes synthetic ODT issue to path and returns the path.
+    """
+
+    with open(path, "wb") as odt_file:
+        odt_file.write(build_issue(**params))
+
+    return path
+
+
+class IssueTestCase(unittest.TestCase):
+    """
+    Base of tests on synthetic issues in a temporary directory tmp_dir,
+    which is removed after the tests of the class. If issue_params is set,
+    the issue with these parameters is written to odt_path.
+    """
+
+    issue_params = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+
+        if cls.issue_params is not None:
+            cls.odt_path = cls.write_issue("a.odt", **cls.issue_params)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+        super().tearDownClass()
+
+    @classmethod
+    def write_issue(cls, file_name, **params):
+        """
+        Writes synthetic issue to file_name in tmp_dir and returns its path
+        """
+
+        return write_issue(os.path.join(cls.tmp_dir.name, file_name),
+                           **params)
@@ -0,0 +1,99 @@
+import random
+import re
+import time
+import unittest
+
+from odtparser.affiliation import find_author_data
+
+# Регулярное выражение, которое заменил токенизатор
+AUTHOR_DATA_REGEX = re.compile(
+    r"(?P<workplace>[0-9a-zA-Zа-яА-ЯёЁ\&\s,\(\)\.\«\»\-\;\']+?)\b"
+    r"(?P<email>[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~\-]+@[a-zA-Z0-9.\-]"
+    r"+\.[a-zA-Z]{2,})\b\s+\b(?P<orcid>https://orcid.org[/\dX\-]"
+    r"+|ORCID:\snot\savailable|ORCID:\sотсутствует)?\s"
+    r"(?P<spin>SPIN-код:\s\d\d\d\d-\d\d\d\d|SPIN-код:\s"
+    r"отсутствует)?"
+)
+
+WORKPLACES = (
+    "а Финансовый университет при Правительстве РФ, Москва, Российская "
+    "Федерация",
+    "b Financial University under Government of Russian Federation, "
+    "Moscow, Russian Federation",
+    "Институт экономики (УрО РАН), г. Екатеринбург, Российская Федерация",
+    "St. Petersburg State University of Economics; «ФИНЭК», Russia",
+)
+EMAILS = ("ivanov@mail.ru", "j.smith-2@fa.edu.ru", "o'neil+news@e-mail.com")
+ORCIDS = ("https://orcid.org/0000-0001-2345-678X", "ORCID: not available",
+          "ORCID: отсутствует")
+SPINS = ("SPIN-код: 1234-5678", "SPIN-код: отсутствует", "")
+
+# Фрагменты для случайных строк: якоря, их искажения и разделители
+FRAGMENTS = (
+    "a", "Б", "x1", " ", " ", ", ", ".", "-", "_", "'", "«", "»", "(", ")",
+    ":", "/", "@", "@mail.ru", "@a.b", ".ru", ".r", "mail", "user.name",
+    "!", "+", "–", "https://orcid.org/0000-0001", "https://orcid.org/",
+    "X", "ORCID: not available", "ORCID: отсутствует", "ORCID:",
+    "SPIN-код: 1234-5678", "SPIN-код: отсутствует", "SPIN-код: 12",
+    "Университет", "University",
+)
+
+
+def well_formed_block(rnd) -> str:
+    authors = []
+    for _ in range(rnd.randint(1, 4)):
+        author = [rnd.choice(WORKPLACES), rnd.choice(EMAILS),
+                  rnd.choice(ORCIDS), rnd.choice(SPINS)]
+        authors.append(" ".join(part for part in author if part))
+    return " ".join(authors) + " "
+
+
+class TestFindAuthorData(unittest.TestCase):
+
+    def assert_same_as_regex(self, text):
+        self.assertEqual(find_author_data(text),
+                         AUTHOR_DATA_REGEX.findall(text), repr(text))
+
+    def test_well_formed_blocks(self):
+        rnd = random.Random(1)
+        for _ in range(500):
+            self.assert_same_as_regex(well_formed_block(rnd))
+
+    def test_example(self):
+        self.assertEqual(
+            find_author_data("а Университет, Москва ivanov@mail.ru "
+                             "ORCID: отсутствует SPIN-код: 1234-5678 "),
+            [("а Университет, Москва ", "ivanov@mail.ru",
+              "ORCID: отсутствует", "SPIN-код: 1234-5678")])
+
+    def test_fuzz(self):
+        rnd = random.Random(2)
+        for _ in range(5000):
+            self.assert_same_as_regex("".join(
+                rnd.choice(FRAGMENTS) for _ in range(rnd.randint(1, 30))))
+
+    def test_fuzz_mutated_blocks(self):
+        rnd = random.Random(3)
+        for _ in range(2000):
+            text = list(well_formed_block(rnd))
+            for _ in range(rnd.randint(1, 3)):
+                position = rnd.randrange(len(text))
+                text[position:position + rnd.randint(0, 2)] = rnd.choice(
+                    FRAGMENTS)
+            self.assert_same_as_regex("".join(text))
+
+    def test_adversarial_inputs_are_linear(self):
+        # На этих строках регулярное выражение тратит секунды уже при
+        # длине 10^4
+        for unit, tail in (("Университет, ", "ivanov@mail.ru нет"),
+                           ("a.b-c ", "x@y"),
+                           ("a ", "a@b.ru https://orcid.org/0-0x ")):
+            text = unit * (200000 // len(unit)) + tail
+
+            start = time.perf_counter()
+            find_author_data(text)
+            self.assertLess(time.perf_counter() - start, 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import pickle
+import sys
+import unittest
+
+import odtparser.article as article
+import odtparser.export as export
+from tests.odtfactory import IssueTestCase
+
+
+class TestRecords(IssueTestCase):
+
+    issue_params = dict(articles=4, english_every=3, references=3)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.issue_data = export.get_issue_data(cls.odt_path)
+        cls.issue, cls.articles = export.get_issue_records(cls.odt_path)
+
+    def test_records_match_issue_data(self):
+        self.assertEqual(
+            article.issue_data_from_records(self.issue, self.articles),
+            self.issue_data)
+
+    def test_round_trip(self):
+        issue, articles = article.records_from_issue_data(self.issue_data)
+
+        self.assertEqual(issue, self.issue)
+        self.assertEqual(articles[0], self.articles[0])
+        self.assertEqual(article.issue_data_from_records(issue, articles),
+                         self.issue_data)
+
+    def test_english_article(self):
+        english = self.articles[2]
+
+        self.assertEqual(english.lang, "en")
+        self.assertNotIn("article_udk", english.to_dict())
+        self.assertNotIn("article_pages_range_en", english.to_dict())
+
+    def test_references(self):
+        references = self.articles[0].references_ru
+
+        self.assertEqual(len(references), 3)
+        self.assertTrue(references[0].html.startswith("<p>"))
+        self.assertEqual(
+            article.get_references(article.get_references_html(references)),
+            references)
+
+    def test_records_are_compact(self):
+        record = self.articles[0]
+
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertLess(sys.getsizeof(record) * 2,
+                        sys.getsizeof(record.to_dict()))
+        self.assertLess(sys.getsizeof(record.authors[0]) * 2,
+                        sys.getsizeof(record.authors[0].to_dict()))
+        # Ссылка хранит только HTML, текст получается из него
+        self.assertEqual(article.Reference.__slots__, ("html",))
+
+    def test_records_are_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(self.issue)
+
+    def test_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.articles)),
+                         self.articles)
+
+    def test_unknown_field(self):
+        with self.assertRaises(TypeError):
+            article.Reference(html="<p></p>", title="")
+
+
+if __name__ == '__main__':
+    unittest.main()
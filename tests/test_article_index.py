@@ -0,0 +1,67 @@
+import unittest
+
+import odtparser.odtparser as odt
+from odtparser.odtparser import OdtParser
+from tests.odtfactory import IssueTestCase
+
+S = odt.SECTION_NODE
+R = odt.REFERENCES_NODE
+
+
+class TestBuildArticleIndex(unittest.TestCase):
+
+    def test_articles_end_with_references(self):
+        # Титул, статья на двух языках, статья только на английском
+        node_kinds = [None, None, None, S, None, R, None, R,
+                      None, None, S, None, R, None]
+
+        self.assertEqual(odt.build_article_index(node_kinds),
+                         [odt.ArticleRange(0, 8), odt.ArticleRange(8, 14)])
+
+    def test_article_without_references(self):
+        node_kinds = [None, S, None, S, R]
+
+        self.assertEqual(odt.build_article_index(node_kinds),
+                         [odt.ArticleRange(0, 2), odt.ArticleRange(2, 5)])
+
+    def test_no_sections(self):
+        self.assertEqual(odt.build_article_index([None, R]), [])
+
+
+class TestArticleFields(IssueTestCase):
+
+    issue_params = dict(articles=4, english_every=3)
+
+    def test_fields_match_issue_lists(self):
+        for backend in ("bs4", "lxml"):
+            with self.subTest(backend=backend):
+                odt_parser = OdtParser(self.odt_path, backend=backend)
+                articles = [odt_parser.extract_article_fields(number)
+                            for number in range(4)]
+
+                self.assertEqual(len(odt_parser.article_index), 4)
+
+                for name in odt.ARTICLE_FIELDS:
+                    self.assertEqual(
+                        [article[name] for article in articles],
+                        getattr(odt_parser, name), name)
+
+    def test_single_article_does_not_index_issue(self):
+        odt_parser = OdtParser(self.odt_path)
+        article = odt_parser.extract_article_fields(2)
+
+        self.assertNotIn("paragraphs", odt_parser.__dict__)
+        self.assertEqual(article["citation_info"]["article_lang"], "en")
+
+    def test_following_texts_end_with_article(self):
+        odt_parser = OdtParser(self.odt_path, backend="lxml")
+        article_range = odt_parser.article_index[0]
+        node = odt_parser.body_nodes[article_range.start]
+
+        self.assertEqual(
+            len(odt_parser._following_texts(node)),
+            article_range.stop - article_range.start - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
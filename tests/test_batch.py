@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import unittest
+
+import odtparser.batch as batch
+import odtparser.odtparser as odt
+from tests.odtfactory import write_issue
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.tmp_dir.name, "manifest.json")
+        self.odt_paths = [
+            write_issue(os.path.join(self.tmp_dir.name, f"{i}.odt"),
+                        articles=2, journal=i, seed=i)
+            for i in range(2)
+        ]
+        self.broken_path = os.path.join(self.tmp_dir.name, "broken.odt")
+        with open(self.broken_path, "wb") as broken_file:
+            broken_file.write(b"not a zip")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_batch(self):
+        return batch.run_batch(self.odt_paths + [self.broken_path],
+                               self.manifest_path,
+                               output_dir=self.tmp_dir.name)
+
+    def test_rerun_processes_failed_and_changed_files(self):
+        summary = self.run_batch()
+
+        self.assertEqual(summary["done"], self.odt_paths)
+        self.assertEqual(summary["failed"], [self.broken_path])
+
+        with open(self.manifest_path, encoding="utf-8") as manifest_file:
+            entries = json.load(manifest_file)["files"]
+        statuses = {entry["path"]: entry["status"]
+                    for entry in entries.values()}
+        self.assertEqual(statuses[self.broken_path], "failed")
+        for entry in entries.values():
+            if entry["status"] == "done":
+                self.assertTrue(os.path.isfile(entry["output"]))
+            else:
+                self.assertIn("BadZipFile", entry["error"])
+
+        # Исправленный и измененный файлы обрабатываются заново
+        write_issue(self.broken_path, articles=1, journal=3)
+        write_issue(self.odt_paths[1], articles=3, journal=1, seed=5)
+
+        summary = self.run_batch()
+
+        self.assertEqual(summary["skipped"], [self.odt_paths[0]])
+        self.assertEqual(summary["done"],
+                         [self.odt_paths[1], self.broken_path])
+        self.assertEqual(summary["failed"], [])
+        self.assertEqual(len(batch.Manifest(self.manifest_path).entries), 3)
+
+    def test_missing_output_is_reprocessed(self):
+        self.run_batch()
+        manifest = batch.Manifest(self.manifest_path)
+        os.remove(manifest.get(batch.get_file_hash(self.odt_paths[0]))
+                  ["output"])
+
+        summary = self.run_batch()
+
+        self.assertEqual(summary["done"], [self.odt_paths[0]])
+        self.assertEqual(summary["skipped"], [self.odt_paths[1]])
+
+    def test_outputs_are_named_by_input_files(self):
+        # Выпуски одного журнала не перезаписывают друг друга
+        same_journal_path = write_issue(
+            os.path.join(self.tmp_dir.name, "2.odt"), articles=1,
+            journal=1, seed=2)
+        output_dir = os.path.join(self.tmp_dir.name, "out")
+        os.mkdir(output_dir)
+
+        summary = batch.run_batch(self.odt_paths + [same_journal_path],
+                                  self.manifest_path, output_dir=output_dir)
+
+        self.assertEqual(len(summary["done"]), 3)
+        self.assertEqual(sorted(os.listdir(output_dir)),
+                         ["0.json", "1.json", "2.json"])
+
+    def test_same_output_name_fails(self):
+        other_dir = os.path.join(self.tmp_dir.name, "other")
+        os.mkdir(other_dir)
+        other_path = write_issue(os.path.join(other_dir, "0.odt"),
+                                 articles=1, journal=1, seed=3)
+
+        summary = batch.run_batch(
+            [self.odt_paths[0], other_path], self.manifest_path,
+            output_dir=self.tmp_dir.name)
+
+        self.assertEqual(summary["done"], [self.odt_paths[0]])
+        self.assertEqual(summary["failed"], [other_path])
+        entry = batch.Manifest(self.manifest_path).get(
+            batch.get_file_hash(other_path))
+        self.assertIn("совпадает", entry["error"])
+
+    def test_atomic_write_keeps_error_of_open(self):
+        path = os.path.join(self.tmp_dir.name, "missing", "manifest.json")
+
+        with self.assertRaises(FileNotFoundError) as context:
+            batch.write_json_atomic({}, path)
+
+        self.assertIsNone(context.exception.__context__)
+
+
+
+class TestLayoutError(unittest.TestCase):
+
+    def test_bad_citation_raises(self):
+        with self.assertRaises(odt.LayoutError):
+            odt.get_info_from_citation_str_ru("Для цитирования: ...")
+
+    def test_unknown_footer_raises(self):
+        with self.assertRaises(odt.LayoutError):
+            odt.parse_journal_name_list(["Неизвестный журнал"])
+
+
+if __name__ == '__main__':
+    unittest.main()
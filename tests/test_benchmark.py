@@ -0,0 +1,27 @@
+import json
+import unittest
+
+from tests import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_report(self):
+        report = benchmark.run_benchmark(sizes=[2], backends=["lxml"],
+                                         paragraphs=3)
+        # Отчет сохраняется в JSON
+        report = json.loads(json.dumps(report))
+
+        result = report["results"][0]
+        self.assertEqual(result["articles"], 2)
+        self.assertIn("get_article_references_list",
+                      result["parser"]["lxml"])
+        self.assertIn("content_data", result["parser"]["lxml"])
+
+        rows = benchmark.compare_reports(report, report)
+        self.assertEqual(len(rows), len(dict(benchmark.iter_timings(report))))
+        self.assertTrue(all(row[4] == 1.0 or row[2] == 0 for row in rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+
+import odtparser.cache as odt_cache
+import odtparser.export as export
+from odtparser.journals import JournalRegistry
+from tests.odtfactory import write_issue
+
+
+def count_misses(cache_dir):
+    with odt_cache.IssueCache(cache_dir) as cache:
+        for _ in range(50):
+            cache.get("missing")
+
+
+class TestIssueCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        self.odt_path = write_issue(os.path.join(self.tmp_dir.name, "a.odt"),
+                                    articles=3)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cached_issue_data(self):
+        cache = odt_cache.IssueCache(self.cache_dir)
+
+        issue_data = export.get_issue_data(self.odt_path, cache)
+        cached_issue_data = export.get_issue_data(self.odt_path, cache)
+
+        self.assertEqual(cached_issue_data, issue_data)
+        self.assertEqual(export.get_issue_data(self.odt_path), issue_data)
+
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+        self.assertEqual(cache.purge(), 1)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_key_depends_on_content_and_parser_version(self):
+        key = odt_cache.get_issue_key(self.odt_path)
+
+        self.assertEqual(odt_cache.get_issue_key(self.odt_path), key)
+        self.assertNotEqual(
+            odt_cache.get_issue_key(self.odt_path, parser_version="0"), key)
+
+        write_issue(self.odt_path, articles=3, seed=1)
+        self.assertNotEqual(odt_cache.get_issue_key(self.odt_path), key)
+
+    def test_key_depends_on_journals_registry(self):
+        registry = JournalRegistry.from_journals_info()
+        key = odt_cache.get_issue_key(self.odt_path, registry=registry)
+
+        self.assertEqual(odt_cache.get_issue_key(self.odt_path), key)
+
+        registry.add_rubric("Новая рубрика", "New Rubric")
+        self.assertNotEqual(
+            odt_cache.get_issue_key(self.odt_path, registry=registry), key)
+
+    def test_counters_of_parallel_processes(self):
+        with multiprocessing.Pool(4) as pool:
+            pool.map(count_misses, [self.cache_dir] * 4)
+
+        self.assertEqual(
+            odt_cache.IssueCache(self.cache_dir).stats()["misses"], 200)
+
+    def test_counters_are_flushed_once(self):
+        cache = odt_cache.IssueCache(self.cache_dir)
+        stats_path = os.path.join(self.cache_dir, odt_cache.STATS_FILE)
+
+        cache.get("missing")
+        cache.get("missing")
+        self.assertFalse(os.path.exists(stats_path))
+        self.assertEqual(cache.stats()["misses"], 2)
+
+        cache.flush()
+        self.assertTrue(os.path.exists(stats_path))
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(
+            odt_cache.IssueCache(self.cache_dir).stats()["misses"], 2)
+
+    def test_counters_of_parallel_export(self):
+        cache = odt_cache.IssueCache(self.cache_dir)
+        odt_path = write_issue(os.path.join(self.tmp_dir.name, "b.odt"),
+                               articles=2, seed=1)
+
+        for _ in range(2):
+            results = list(export.iter_issue_results(
+                [self.odt_path, odt_path], workers=2, cache=cache))
+            self.assertEqual([error for _, _, error in results],
+                             [None, None])
+
+        stats = odt_cache.IssueCache(self.cache_dir).stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+
+    def test_failed_put_leaves_no_temporary_file(self):
+        cache = odt_cache.IssueCache(self.cache_dir)
+
+        with self.assertRaises(Exception):
+            cache.put("a", lambda: None)
+
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = odt_cache.IssueCache(self.cache_dir, max_size=2500)
+        value = os.urandom(1000)
+
+        cache.put("a", value)
+        cache.put("b", value)
+        # Время последнего использования должно различаться
+        past = time.time() - 10
+        os.utime(os.path.join(self.cache_dir, "a.cache"), (past, past))
+        os.utime(os.path.join(self.cache_dir, "b.cache"), (past, past + 1))
+
+        self.assertEqual(cache.get("a"), value)
+        cache.put("c", value)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), value)
+        self.assertEqual(cache.get("c"), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
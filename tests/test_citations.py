@@ -0,0 +1,40 @@
+import unittest
+
+import odtparser.odtparser as odt
+from odtparser.journals_info import JOURNAL_NAMES_EN_LIST
+
+
+class TestParseCitations(unittest.TestCase):
+
+    def test_failures_are_collected(self):
+        citations = [
+            "Для цитирования: Иванов И.И. Название статьи // Финансы и "
+            "кредит. – 2019. – Т. 25, №5. – С. 10 – 20.",
+            "Для цитирования: ...",
+            "Please cite this article as: Ivanov I.I. Title. Digest Finance, "
+            "2019, vol. 24, iss. 1, pp. 10-20.",
+        ]
+
+        results, failures = odt.parse_citations(citations)
+
+        self.assertEqual(results[0][0], "ru")
+        self.assertEqual(results[0][1]["number_in_year"], "5")
+        self.assertEqual(results[0][1]["pages_range"], "10–20")
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2][1]["pages_range"], "10–20")
+        self.assertEqual([failure.index for failure in failures], [1])
+        self.assertEqual(failures[0].text, citations[1])
+
+    def test_every_journal_is_recognized(self):
+        citations = [
+            f"Please cite this article as: Ivanov I.I. Title. {name}, 2019, "
+            "vol. 24, iss. 1, pp. 10–20." for name in JOURNAL_NAMES_EN_LIST]
+
+        results, failures = odt.parse_citations(citations)
+
+        self.assertEqual(failures, [])
+        self.assertEqual(len(results), len(JOURNAL_NAMES_EN_LIST))
+
+
+if __name__ == '__main__':
+    unittest.main()
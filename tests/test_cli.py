@@ -0,0 +1,105 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from odtparser import __main__ as cli
+from odtparser.journals import JOURNALS_FILE_ENV, REGISTRY
+from tests.odtfactory import IssueTestCase
+
+# Допустимое время импорта пакета и CLI в секундах
+IMPORT_BUDGET = 0.1
+HEAVY_MODULES = ("bs4", "lxml", "langdetect", "transliterate",
+                 "odtparser.odtparser")
+
+
+def measure_import(module_name):
+    """
+    Returns import time of module in a new interpreter and heavy modules
+    loaded by the import
+    """
+
+    code = ("import sys, time; start = time.perf_counter(); "
+            f"import {module_name}; "
+            "print(time.perf_counter() - start); "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} "
+            "if m in sys.modules))")
+    output = subprocess.check_output([sys.executable, "-c", code],
+                                     universal_newlines=True)
+    import_time, loaded_modules = output.split("\n")[:2]
+
+    return float(import_time), loaded_modules
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_budget(self):
+        for module_name in ("odtparser", "odtparser.__main__",
+                            "odtparser.csvfile"):
+            with self.subTest(module=module_name):
+                import_time, loaded_modules = measure_import(module_name)
+
+                self.assertEqual(loaded_modules, "")
+                self.assertLess(import_time, IMPORT_BUDGET)
+
+
+class TestCli(IssueTestCase):
+
+    issue_params = dict(articles=3, english_every=2)
+
+    def run_cli(self, argv):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = cli.main(argv)
+
+        return status, output.getvalue()
+
+    def test_inspect(self):
+        status, output = self.run_cli(["inspect", "--json", self.odt_path])
+        summary = json.loads(output)[0]
+
+        self.assertEqual(status, 0)
+        self.assertEqual(summary["number_of_articles"], 3)
+        self.assertEqual([article["article_lang"]
+                          for article in summary["articles"]],
+                         ["ru", "en", "ru"])
+
+        status, output = self.run_cli(["inspect", self.odt_path])
+        self.assertIn("Статей: 3", output)
+
+    def test_export(self):
+        output_dir = os.path.join(self.tmp_dir.name, "out")
+        os.mkdir(output_dir)
+
+        status, _ = self.run_cli(["export", "-o", output_dir, self.odt_path])
+
+        self.assertEqual(status, 0)
+        self.assertEqual(len(os.listdir(output_dir)), 1)
+
+    def test_export_journals_replace_registry(self):
+        output_dir = os.path.join(self.tmp_dir.name, "out_journals")
+        os.mkdir(output_dir)
+        journals_path = os.path.join(self.tmp_dir.name, "journals.json")
+        with open(journals_path, "w", encoding="utf-8") as file:
+            json.dump({"journals": [{"name_ru": "Новый журнал",
+                                     "name_en": "New Journal",
+                                     "abbrv": "nj"}]}, file)
+        number_of_journals = len(REGISTRY.journals)
+        self.addCleanup(REGISTRY.reset)
+        self.addCleanup(os.environ.pop, JOURNALS_FILE_ENV, None)
+
+        # Повторная загрузка не дублирует журналы
+        for _ in range(2):
+            status, _ = self.run_cli(["export", "-o", output_dir,
+                                      "--journals", journals_path,
+                                      self.odt_path])
+
+            self.assertEqual(status, 0)
+            self.assertEqual(len(REGISTRY.journals), number_of_journals + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
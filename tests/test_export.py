@@ -0,0 +1,159 @@
+import json
+import os
+import unittest
+
+import odtparser.export as export
+import odtparser.jsonl as jsonl
+from tests.odtfactory import IssueTestCase
+
+
+class TestExportIssues(IssueTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.odt_paths = [
+            cls.write_issue(f"{i}.odt", articles=2 + i, journal=i, seed=i)
+            for i in range(3)
+        ]
+        cls.broken_path = os.path.join(cls.tmp_dir.name, "broken.odt")
+        with open(cls.broken_path, "wb") as broken_file:
+            broken_file.write(b"not a zip")
+
+    def export(self, workers):
+        output_dir = os.path.join(self.tmp_dir.name, f"out{workers}")
+        os.mkdir(output_dir)
+
+        results = export.export_issues(
+            [self.odt_paths[0], self.broken_path] + self.odt_paths[1:],
+            workers=workers, output_dir=output_dir)
+
+        outputs = {}
+        for file_name in os.listdir(output_dir):
+            with open(os.path.join(output_dir, file_name),
+                      encoding="utf-8") as json_file:
+                outputs[file_name] = json_file.read()
+
+        return results, outputs
+
+    def test_parallel_export_matches_serial(self):
+        serial_results, serial_outputs = self.export(1)
+        parallel_results, parallel_outputs = self.export(3)
+
+        self.assertEqual(parallel_outputs, serial_outputs)
+        self.assertEqual([result[:2] for result in parallel_results],
+                         [result[:2] for result in serial_results])
+
+        self.assertEqual(len(parallel_outputs), 3)
+        for output in parallel_outputs.values():
+            self.assertIn("articles_info", json.loads(output))
+
+    def test_failed_file_is_isolated(self):
+        results, _ = self.export(2)
+
+        self.assertEqual([path for path, _, _ in results],
+                         [self.odt_paths[0], self.broken_path]
+                         + self.odt_paths[1:])
+        self.assertIsNone(results[1][1])
+        self.assertIn("BadZipFile", results[1][2])
+        for i in (0, 2, 3):
+            self.assertIsNone(results[i][2])
+
+    def test_same_journal_fails(self):
+        output_dir = os.path.join(self.tmp_dir.name, "same_journal")
+        os.mkdir(output_dir)
+        other_path = self.write_issue("other.odt", articles=1, journal=0,
+                                      seed=3)
+
+        results = export.export_issues([self.odt_paths[0], other_path],
+                                       workers=2, output_dir=output_dir)
+
+        self.assertIsNone(results[0][2])
+        self.assertEqual(results[1][:2], (other_path, None))
+        self.assertIn("совпадает", results[1][2])
+
+        output_name, = os.listdir(output_dir)
+        self.assertEqual(output_name, f"{results[0][1]}.json")
+        with open(os.path.join(output_dir, output_name),
+                  encoding="utf-8") as json_file:
+            self.assertEqual(len(json.load(json_file)["articles_info"]), 2)
+
+    def test_streamed_json_matches_json_dump(self):
+        issue_data = export.get_issue_data(self.odt_paths[1])
+
+        for data in (issue_data, dict(issue_data, articles_info=[])):
+            self.assertEqual(
+                "".join(export.iter_issue_json(
+                    export.iter_issue_data_records(data))),
+                json.dumps(data, indent=4, ensure_ascii=False))
+
+        output_dir = os.path.join(self.tmp_dir.name, "streamed")
+        os.mkdir(output_dir)
+        journal_acronym = export.export_issue(self.odt_paths[1], output_dir)
+
+        with open(os.path.join(output_dir, f"{journal_acronym}.json"),
+                  encoding="utf-8") as json_file:
+            self.assertEqual(json_file.read(), json.dumps(
+                issue_data, indent=4, ensure_ascii=False))
+
+    def test_jsonl_export(self):
+        output_dir = os.path.join(self.tmp_dir.name, "jsonl")
+        os.mkdir(output_dir)
+
+        for compress in (False, True):
+            results = export.export_issues(self.odt_paths[:1], workers=1,
+                                           output_dir=output_dir,
+                                           output_format="jsonl",
+                                           compress=compress)
+            journal_acronym = results[0][1]
+
+        issue_data = export.get_issue_data(self.odt_paths[0])
+        for file_name in (f"{journal_acronym}.jsonl",
+                          f"{journal_acronym}.jsonl.gz"):
+            path = os.path.join(output_dir, file_name)
+            records = list(jsonl.iter_records(path))
+
+            self.assertEqual(records[0]["record"], "issue")
+            self.assertEqual([record["index"] for record in records[1:]],
+                             [0, 1])
+            self.assertEqual(jsonl.read_issue_data(path), issue_data)
+
+        # Временные файлы переименованы
+        self.assertEqual(len(os.listdir(output_dir)), 2)
+
+    def test_jsonl_writer_removes_file_on_error(self):
+        path = os.path.join(self.tmp_dir.name, "failed.jsonl")
+
+        with self.assertRaises(KeyError):
+            with jsonl.JsonLinesWriter(path) as writer:
+                writer.write_issue_info({})
+                raise KeyError("article")
+
+        self.assertFalse([file_name for file_name in os.listdir(
+            self.tmp_dir.name) if file_name.startswith("failed")])
+
+    def test_json_writer_keeps_error_of_open(self):
+        path = os.path.join(self.tmp_dir.name, "missing", "failed.json")
+
+        with self.assertRaises(FileNotFoundError) as context:
+            export.write_issue_records_to_json(iter([]), path)
+
+        self.assertIsNone(context.exception.__context__)
+
+    def test_json_writer_removes_file_on_error(self):
+        path = os.path.join(self.tmp_dir.name, "failed.json")
+
+        def iter_records():
+            raise KeyError("article")
+            yield
+
+        with self.assertRaises(KeyError):
+            export.write_issue_records_to_json(iter_records(), path)
+
+        self.assertFalse([file_name for file_name in os.listdir(
+            self.tmp_dir.name) if file_name.startswith("failed")])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import random
+import unittest
+
+from odtparser import homoglyphs
+
+try:
+    from transliterate import translit
+except ImportError:
+    translit = None
+
+LETTERS = ("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+           "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬ"
+           "ЭЮЯ' .,-–№1")
+DIGRAPHS = ["sch", "Sch", "tsh", "zh", "Ja", "ju"]
+
+
+def random_strings(count, seed=0):
+    rnd = random.Random(seed)
+
+    return ["".join(rnd.choice(LETTERS + "\0" * 6)
+                    for _ in range(rnd.randint(0, 40))).replace(
+                        "\0", rnd.choice(DIGRAPHS))
+            for _ in range(count)]
+
+
+class TestHomoglyphs(unittest.TestCase):
+
+    @unittest.skipIf(translit is None, "transliterate is not installed")
+    def test_same_as_translit(self):
+        for text in random_strings(5000) + ["Иванов И. И., Пeтрoв П. П."]:
+            self.assertEqual(homoglyphs.to_cyrillic(text),
+                             translit(text, "ru"))
+            self.assertEqual(homoglyphs.to_latin(text),
+                             translit(text, "ru", reversed=True))
+
+    def test_repair_direction(self):
+        # Латинские "e" и "o" в русском тексте и кириллическая "а" в английском
+        self.assertEqual(homoglyphs.repair_homoglyphs("Пeтрoв П."),
+                         "Петров П.")
+        self.assertEqual(homoglyphs.repair_homoglyphs("Finаnce"), "Finance")
+        self.assertEqual(homoglyphs.repair_homoglyphs("Finаnce", "ru"),
+                         homoglyphs.to_cyrillic("Finаnce"))
+
+        with self.assertRaises(ValueError):
+            homoglyphs.repair_homoglyphs("text", "de")
+
+    def test_unchanged_text_is_returned(self):
+        text = "Иванов И. И."
+
+        self.assertIs(homoglyphs.to_cyrillic.__wrapped__(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
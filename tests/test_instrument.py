@@ -0,0 +1,90 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+
+import odtparser.export as export
+import odtparser.instrument as instrument
+import odtparser.odtparser as odt
+from tests.odtfactory import IssueTestCase
+
+
+class TestInstrument(IssueTestCase):
+
+    issue_params = dict(articles=3, english_every=2)
+
+    def test_disabled(self):
+        self.assertFalse(instrument.is_active())
+
+        with instrument.stage("styles_data") as stage:
+            self.assertIsNone(stage)
+
+        instrument.count("nodes")
+
+    def test_export_stages(self):
+        with instrument.instrumented(file="a.odt") as recorder:
+            issue_data = export.get_issue_data(self.odt_path)
+
+        self.assertEqual(issue_data, export.get_issue_data(self.odt_path))
+
+        report = recorder.report()
+        stages = {stage["name"]: stage for stage in report["stages"]}
+
+        self.assertEqual(report["file"], "a.odt")
+        self.assertEqual(report["stages"][0]["name"], "total")
+        self.assertEqual(stages["get_issue_fields"]["depth"], 1)
+        self.assertIn("stream", stages)
+        self.assertGreater(report["counters"]["nodes"], 0)
+        self.assertGreater(report["counters"]["regex"], 0)
+
+        for stage in report["stages"]:
+            self.assertGreaterEqual(stage["wall"], 0)
+            self.assertGreaterEqual(stage["memory_peak"], 0)
+
+        self.assertGreaterEqual(stages["total"]["wall"],
+                                stages["get_issue_fields"]["wall"])
+
+    def test_parser_stages(self):
+        with instrument.instrumented(memory=False) as recorder:
+            odt.OdtParser(self.odt_path).get_article_references_list()
+
+        report = recorder.report()
+        names = [stage["name"] for stage in report["stages"]]
+
+        self.assertIn("content_data", names)
+        self.assertIn("article_references", names)
+        self.assertIsNone(report["stages"][0]["memory_peak"])
+        self.assertGreater(report["counters"]["regex"], 0)
+
+    def test_regex_restored(self):
+        with instrument.instrumented(memory=False):
+            self.assertIsInstance(odt.CITATION_REGEX,
+                                  instrument.CountingPattern)
+
+            with self.assertRaises(RuntimeError):
+                with instrument.instrumented():
+                    pass
+
+        self.assertIsInstance(odt.CITATION_REGEX, re.Pattern)
+        self.assertFalse(instrument.is_active())
+
+    def test_report_files(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            status = export.main(["--report-dir", output_dir, "--cprofile",
+                                  "-o", output_dir, self.odt_path])
+
+            self.assertEqual(status, 0)
+            self.assertTrue(os.path.exists(os.path.join(output_dir,
+                                                        "a.prof")))
+
+            with open(os.path.join(output_dir, "a.report.json"),
+                      encoding="utf-8") as report_file:
+                report = json.load(report_file)
+
+        self.assertFalse(report["error"])
+        self.assertGreater(report["stages"][0]["wall"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+import unittest
+
+import odtparser.odtparser as odt
+from odtparser.journals import JournalRegistry
+from odtparser.journals_info import JOURNAL_NAMES_RU_LIST, \
+    JOURNAL_NAMES_EN_LIST, MONTHS_EN_LIST, RUBRICS_DICT
+
+EXTRA_JOURNALS = {
+    "journals": [{"name_ru": "Новый журнал", "name_en": "New Journal",
+                  "abbrv": "nj"}],
+    "rubrics": {"Новая рубрика": "New Rubric"},
+}
+
+
+def scan_rubric_ru(en_rubric):
+    # Прежний поиск перебором RUBRICS_DICT
+    ru_rubric = ""
+    for k, v in RUBRICS_DICT.items():
+        if v == en_rubric:
+            ru_rubric = k
+    return ru_rubric
+
+
+class TestJournalRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = JournalRegistry.from_journals_info()
+
+    def test_rubrics_match_scan(self):
+        for en_rubric in list(RUBRICS_DICT.values()) + ["Unknown"]:
+            self.assertEqual(self.registry.rubric_ru(en_rubric),
+                             scan_rubric_ru(en_rubric), en_rubric)
+
+        self.assertEqual(self.registry.rubric_ru(" banking "),
+                         "Банковское дело")
+        self.assertEqual(self.registry.rubric_en("Маркетинг"), "Marketing")
+
+    def test_journals(self):
+        journal = self.registry.journal("Финансы и кредит")
+
+        self.assertEqual(journal.abbrv, "fc")
+        self.assertIs(self.registry.journal("finance  and credit"), journal)
+        self.assertIs(self.registry.journal("FC"), journal)
+        with self.assertRaises(KeyError):
+            self.registry.journal("Нет такого журнала")
+
+    def test_months(self):
+        for number, month in enumerate(MONTHS_EN_LIST, 1):
+            self.assertEqual(self.registry.month_number(month.capitalize()),
+                             number)
+        self.assertEqual(self.registry.month_number("Март"), 3)
+        with self.assertRaises(ValueError):
+            self.registry.month_number("Smarch")
+
+    def test_find_journal(self):
+        journal = self.registry.find_journal(
+            f"© 2019 {JOURNAL_NAMES_RU_LIST[1]}, стр. 5")
+
+        self.assertEqual(journal.name_en, JOURNAL_NAMES_EN_LIST[1])
+        self.assertIsNone(self.registry.find_journal("Другой журнал"))
+        # Название в колонтитуле совпадает точно, как до реестра
+        self.assertIsNone(self.registry.find_journal(
+            JOURNAL_NAMES_RU_LIST[1].upper()))
+        self.assertIsNone(self.registry.find_journal(
+            JOURNAL_NAMES_RU_LIST[1].replace(" ", "  ")))
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "journals.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(EXTRA_JOURNALS, file, ensure_ascii=False)
+
+            self.assertIsNone(self.registry.find_journal("Новый журнал"))
+            self.registry.load(path)
+
+        self.assertEqual(self.registry.find_journal("Новый журнал").abbrv,
+                         "nj")
+        self.assertEqual(self.registry.rubric_ru("New Rubric"),
+                         "Новая рубрика")
+        self.assertEqual(len(self.registry.journals),
+                         len(JOURNAL_NAMES_RU_LIST) + 1)
+
+        self.registry.reset()
+        self.assertEqual(self.registry.fingerprint(),
+                         JournalRegistry.from_journals_info().fingerprint())
+        self.assertIsNone(self.registry.find_journal("Новый журнал"))
+
+
+class TestParseJournalName(unittest.TestCase):
+
+    def test_journal_name(self):
+        self.assertEqual(
+            odt.parse_journal_name_list([
+                "Финансы и кредит 2019", "Дайджест-Финансы",
+                "Финансы и кредит"]),
+            {"journal_name_ru": "Финансы и кредит",
+             "journal_name_en": "Finance and Credit"})
+
+    def test_unknown_journal(self):
+        with self.assertRaises(odt.LayoutError):
+            odt.parse_journal_name_list(["Финансы и кредит", "Журнал"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+import unittest
+
+from odtparser import language
+
+RU_TEXT = ("Статья посвящена анализу региональных бюджетов и оценке "
+           "устойчивости финансовой системы (GDP, OLS). ") * 3
+EN_TEXT = ("The article analyzes regional budgets and evaluates the "
+           "stability of the financial system (ВВП). ") * 3
+
+
+class TestLanguage(unittest.TestCase):
+
+    def test_ratio_decision(self):
+        ru = language.detect_language(RU_TEXT)
+        en = language.detect_language(EN_TEXT)
+
+        self.assertEqual((ru.lang, ru.method), ("ru", "ratio"))
+        self.assertEqual((en.lang, en.method), ("en", "ratio"))
+        self.assertGreater(ru.confidence, 0.9)
+        self.assertLess(en.confidence, 1.0)
+
+    def test_ambiguous_text_uses_langdetect(self):
+        text = "Financial analysis финансовый анализ"
+
+        self.assertIsNone(language.detect_by_ratio(text))
+
+        decisions = {language.detect_language(text) for _ in range(3)}
+
+        self.assertEqual(len(decisions), 1)
+        self.assertEqual(decisions.pop().method, "langdetect")
+
+    def test_langdetect_is_not_imported(self):
+        code = ("import sys; from odtparser import odtparser, language; "
+                "language.detect_language({!r}); "
+                "print('langdetect' in sys.modules)".format(RU_TEXT))
+        output = subprocess.check_output([sys.executable, "-c", code])
+
+        self.assertEqual(output.strip(), b"False")
+
+    def test_langdetect_global_seed_is_kept(self):
+        code = ("from langdetect import DetectorFactory; "
+                "from odtparser import language; "
+                "language.detect_by_langdetect({!r}); "
+                "print(DetectorFactory.seed)".format(RU_TEXT))
+        output = subprocess.check_output([sys.executable, "-c", code])
+
+        self.assertEqual(output.strip(), b"None")
+
+
+if __name__ == '__main__':
+    unittest.main()
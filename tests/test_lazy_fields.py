@@ -0,0 +1,40 @@
+import unittest
+
+from odtparser.odtparser import OdtParser
+from tests.odtfactory import IssueTestCase
+
+
+class TestLazyFields(IssueTestCase):
+
+    issue_params = dict(articles=2)
+
+    def test_journal_name_does_not_parse_content(self):
+        odt_parser = OdtParser(self.odt_path)
+        odt_parser.get_journal_name()
+
+        self.assertNotIn("content_data", odt_parser.__dict__)
+        self.assertNotIn("paragraphs", odt_parser.__dict__)
+
+    def test_fields_are_memoized(self):
+        odt_parser = OdtParser(self.odt_path)
+
+        rubrics = odt_parser.get_article_rubrics_list()
+        paragraphs = odt_parser.paragraphs
+        odt_parser.get_number_of_articles_in_issue()
+
+        self.assertIs(odt_parser.get_article_rubrics_list(), rubrics)
+        self.assertIs(odt_parser.paragraphs, paragraphs)
+        self.assertEqual(odt_parser.get_number_of_articles_in_issue(), 2)
+
+    def test_full_text_rendering_keeps_tree(self):
+        odt_parser = OdtParser(self.odt_path)
+        content_before = str(odt_parser.content_data)
+
+        full_texts = odt_parser.get_article_full_texts_list()
+
+        self.assertEqual(str(odt_parser.content_data), content_before)
+        self.assertEqual(len(full_texts), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
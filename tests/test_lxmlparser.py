@@ -0,0 +1,36 @@
+import unittest
+
+from odtparser.lxmlparser import LxmlOdtParser
+from odtparser.odtparser import OdtParser
+from tests.odtfactory import IssueTestCase
+
+GETTERS = [name for name in dir(OdtParser) if name.startswith("get_")]
+
+
+class TestLxmlBackend(IssueTestCase):
+
+    issue_params = dict(articles=4, english_every=3, references=3, journal=2,
+                        seed=5)
+
+    def test_backend_selection(self):
+        self.assertIs(type(OdtParser(self.odt_path)), OdtParser)
+        self.assertIs(type(OdtParser(self.odt_path, backend="lxml")),
+                      LxmlOdtParser)
+
+        with self.assertRaises(ValueError):
+            OdtParser(self.odt_path, backend="html")
+
+    def test_same_output_as_bs4(self):
+        bs4_parser = OdtParser(self.odt_path)
+        lxml_parser = OdtParser(self.odt_path, backend="lxml")
+
+        for getter in GETTERS:
+            with self.subTest(getter=getter):
+                self.assertEqual(getattr(lxml_parser, getter)(),
+                                 getattr(bs4_parser, getter)())
+
+        self.assertEqual(lxml_parser.get_number_of_articles_in_issue(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
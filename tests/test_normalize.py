@@ -0,0 +1,125 @@
+import random
+import re
+import timeit
+import unittest
+
+from odtparser import normalize
+from tests.odtfactory import IssueBuilder
+
+
+# Regex chains that normalize module replaced. Kept as reference
+# implementations.
+def legacy_clear_text(text):
+    stripped_text = text.strip()
+    cleared_text = re.sub(r"\s+", " ", stripped_text)
+    cleared_text = re.sub(r"\xa0", " ", cleared_text)
+    cleared_text = re.sub(r"\s\.", ".", cleared_text)
+    cleared_text = re.sub(r"<text:line-break/>", " ", cleared_text)
+    cleared_text = re.sub(r"·", "X", cleared_text)
+    cleared_text = re.sub(r"(№)(\S)", r"\1 \2", cleared_text)
+    cleared_text = re.sub(r"\s,", ",", cleared_text)
+
+    return cleared_text
+
+
+def legacy_clear_ref_html(el_string):
+    el_string = el_string.replace("</i><i>", "")
+    el_string = re.sub(r"</i>\s+<i>", " ", el_string)
+    el_string = re.sub(r"<i>\s+</i>", " ", el_string)
+    el_string = re.sub(r"\s+", " ", el_string)
+    el_string = re.sub(r"<p>\s+(.+)", r"<p>\1", el_string)
+
+    return el_string
+
+
+def legacy_author_names(authors_string):
+    authors_string = re.sub(r"\s+", " ", authors_string)
+    authors_string = re.sub(r"•,", "", authors_string)
+    authors_string = re.sub(r"•", "", authors_string)
+
+    return authors_string
+
+
+TOKENS = ["a", "Б", " ", "  ", "\xa0", "\n", "\t", ".", ",", "№", "·", "•",
+          "<text:line-break/>", "<i>", "</i>", "<p>", "x1", " "]
+
+
+def random_strings(count, seed=0):
+    rnd = random.Random(seed)
+
+    return ["".join(rnd.choice(TOKENS) for _ in range(rnd.randint(0, 40)))
+            for _ in range(count)]
+
+
+def best_time(function, texts):
+    return min(timeit.repeat(lambda: [function(text) for text in texts],
+                             number=1, repeat=5))
+
+
+class TestNormalize(unittest.TestCase):
+
+    def test_text_profile_matches_legacy(self):
+        texts = random_strings(3000) + [
+            " Т. 5 ,№5 . · ", "№<text:line-break/>1", "№,", "a <text:"
+            "line-break/>. b", "\xa0 .\xa0,", ""]
+
+        for text in texts:
+            self.assertEqual(normalize.normalize(text, "full_text"),
+                             legacy_clear_text(text), repr(text))
+            self.assertEqual(normalize.normalize(text, "citation"),
+                             legacy_clear_text(text), repr(text))
+
+    def test_reference_html_profile_matches_legacy(self):
+        texts = ["<p>" + text + "</p>" for text in random_strings(3000, 1)]
+        texts += ["<p> <i>a</i> <i> </i> <i>b</i><i>c</i></p>",
+                  "<p><i> </i> <i>a</i></p>", "<p> a<p> b</p>"]
+
+        for text in texts:
+            self.assertEqual(normalize.normalize(text, "reference_html"),
+                             legacy_clear_ref_html(text), repr(text))
+
+    def test_author_name_profile_matches_legacy(self):
+        for text in random_strings(3000, 2) + ["А•, Б•,В •"]:
+            self.assertEqual(normalize.normalize(text, "author_name"),
+                             legacy_author_names(text), repr(text))
+
+    def test_node_text_profile_matches_text(self):
+        # Текст узла нормализуется так же, как при нормализации всего
+        # документа. Переводы строк соединяют отрезки текста узла.
+        rnd = random.Random(4)
+        tokens = [token for token in TOKENS if "<" not in token]
+
+        for _ in range(3000):
+            runs = ["".join(rnd.choice(tokens)
+                            for _ in range(rnd.randint(0, 8)))
+                    for _ in range(rnd.randint(1, 3))]
+            document = "<p>" + normalize.LINE_BREAK_TAG.join(runs) + "</p>"
+            node_text = normalize.normalize(
+                normalize.LINE_BREAK_MARK.join(runs), "node_text")
+
+            self.assertEqual("<p>" + node_text + "</p>",
+                             normalize.normalize_text(document),
+                             repr(document))
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            normalize.normalize("", "abstract")
+
+    def test_faster_than_legacy(self):
+        content = IssueBuilder(articles=10).content_xml()
+        texts = [content] + content.split("</text:p>")
+
+        self.assertEqual([normalize.normalize_text(x) for x in texts],
+                         [legacy_clear_text(x) for x in texts])
+        self.assertLess(best_time(normalize.normalize_text, texts),
+                        best_time(legacy_clear_text, texts))
+
+        html_texts = ["<p>" + text + "</p>"
+                      for text in random_strings(3000, 3)]
+        self.assertLess(
+            best_time(normalize.normalize_reference_html, html_texts),
+            best_time(legacy_clear_ref_html, html_texts))
+
+
+if __name__ == '__main__':
+    unittest.main()
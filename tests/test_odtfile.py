@@ -0,0 +1,79 @@
+import io
+import os
+import unittest
+import unittest.mock
+import zipfile
+
+import odtparser.cache as cache
+import odtparser.stream as stream
+from odtparser.odtfile import OdtFile, CONTENT_XML
+from odtparser.odtparser import OdtParser
+from tests.odtfactory import IssueTestCase
+
+
+class TestOdtFile(IssueTestCase):
+
+    issue_params = dict(articles=2)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with open(cls.odt_path, "rb") as odt_file:
+            cls.odt_bytes = odt_file.read()
+
+        with zipfile.ZipFile(cls.odt_path) as odt_zip:
+            cls.content_bytes = odt_zip.read(CONTENT_XML)
+
+    def sources(self):
+        return [self.odt_path, self.odt_bytes, bytearray(self.odt_bytes),
+                memoryview(self.odt_bytes), io.BytesIO(self.odt_bytes)]
+
+    def test_sources(self):
+        for source in self.sources():
+            with self.subTest(source=type(source).__name__):
+                with OdtFile(source) as odt_file:
+                    self.assertEqual(odt_file.read_member(CONTENT_XML),
+                                     self.content_bytes)
+                    with odt_file.open_member(CONTENT_XML) as member:
+                        self.assertEqual(member.read(), self.content_bytes)
+                    self.assertTrue(odt_file.get_styles_data().startswith(
+                        "<?xml"))
+
+    def test_close(self):
+        odt_file = OdtFile(self.odt_path)
+        file = odt_file._file
+
+        with odt_file:
+            pass
+
+        self.assertTrue(file.closed)
+        self.assertIsNone(odt_file._mmap)
+
+    def test_bad_archive_is_closed(self):
+        path = os.path.join(self.tmp_dir.name, "broken.odt")
+        with open(path, "wb") as broken_file:
+            broken_file.write(b"not a zip")
+
+        with self.assertRaises(zipfile.BadZipFile):
+            OdtFile(path)
+
+    def test_parsers_accept_bytes(self):
+        issue_fields = stream.get_issue_fields(self.odt_bytes)
+
+        self.assertEqual(issue_fields["number_of_articles"], 2)
+        self.assertEqual(
+            OdtParser(memoryview(self.odt_bytes)).get_journal_name(),
+            issue_fields["journal_name"])
+
+    def test_members_are_streamed(self):
+        # Части архива разбираются и хешируются, не читаясь целиком
+        with unittest.mock.patch.object(OdtFile, "read_member",
+                                        side_effect=AssertionError):
+            stream.get_issue_fields(self.odt_path)
+            list(stream.iter_issue_articles(self.odt_path))
+            OdtParser(self.odt_path, backend="lxml").content_data
+            cache.get_issue_key(self.odt_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+
+import odtparser.export as export
+import odtparser.pgloader as pgloader
+from tests.odtfactory import IssueTestCase, write_issue
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+# Строка подключения к временной базе, например "dbname=odtparser_test"
+TEST_DSN = os.environ.get("ODTPARSER_TEST_DSN")
+
+
+class TestRows(IssueTestCase):
+
+    issue_params = dict(articles=3, english_every=3, references=4)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.issue_data = export.get_issue_data(cls.odt_path)
+
+    def test_copy_line(self):
+        self.assertEqual(pgloader.copy_line((1, None, "a\tb\\c\nd\r")),
+                         "1\t\\N\ta\\tb\\\\c\\nd\\r\n")
+
+    def test_copy_stream(self):
+        rows = [(i, f"строка {i}") for i in range(1000)]
+        copy_stream = pgloader.CopyStream(rows)
+
+        chunks = []
+        chunk = copy_stream.read(100)
+        while chunk:
+            self.assertLessEqual(len(chunk), 100)
+            chunks.append(chunk)
+            chunk = copy_stream.read(100)
+
+        self.assertEqual("".join(chunks),
+                         "".join(pgloader.copy_line(row) for row in rows))
+
+    def test_issue_rows(self):
+        for table, columns in pgloader.COPY_TABLES:
+            for row in pgloader.TABLE_ROWS[table](7, self.issue_data):
+                self.assertEqual(len(row), len(columns))
+
+        articles = list(pgloader.iter_article_rows(7, self.issue_data))
+        self.assertEqual([row[:2] for row in articles], [(7, 1), (7, 2),
+                                                         (7, 3)])
+
+        references = list(pgloader.iter_reference_rows(7, self.issue_data))
+        # Русская и английская статьи по два списка, англоязычная - один
+        self.assertEqual([row[2] for row in references if row[1] == 3],
+                         ["en"] * 4)
+        self.assertEqual(len(references), 4 * 5)
+        self.assertTrue(references[0][4].startswith("<p>"))
+
+    def test_load_issue_batch_flow(self):
+        connection = FakeConnection()
+
+        # Один и тот же выпуск в пакете загружается и учитывается один раз
+        self.assertEqual(pgloader.load_issues(
+            connection, [self.issue_data] * 3, batch_size=2), 2)
+        self.assertEqual(connection.commits, 2)
+        statements = connection.cursor_.statements
+        self.assertEqual([sql.split()[1] for sql, _ in statements
+                          if sql.startswith("COPY")],
+                         [table for table, _ in pgloader.COPY_TABLES] * 2)
+        articles_copy = [data for sql, data in statements
+                         if sql.startswith("COPY articles")]
+        self.assertEqual(articles_copy[0].count("\n"), 3)
+
+
+class FakeCursor:
+
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql.strip(), params))
+
+    def fetchone(self):
+        return (1,)
+
+    def copy_expert(self, sql, file):
+        self.statements.append((sql, file.read()))
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.cursor_ = FakeCursor()
+        self.commits = 0
+
+    def cursor(self):
+        return self.cursor_
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+@unittest.skipUnless(psycopg2 is not None and TEST_DSN,
+                     "psycopg2 and ODTPARSER_TEST_DSN are required")
+class TestLoadIssues(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = psycopg2.connect(TEST_DSN)
+
+        with self.connection.cursor() as cursor:
+            cursor.execute("CREATE SCHEMA odtparser_test")
+            cursor.execute("SET search_path TO odtparser_test")
+        pgloader.create_schema(self.connection)
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.issues_data = [
+            export.get_issue_data(write_issue(
+                os.path.join(self.tmp_dir.name, f"{i}.odt"), articles=2 + i,
+                journal=i, seed=i))
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        self.connection.rollback()
+        with self.connection.cursor() as cursor:
+            cursor.execute("DROP SCHEMA odtparser_test CASCADE")
+        self.connection.commit()
+        self.connection.close()
+
+    def count(self, table):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"SELECT count(*) FROM {table}")
+            return cursor.fetchone()[0]
+
+    def test_load_and_reload(self):
+        self.assertEqual(pgloader.load_issues(self.connection,
+                                              self.issues_data, 2), 3)
+        counts = {table: self.count(table)
+                  for table, _ in pgloader.COPY_TABLES}
+
+        self.assertEqual(self.count("issues"), 3)
+        self.assertEqual(counts["articles"], 2 + 3 + 4)
+
+        # Повторная загрузка заменяет выпуски
+        pgloader.load_issues(self.connection, self.issues_data[::-1], 10)
+
+        self.assertEqual(self.count("issues"), 3)
+        self.assertEqual({table: self.count(table)
+                          for table, _ in pgloader.COPY_TABLES}, counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
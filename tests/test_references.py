@@ -0,0 +1,110 @@
+import json
+import random
+import unittest
+
+import bs4
+from lxml import etree
+
+from odtparser.article import Reference
+from odtparser.normalize import normalize_reference_html
+from odtparser.odtfile import NAMESPACES
+from odtparser.references import ReferenceBuilder, get_ref_element_item, \
+    render_full_text
+from odtparser.styles import StyleIndex
+
+TOKENS = ["a", "Б", " ", "  ", "\t", "\xa0", "x y", "", ".", ",", "(", "1"]
+
+
+def build(runs):
+    builder = ReferenceBuilder()
+    for text, italic in runs:
+        builder.add(text, italic)
+    return builder.reference()
+
+
+class TestReferenceBuilder(unittest.TestCase):
+
+    def test_html_matches_normalize(self):
+        # Прежний способ: теги вокруг каждого фрагмента и нормализация
+        rnd = random.Random(0)
+
+        for _ in range(20000):
+            runs = [("".join(rnd.choice(TOKENS)
+                             for _ in range(rnd.randint(0, 3))),
+                     rnd.random() < 0.4) for _ in range(rnd.randint(0, 7))]
+            html = "<p>" + "".join("<i>" + text + "</i>" if italic else text
+                                   for text, italic in runs) + "</p>"
+
+            self.assertEqual(build(runs).html,
+                             normalize_reference_html(html), repr(html))
+
+    def test_italic_runs_are_merged(self):
+        reference = build([(" Ivanov A.B. ", False), ("Title", True),
+                           (" ", False), ("of book", True), ("", False),
+                           (" .", True), (" ", True), (". 2018", False)])
+
+        self.assertEqual(reference.html,
+                         "<p>Ivanov A.B. <i>Title of book . </i>. 2018</p>")
+        self.assertEqual(reference.text, "Ivanov A.B. Title of book . . 2018")
+        self.assertEqual(reference.italic, ((12, 28),))
+
+    def test_whitespace_italic_is_plain(self):
+        reference = build([("a", False), ("  ", True), ("b", False)])
+
+        self.assertEqual(reference.html, "<p>a b</p>")
+        self.assertEqual(reference.italic, ())
+
+    def test_to_dict(self):
+        reference = Reference(html="<p>A. <i>B</i>, C</p>")
+
+        self.assertEqual(reference.to_dict(),
+                         {"html": "<p>A. <i>B</i>, C</p>", "text": "A. B, C",
+                          "italic": ((3, 4),)})
+
+    def test_from_json(self):
+        reference = Reference(html="<p>A. <i>B</i>, C</p>")
+        data = json.loads(json.dumps(reference.to_dict()))
+
+        self.assertEqual(Reference.from_dict(data), reference)
+        self.assertEqual(Reference.from_dict(data).italic, ((3, 4),))
+
+
+SECTION_XML = (
+    '<text:section xmlns:text="{text}"><text:h>Head<text:span>er'
+    '</text:span></text:h><text:p>One<text:note text:note-class="footnote">'
+    '<text:note-citation>1</text:note-citation><text:note-body><text:p>Note'
+    '</text:p></text:note-body></text:note></text:p><text:list>'
+    '<text:list-item><text:p>Item</text:p></text:list-item></text:list>'
+    '<text:p>Ivanov A.B. <text:bookmark text:name="r"/><text:span '
+    'text:style-name="T1">Title</text:span><text:s/>.<text:soft-page-break/>'
+    '2018</text:p></text:section>').format(text=NAMESPACES["text"])
+
+
+class TestTrees(unittest.TestCase):
+
+    def setUp(self):
+        self.section = etree.fromstring(SECTION_XML)
+        self.soup_section = bs4.BeautifulSoup(
+            SECTION_XML, "lxml-xml").find("text:section")
+
+    def test_full_texts_of_both_trees(self):
+        self.assertEqual(render_full_text(self.section),
+                         "Head er One (Note) \n- Item\n"
+                         "Ivanov A.B. Title.2018\n")
+        self.assertEqual(render_full_text(self.soup_section),
+                         render_full_text(self.section))
+
+    def test_reference_items_of_both_trees(self):
+        style_index = StyleIndex()
+        style_index.text_properties["T1"] = {"font-style": "italic"}
+        paragraph = self.section[-1]
+        soup_paragraph = self.soup_section.find_all("text:p")[-1]
+
+        self.assertEqual(get_ref_element_item(paragraph, style_index).html,
+                         "<p>Ivanov A.B. <i>Title</i>. 2018</p>")
+        self.assertEqual(get_ref_element_item(soup_paragraph, style_index),
+                         get_ref_element_item(paragraph, style_index))
+
+
+if __name__ == '__main__':
+    unittest.main()
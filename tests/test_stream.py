@@ -0,0 +1,244 @@
+import io
+import os
+import random
+import re
+import unittest
+import zipfile
+
+import bs4
+from langdetect import DetectorFactory
+
+import odtparser.export as export
+from odtparser.normalize import normalize_text
+from odtparser.odtfile import NAMESPACES
+from odtparser.odtparser import LayoutError, OdtParser, normalize_soup_text
+import odtparser.stream as stream
+from tests.odtfactory import IssueBuilder, IssueTestCase
+
+DetectorFactory.seed = 0
+
+# Getters in the order export.get_issue_data called them
+FIELD_GETTERS = [
+    ("journal_name", "get_journal_name"),
+    ("issue_pub_dates", "get_issue_pub_dates_dict"),
+    ("through_issue_number", "get_through_issue_number"),
+    ("number_of_articles", "get_number_of_articles_in_issue"),
+    ("article_rubrics_list", "get_article_rubrics_list"),
+    ("article_citation_info_list", "get_citation_paragraphs_list"),
+    ("article_abstracts_list", "get_article_abstracts_list"),
+    ("article_full_texts_list", "get_article_full_texts_list"),
+    ("article_full_author_names_list", "get_full_author_names_list"),
+    ("article_affiliation_info_list", "get_affiliation_info_list"),
+    ("article_info_list", "get_article_info_list"),
+    ("article_references_list", "get_article_references_list"),
+]
+
+
+class TestIssueStream(IssueTestCase):
+
+    issue_params = dict(articles=6, english_every=4)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.issue_fields = stream.get_issue_fields(cls.odt_path)
+
+    def test_fields_match_odt_parser_getters(self):
+        odt_parser = OdtParser(self.odt_path)
+
+        for field, getter in FIELD_GETTERS:
+            with self.subTest(field=field):
+                self.assertEqual(self.issue_fields[field],
+                                 getattr(odt_parser, getter)())
+
+    def test_number_of_articles(self):
+        self.assertEqual(self.issue_fields["number_of_articles"], 6)
+        self.assertEqual(len(self.issue_fields["article_references_list"]), 6)
+
+    def test_iter_issue_articles(self):
+        records = list(stream.iter_issue_articles(self.odt_path))
+        issue_fields, articles = records[0], records[1:]
+
+        for field in ("journal_name", "issue_pub_dates",
+                      "through_issue_number"):
+            self.assertEqual(issue_fields[field], self.issue_fields[field])
+
+        self.assertEqual(len(articles), 6)
+
+        for collector in stream.article_collectors():
+            with self.subTest(field=collector.field):
+                self.assertEqual(
+                    [article[collector.article_field]
+                     for article in articles],
+                    self.issue_fields[collector.field])
+
+    def test_articles_are_released(self):
+        with stream.open_issue(self.odt_path) as (_, style_index,
+                                                  content_file):
+            issue_stream = stream.IssueStream(content_file,
+                                              stream.article_collectors(),
+                                              style_index)
+
+            for article in issue_stream.iter_articles():
+                # Только элементы следующей статьи на двух языках
+                for collector in issue_stream.collectors:
+                    self.assertLessEqual(len(collector.items), 2)
+
+    def test_odt_parser_iter_articles(self):
+        records = list(OdtParser(self.odt_path,
+                                 backend="lxml").iter_articles())
+        stream_records = list(stream.iter_issue_articles(self.odt_path))
+
+        self.assertEqual(records, stream_records)
+
+    def test_full_text_renderer(self):
+        section = stream.etree.fromstring(
+            '<text:section xmlns:text="{text}"><text:h>Head<text:span>'
+            'er</text:span></text:h><text:p>One<text:note '
+            'text:note-class="footnote"><text:note-citation>1'
+            '</text:note-citation><text:note-body><text:p>Note</text:p>'
+            '</text:note-body></text:note></text:p><text:list>'
+            '<text:list-item><text:p>Item</text:p></text:list-item>'
+            '</text:list></text:section>'.format(
+                text=NAMESPACES["text"]))
+
+        self.assertEqual(stream.render_full_text(section),
+                         "Head er One (Note) \n- Item\n")
+
+
+class TestNestedSections(IssueTestCase):
+
+    issue_params = dict(articles=3, english_every=2, columns=True)
+
+    def test_articles_are_delimited_in_columns(self):
+        stream_records = list(stream.iter_issue_articles(self.odt_path))
+        self.assertEqual(len(stream_records), 4)
+
+        for backend in ("bs4", "lxml"):
+            with self.subTest(backend=backend):
+                odt_parser = OdtParser(self.odt_path, backend=backend)
+
+                self.assertEqual(len(odt_parser.article_index), 3)
+                self.assertEqual(list(odt_parser.iter_articles()),
+                                 stream_records)
+
+    def test_body_abstracts(self):
+        # Аннотации в теле документа продолжаются до конца статьи
+        for columns in (False, True):
+            odt_path = self.write_issue(
+                f"e{columns:d}.odt", articles=4, english_every=3,
+                abstract_every=2, columns=columns)
+            abstracts = stream.get_issue_fields(
+                odt_path)["article_abstracts_list"]
+
+            for backend in ("bs4", "lxml"):
+                with self.subTest(columns=columns, backend=backend):
+                    self.assertEqual(OdtParser(
+                        odt_path, backend=backend).article_abstracts,
+                        abstracts)
+
+            records = list(stream.iter_issue_articles(odt_path))
+            self.assertEqual([article["article_abstracts"]
+                              for article in records[1:]], abstracts)
+
+            # Аннотация второй статьи не включает текст третьей
+            texts = [article["article_full_texts"]
+                     for article in records[2:4]]
+            texts = [text[text["article_lang"]][:30] for text in texts]
+            self.assertIn(texts[0], abstracts[1]["ru"])
+            self.assertNotIn(texts[1], abstracts[1]["ru"])
+
+    def test_body_abstract_articles_are_released(self):
+        odt_path = self.write_issue("f.odt", articles=4, abstract_every=1)
+        with stream.open_issue(odt_path) as (_, style_index, content_file):
+            issue_stream = stream.IssueStream(content_file,
+                                              stream.article_collectors(),
+                                              style_index)
+
+            for article in issue_stream.iter_articles():
+                for collector in issue_stream.collectors:
+                    self.assertLessEqual(len(collector.items), 2)
+
+    def test_export_records(self):
+        kinds = [kind for kind, _ in export.iter_issue_records(self.odt_path)]
+
+        self.assertEqual(kinds, ["issue"] + ["article"] * 3)
+
+    def test_articles_mismatch_citations(self):
+        # Разделы и списки литературы не распознаны: статьи не выделяются
+        content = IssueBuilder(articles=3).content_xml().replace(
+            'text:name="Статья', 'text:name="Text').replace(
+            'text:style-name="СтатьяСписокЛит', 'text:style-name="L')
+        odt_path = os.path.join(self.tmp_dir.name, "d.odt")
+        with zipfile.ZipFile(odt_path, "w") as odt_file:
+            odt_file.writestr("content.xml", content)
+            odt_file.writestr("styles.xml", IssueBuilder().styles_xml())
+
+        with self.assertRaisesRegex(LayoutError, "цитирований: 3"):
+            list(stream.iter_issue_articles(odt_path))
+
+
+# Вставки в текст узлов: пробелы, знаки и переводы строк
+NOISE = ["  ", " .", " ,", "№", "№5", "·", "\n", "\t", "\xa0",
+         "<text:line-break/>", "<text:line-break/>.", " <text:line-break/> ",
+         "№<text:line-break/>", "<text:span>x</text:span>"]
+TEXT_REGEX = re.compile(r">([^<&]*)<")
+
+
+def noisy_content(content, seed) -> str:
+    """
+    Returns content.xml with noise inserted into texts of the body
+    """
+
+    rnd = random.Random(seed)
+
+    def insert_noise(match):
+        text = match.group(1)
+        cuts = sorted(rnd.randint(0, len(text))
+                      for _ in range(rnd.randint(0, 2)))
+        parts = []
+        start = 0
+        for cut in cuts:
+            parts += [text[start:cut], rnd.choice(NOISE)]
+            start = cut
+
+        return ">" + "".join(parts) + text[start:] + "<"
+
+    body = content.index("<office:body>")
+
+    return content[:body] + TEXT_REGEX.sub(insert_noise, content[body:])
+
+
+class TestNodeNormalization(unittest.TestCase):
+
+    def test_trees_match_normalized_document(self):
+        # Прежде весь content.xml нормализовался до разбора
+        content = IssueBuilder(articles=2, english_every=2).content_xml()
+
+        for seed in range(10):
+            text = noisy_content(content, seed)
+            cleared_text = normalize_text(text)
+
+            self.assertEqual(
+                stream.etree.tostring(
+                    stream.parse_content(io.BytesIO(text.encode()))),
+                stream.etree.tostring(
+                    stream.etree.fromstring(cleared_text.encode())))
+
+            soup = bs4.BeautifulSoup(text, "lxml-xml")
+            normalize_soup_text(soup)
+            self.assertEqual(
+                str(soup), str(bs4.BeautifulSoup(cleared_text, "lxml-xml")))
+
+    def test_line_breaks_are_removed(self):
+        paragraph = stream.parse_content(io.BytesIO(
+            '<text:p xmlns:text="{text}">a <text:line-break/>, b'
+            '<text:span>№</text:span>·<text:line-break/></text:p>'.format(
+                text=NAMESPACES["text"]).encode()))
+
+        self.assertEqual(len(paragraph), 1)
+        self.assertEqual(stream.element_text(paragraph), "a , b№ X ")
+
+
+if __name__ == '__main__':
+    unittest.main()
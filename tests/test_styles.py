@@ -0,0 +1,33 @@
+import unittest
+
+from odtparser.styles import StyleIndex
+
+
+class TestStyleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.style_index = StyleIndex()
+        self.style_index.add_style("Emphasis", None,
+                                   {"fo:font-style": "italic"})
+        self.style_index.add_style("T1", "Emphasis",
+                                   {"fo:font-weight": "bold"})
+        self.style_index.add_style("T2", None, {"fo:font-style": "normal"})
+        self.style_index.add_style("P1", "СтатьяРубрикаРус", {})
+
+    def test_resolve_automatic_style(self):
+        parents = ("СтатьяРубрикаРус", "СтатьяРубрикаАнгл")
+
+        self.assertEqual(self.style_index.resolve("P1", parents),
+                         "СтатьяРубрикаРус")
+        self.assertEqual(self.style_index.resolve("T1", parents), "T1")
+        self.assertEqual(self.style_index.resolve("P404", parents), "P404")
+
+    def test_effective_text_properties(self):
+        self.assertTrue(self.style_index.is_italic("T1"))
+        self.assertTrue(self.style_index.is_bold("T1"))
+        self.assertFalse(self.style_index.is_italic("T2"))
+        self.assertFalse(self.style_index.is_italic("P404"))
+
+
+if __name__ == '__main__':
+    unittest.main()